@@ -0,0 +1,6 @@
+"""Performance benchmarks of the coefficients for `asv <https://asv.readthedocs.io>`_.
+
+Every ``time_*`` method is timed and every ``peakmem_*`` method reports the peak
+memory of the process, for each combination of the parameters of its class.
+Combinations above the size limits of :mod:`benchmarks.common` are skipped.
+"""
@@ -0,0 +1,80 @@
+"""Benchmarks of :class:`irrCAC.raw.CAC`."""
+
+from irrCAC.raw import CAC
+
+from .common import MAX_RATINGS, MAX_SCANS, make_ratings, skip_if
+
+
+class RawCAC:
+    """The coefficients of raw ratings for subjects, raters, categories and
+    missing rates."""
+
+    params = (
+        [10**2, 10**4, 10**6, 10**7],
+        [2, 10, 1000],
+        [2, 10, 100, 10**4],
+        [0.0, 0.3],
+    )
+    param_names = ["subjects", "raters", "categories", "missing"]
+    timeout = 600
+
+    def setup(self, subjects, raters, categories, missing):
+        skip_if(subjects * raters > MAX_RATINGS)
+        skip_if(subjects * raters * categories > MAX_SCANS)
+        self.ratings = make_ratings(subjects, raters, categories, missing)
+
+    def run(self, method):
+        return getattr(CAC(self.ratings), method)()
+
+    def time_init(self, *params):
+        CAC(self.ratings)
+
+    def time_bp(self, *params):
+        self.run("bp")
+
+    def time_fleiss(self, *params):
+        self.run("fleiss")
+
+    def time_gwet(self, *params):
+        self.run("gwet")
+
+    def time_krippendorff(self, *params):
+        self.run("krippendorff")
+
+    def peakmem_gwet(self, *params):
+        self.run("gwet")
+
+
+class RawConger:
+    """Conger's kappa, whose variance scans the ratings for every pair of
+    categories."""
+
+    params = RawCAC.params
+    param_names = RawCAC.param_names
+    timeout = 600
+
+    def setup(self, subjects, raters, categories, missing):
+        skip_if(subjects * raters * categories**2 > MAX_SCANS)
+        self.ratings = make_ratings(subjects, raters, categories, missing)
+
+    def time_conger(self, *params):
+        CAC(self.ratings).conger()
+
+    def peakmem_conger(self, *params):
+        CAC(self.ratings).conger()
+
+
+class RawCACWeighted:
+    """The weighted coefficients of raw ratings for the number of categories."""
+
+    params = ([10**4], [10], [2, 10, 100], ["quadratic"])
+    param_names = ["subjects", "raters", "categories", "weights"]
+
+    def setup(self, subjects, raters, categories, weights):
+        self.ratings = make_ratings(subjects, raters, categories)
+
+    def time_gwet(self, subjects, raters, categories, weights):
+        CAC(self.ratings, weights=weights).gwet()
+
+    def time_fleiss(self, subjects, raters, categories, weights):
+        CAC(self.ratings, weights=weights).fleiss()
@@ -0,0 +1,78 @@
+"""Benchmarks of :class:`irrCAC.table.CAC`."""
+
+import numpy as np
+from scipy import sparse
+
+from irrCAC.table import CAC
+
+from .common import MAX_CELLS, make_pairs, make_table, skip_if
+
+
+class TableCAC:
+    """The coefficients of a contingency table for subjects, categories and
+    the dense or sparse layout of the table."""
+
+    params = (
+        [10**2, 10**4, 10**7],
+        [2, 10, 100, 1000, 10**4],
+        ["dense", "sparse"],
+    )
+    param_names = ["subjects", "categories", "layout"]
+    timeout = 300
+
+    def setup(self, subjects, categories, layout):
+        skip_if(layout == "dense" and categories**2 > MAX_CELLS)
+        counts = make_table(subjects, categories)
+        if layout == "dense":
+            self.table = counts.reshape(categories, categories)
+        else:
+            cells = np.flatnonzero(counts)
+            rows, cols = np.divmod(cells, categories)
+            self.table = sparse.coo_array(
+                (counts[cells], (rows, cols)), shape=(categories, categories)
+            )
+
+    def run(self, method):
+        return getattr(CAC(self.table), method)()
+
+    def time_init(self, *params):
+        CAC(self.table)
+
+    def time_bp(self, *params):
+        self.run("bp")
+
+    def time_cohen(self, *params):
+        self.run("cohen")
+
+    def time_gwet(self, *params):
+        self.run("gwet")
+
+    def time_krippendorff(self, *params):
+        self.run("krippendorff")
+
+    def time_pa2(self, *params):
+        self.run("pa2")
+
+    def time_scott(self, *params):
+        self.run("scott")
+
+    def peakmem_gwet(self, *params):
+        self.run("gwet")
+
+
+class TableFromPairs:
+    """Counting the contingency table from the paired ratings of two raters."""
+
+    params = ([10**4, 10**6, 10**7], [2, 100, 10**4])
+    param_names = ["subjects", "categories"]
+    timeout = 300
+
+    def setup(self, subjects, categories):
+        skip_if(categories**2 > MAX_CELLS)
+        self.rater1, self.rater2 = make_pairs(subjects, categories)
+
+    def time_from_pairs(self, subjects, categories):
+        CAC.from_pairs(self.rater1, self.rater2)
+
+    def peakmem_from_pairs(self, subjects, categories):
+        CAC.from_pairs(self.rater1, self.rater2)
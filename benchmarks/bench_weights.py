@@ -0,0 +1,20 @@
+"""Benchmarks of :class:`irrCAC.weights.Weights`."""
+
+from irrCAC.weights import Weights
+
+
+class WeightsSchemes:
+    """Every predefined weights scheme for the number of categories."""
+
+    params = (list(Weights.schemes()), [2, 10, 100, 1000, 10**4])
+    param_names = ["scheme", "categories"]
+    timeout = 300
+
+    def setup(self, scheme, categories):
+        self.categories = list(range(1, categories + 1))
+
+    def time_weights(self, scheme, categories):
+        Weights(self.categories)[scheme]
+
+    def peakmem_weights(self, scheme, categories):
+        Weights(self.categories)[scheme]
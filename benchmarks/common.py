@@ -0,0 +1,54 @@
+"""Synthetic inputs and size limits shared by the benchmarks."""
+
+import numpy as np
+import pandas as pd
+
+# The largest number of ratings (subjects x raters) of a raw data frame.
+MAX_RATINGS = 2 * 10**7
+# The largest number of values compared by the category scans of raw.CAC.
+MAX_SCANS = 2 * 10**9
+# The largest number of cells of a dense contingency table.
+MAX_CELLS = 10**7
+
+
+def skip_if(condition):
+    """Skip the current parameter combination, the way asv expects."""
+    if condition:
+        raise NotImplementedError("The combination is above the size limits.")
+
+
+def make_pairs(subjects, categories, agreement=0.6, seed=0):
+    """The ratings of two raters as integer codes, which agree on a fraction
+    ``agreement`` of the subjects and are uniform otherwise."""
+    rng = np.random.default_rng(seed)
+    rater1 = rng.integers(0, categories, size=subjects)
+    rater2 = np.where(
+        rng.random(subjects) < agreement,
+        rater1,
+        rng.integers(0, categories, size=subjects),
+    )
+    return rater1, rater2
+
+
+def make_table(subjects, categories, seed=0):
+    """The flat cell counts of the contingency table of :func:`make_pairs`."""
+    rater1, rater2 = make_pairs(subjects, categories, seed=seed)
+    return np.bincount(rater1 * categories + rater2, minlength=categories**2)
+
+
+def make_ratings(subjects, raters, categories, missing=0.0, seed=0):
+    """A data frame of raw ratings with a fraction ``missing`` of NaN.
+
+    Each rater copies a common rating of the subject with probability 0.6 and
+    rates uniformly otherwise.
+    """
+    rng = np.random.default_rng(seed)
+    common = rng.integers(1, categories + 1, size=(subjects, 1))
+    ratings = np.where(
+        rng.random((subjects, raters)) < 0.6,
+        common,
+        rng.integers(1, categories + 1, size=(subjects, raters)),
+    ).astype(np.float64)
+    if missing > 0:
+        ratings[rng.random((subjects, raters)) < missing] = np.nan
+    return pd.DataFrame(ratings, columns=[f"Rater{j + 1}" for j in range(raters)])
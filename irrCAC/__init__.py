@@ -20,3 +20,27 @@ measurement. Some options are
 
 and many others.
 """
+
+import importlib
+
+__all__ = [
+    "benchmark",
+    "convert",
+    "datasets",
+    "dist",
+    "profiling",
+    "raw",
+    "table",
+    "weights",
+]
+
+
+def __getattr__(name):
+    """Import the submodules on their first use, e.g., ``irrCAC.raw.CAC``."""
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,7 @@
 """ The "Cumulative Probability" approach to Benchmarking.
 """
 
-from scipy.stats import norm
+import numpy as np
 
 
 class Benchmark:
@@ -59,6 +59,54 @@ class Benchmark:
     'CumProb': [0.67511, 0.99308, 1.0]}
     """
 
+    # The predefined benchmark scales, by the name of their method. The bounds and
+    # the interpretations are tuples, so that the results cannot change them.
+    _scales = {
+        "altman": dict(
+            lb=(0.8, 0.6, 0.4, 0.2, -1.0),
+            ub=(1.0, 0.8, 0.6, 0.4, 0.2),
+            interp=("Very Good", "Good", "Moderate", "Fair", "Poor"),
+            scale_name="Altman",
+        ),
+        "cicchetti_sparrow": dict(
+            lb=(0.75, 0.6, 0.4, 0.0),
+            ub=(1.0, 0.75, 0.6, 0.4),
+            interp=("Excellent", "Good", "Fair", "Poor"),
+            scale_name="Cicchetti",
+        ),
+        "fleiss": dict(
+            lb=(0.75, 0.4, -1.0),
+            ub=(1.0, 0.75, 0.4),
+            interp=("Excellent", "Intermediate to Good", "Poor"),
+            scale_name="Fleiss",
+        ),
+        "landis_koch": dict(
+            lb=(0.8, 0.6, 0.4, 0.2, 0.0, -1.0),
+            ub=(1.0, 0.8, 0.6, 0.4, 0.2, 0.0),
+            interp=(
+                "Almost Perfect",
+                "Substantial",
+                "Moderate",
+                "Fair",
+                "Slight",
+                "Poor",
+            ),
+            scale_name="Landis-Koch",
+        ),
+        "regier": dict(
+            lb=(0.8, 0.6, 0.4, 0.2, 0.0),
+            ub=(1.0, 0.8, 0.6, 0.4, 0.2),
+            interp=(
+                "Excellent",
+                "Very Good",
+                "Good",
+                "Questionable",
+                "Unacceptable",
+            ),
+            scale_name="Regier",
+        ),
+    }
+
     def __init__(self, coeff: float, se: float):
         assert coeff <= 1, ValueError("`coeff` value cannot exceed 1.")
         self.coeff = coeff
@@ -114,6 +162,79 @@ class Benchmark:
             'CumProb': [0.18168, 0.67511, 0.96356, 0.99912, 1.0]}``
 
         """
+        self._check_scale(bench)
+        n = len(bench["lb"])
+        # The CDF at the lower bounds, the upper bounds and the truncation
+        # bounds -1 and 1.
+        cdf = self._cdf(np.concatenate([bench["lb"], bench["ub"], [-1.0, 1.0]]))
+        return self._result(bench, cdf[..., :n], cdf[..., n:-2], cdf[..., -2:])
+
+    def interpret_all(self, scales=None):
+        """Interpret the agreement coefficient on several benchmark scales.
+
+        The CDF is evaluated once at the union of the bounds of all the scales,
+        and the cumulative probabilities of every scale are derived from it.
+        The results are the same as those of :meth:`interpret` and of the
+        methods of the predefined scales.
+
+        .. versionadded:: 0.5.0
+
+        Parameters
+        ----------
+        scales : list or None, default None
+            The scales, either as the name of the method of a predefined
+            scale, e.g., "altman", or as a dictionary like in
+            :meth:`interpret`. If None, all the predefined scales are used.
+
+        Returns
+        -------
+        dict
+            The result of each scale, by its scale name.
+
+        Raises
+        ------
+        ValueError
+            If a scale is not predefined or two scales have the same name.
+
+        Examples
+        --------
+        >>> from irrCAC.benchmark import Benchmark
+        >>> results = Benchmark(coeff=0.67, se=0.15).interpret_all()
+        >>> list(results)
+        ['Altman', 'Cicchetti', 'Fleiss', 'Landis-Koch', 'Regier']
+        >>> results["Fleiss"]["CumProb"]
+        [0.28699, 0.96356, 1.0]
+        """
+        if scales is None:
+            scales = list(self._scales)
+        benches = []
+        for bench in scales:
+            if isinstance(bench, str):
+                if bench not in self._scales:
+                    raise ValueError(f"The predefined scales are {list(self._scales)}.")
+                bench = self._scales[bench]
+            self._check_scale(bench)
+            if any(b["scale_name"] == bench["scale_name"] for b in benches):
+                raise ValueError(
+                    f'The scale name "{bench["scale_name"]}" is used more than once.'
+                )
+            benches.append(bench)
+        bounds = sorted(
+            {-1.0, 1.0}.union(*[list(b["lb"]) + list(b["ub"]) for b in benches])
+        )
+        position = {bound: i for i, bound in enumerate(bounds)}
+        cdf = self._cdf(bounds)
+        truncation = cdf[..., [position[-1.0], position[1.0]]]
+        results = {}
+        for bench in benches:
+            lower = cdf[..., [position[bound] for bound in bench["lb"]]]
+            upper = cdf[..., [position[bound] for bound in bench["ub"]]]
+            results[bench["scale_name"]] = self._result(bench, lower, upper, truncation)
+        return results
+
+    @staticmethod
+    def _check_scale(bench):
+        """Raise a ValueError if a key of the scale dictionary is missing."""
         for key in ("lb", "ub", "interp", "scale_name"):
             if key not in bench:
                 raise ValueError(
@@ -121,26 +242,29 @@ class Benchmark:
                     '`{"lb": list, "ub": list, "interp": list, '
                     '"scale_name": str}`.'
                 )
-        n = len(bench["lb"])
-        cmprob = []
-        trancate_fact = norm.cdf((self.coeff + 1) / self.se) - norm.cdf(
-            (self.coeff - 1) / self.se
-        )
-        for i in range(n):
-            value = (
-                norm.cdf((self.coeff - bench["lb"][i]) / self.se)
-                - norm.cdf((self.coeff - bench["ub"][i]) / self.se)
-            ) / trancate_fact
-            if i == 0:
-                cmprob.append(value)
-            else:
-                cmprob.append(cmprob[i - 1] + value)
-        cmprob = [round(prob, 5) for prob in cmprob]
 
+    def _cdf(self, bounds):
+        """The standard normal CDF of (coeff - bound) / se for each bound."""
+        from scipy import special
+
+        coeff = np.expand_dims(self.coeff, -1)
+        se = np.expand_dims(self.se, -1)
+        return special.ndtr((coeff - np.asarray(bounds, dtype=np.float64)) / se)
+
+    def _cumprob(self, lower, upper, truncation):
+        """The cumulative membership probabilities from the CDF at the bounds.
+
+        The CDF at -1 and 1 in ``truncation`` truncates the distribution of the
+        coefficient to its range.
+        """
+        trancate_fact = truncation[..., [0]] - truncation[..., [1]]
+        return np.round(np.cumsum((lower - upper) / trancate_fact, axis=-1), 5)
+
+    def _result(self, bench, lower, upper, truncation):
         return {
             "scale": list(zip(bench["lb"], bench["ub"])),
-            f'{bench["scale_name"]}': bench["interp"],
-            "CumProb": cmprob,
+            f'{bench["scale_name"]}': list(bench["interp"]),
+            "CumProb": self._cumprob(lower, upper, truncation).tolist(),
         }
 
     def altman(self):
@@ -161,13 +285,7 @@ class Benchmark:
         | Poor           | -1.0 - 0.2 |
         +----------------+------------+
         """
-        scale = dict(
-            lb=[0.8, 0.6, 0.4, 0.2, -1.0],
-            ub=[1.0, 0.8, 0.6, 0.4, 0.2],
-            interp=["Very Good", "Good", "Moderate", "Fair", "Poor"],
-            scale_name="Altman",
-        )
-        return self.interpret(scale)
+        return self.interpret(self._scales["altman"])
 
     def cicchetti_sparrow(self):
         """ Interpret the level of agreement using the Cicchetti and Sparrow \
@@ -185,13 +303,7 @@ class Benchmark:
         | Poor           | 0.0  - 0.4  |
         +----------------+-------------+
         """
-        scale = dict(
-            lb=[0.75, 0.6, 0.4, 0.0],
-            ub=[1.0, 0.75, 0.6, 0.4],
-            interp=["Excellent", "Good", "Fair", "Poor"],
-            scale_name="Cicchetti",
-        )
-        return self.interpret(scale)
+        return self.interpret(self._scales["cicchetti_sparrow"])
 
     def fleiss(self):
         """Interpret the level of agreement using the Fleiss :cite:p:`Fle71` \
@@ -207,13 +319,7 @@ class Benchmark:
         | Poor           | 0.0  - 0.4  |
         +----------------+-------------+
         """
-        scale = dict(
-            lb=[0.75, 0.4, -1.0],
-            ub=[1.0, 0.75, 0.4],
-            interp=["Excellent", "Intermediate to Good", "Poor"],
-            scale_name="Fleiss",
-        )
-        return self.interpret(scale)
+        return self.interpret(self._scales["fleiss"])
 
     def landis_koch(self):
         """Interpret the level of agreement using the Landis and Koch :cite:p:`LK77` \
@@ -235,20 +341,7 @@ class Benchmark:
         | Poor           | -1.0 - 0.0 |
         +----------------+------------+
         """
-        scale = dict(
-            lb=[0.8, 0.6, 0.4, 0.2, 0.0, -1.0],
-            ub=[1.0, 0.8, 0.6, 0.4, 0.2, 0.0],
-            interp=[
-                "Almost Perfect",
-                "Substantial",
-                "Moderate",
-                "Fair",
-                "Slight",
-                "Poor",
-            ],
-            scale_name="Landis-Koch",
-        )
-        return self.interpret(scale)
+        return self.interpret(self._scales["landis_koch"])
 
     def regier(self):
         """Interpret the level of agreement using the Regier et al. :cite:p:`RNC+13` \
@@ -268,16 +361,154 @@ class Benchmark:
         | Unacceptable   | 0.0 - 0.2  |
         +----------------+------------+
         """
-        scale = dict(
-            lb=[0.8, 0.6, 0.4, 0.2, 0.0],
-            ub=[1.0, 0.8, 0.6, 0.4, 0.2],
-            interp=[
-                "Excellent",
-                "Very Good",
-                "Good",
-                "Questionable",
-                "Unacceptable",
-            ],
-            scale_name="Regier",
+        return self.interpret(self._scales["regier"])
+
+
+class BatchBenchmark(Benchmark):
+    """Benchmark scale membership probabilities for arrays of coefficients.
+
+    The cumulative interval membership probabilities of :class:`Benchmark`
+    computed at once for many coefficients, such as the per batch kappas of a
+    stream of ratings. The standard normal CDF is evaluated in one vectorized
+    call per scale, at all the bounds of the scale for all the coefficients.
+
+    The "CumProb" of the results is an array with one row per coefficient. The
+    results also have the key "interpretation", with the first interval of
+    each coefficient whose cumulative probability reaches ``threshold``, or
+    None if there is no such interval.
+
+    .. versionadded:: 0.5.0
+
+    Parameters
+    ----------
+    coeff : array-like
+        The estimated values of the agreement coefficients.
+    se : array-like
+        The standard errors of the coefficients, broadcastable with ``coeff``.
+    threshold : float, default 0.95
+        The cumulative probability an interval should reach to be selected as
+        the interpretation of a coefficient.
+
+    Examples
+    --------
+    >>> from irrCAC.benchmark import BatchBenchmark
+    >>> benchmark = BatchBenchmark(coeff=[0.67, 0.9], se=[0.15, 0.02])
+    >>> result = benchmark.altman()
+    >>> result["CumProb"]
+    array([[0.18168, 0.67511, 0.96356, 0.99912, 1.     ],
+           [1.     , 1.     , 1.     , 1.     , 1.     ]])
+    >>> result["interpretation"]
+    array(['Moderate', 'Very Good'], dtype=object)
+    """
+
+    def __init__(self, coeff, se, threshold=0.95):
+        coeff, se = np.broadcast_arrays(
+            np.asarray(coeff, dtype=np.float64), np.asarray(se, dtype=np.float64)
+        )
+        if np.any(coeff > 1):
+            raise ValueError("`coeff` values cannot exceed 1.")
+        if not 0 < threshold <= 1:
+            raise ValueError("`threshold` should be in range (0, 1].")
+        self.coeff = coeff
+        self.se = se
+        self.threshold = threshold
+
+    def __str__(self):
+        return f"<BatchBenchmark scales Coefficients: {self.coeff.size}>"
+
+    def _result(self, bench, lower, upper, truncation):
+        cmprob = self._cumprob(lower, upper, truncation)
+        reached = cmprob >= self.threshold
+        interp = np.append(np.asarray(bench["interp"], dtype=object), None)
+        selected = np.where(
+            reached.any(axis=-1), reached.argmax(axis=-1), len(interp) - 1
         )
-        return self.interpret(scale)
+
+        return {
+            "scale": list(zip(bench["lb"], bench["ub"])),
+            f'{bench["scale_name"]}': list(bench["interp"]),
+            "CumProb": cmprob,
+            "interpretation": interp[selected],
+        }
+
+
+def _count_le(sorted_values, bounds):
+    """The number of values less than or equal to each bound, for each row.
+
+    Each value is replaced by the number of distinct bounds below it, which
+    keeps its order against every bound, and the rows are offset so that the
+    raveled keys are sorted. One :func:`numpy.searchsorted` then counts the
+    values of all the rows at once. Returns an array with the shape of the
+    rows and a last axis for the bounds.
+    """
+    m = sorted_values.shape[-1]
+    rows = sorted_values.reshape(-1, m)
+    bounds = np.asarray(bounds, dtype=np.float64)
+    distinct = np.unique(bounds)
+    row_index = np.arange(rows.shape[0]).reshape(-1, 1)
+    offsets = row_index * (distinct.size + 1)
+    keys = np.searchsorted(distinct, rows) + offsets
+    targets = np.searchsorted(distinct, bounds) + offsets
+    counts = np.searchsorted(keys.ravel(), targets, side="right") - row_index * m
+    return counts.reshape(sorted_values.shape[:-1] + (bounds.size,))
+
+
+class DrawsBenchmark(BatchBenchmark):
+    """Benchmark scale membership probabilities from resampled coefficients.
+
+    Instead of the Normal approximation of :class:`Benchmark`, the interval
+    membership probabilities are the fractions of resampled values of each
+    coefficient, e.g., bootstrap or posterior draws, that fall into each
+    interval :math:`(a, b]`. The intervals which start at -1 are closed,
+    :math:`[-1, b]`, so that draws at the lower end of the range of the
+    coefficients are counted. The draws are sorted once, and the fractions for
+    all the coefficients and all the bounds of the scales come from one
+    vectorized binary search of the sorted draws.
+
+    .. versionadded:: 0.5.0
+
+    Parameters
+    ----------
+    draws : array-like
+        The draws of the coefficients, with the draws of each coefficient
+        along the last axis.
+    threshold : float, default 0.95
+        The cumulative probability an interval should reach to be selected as
+        the interpretation of a coefficient.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from irrCAC.benchmark import DrawsBenchmark
+    >>> rng = np.random.default_rng(0)
+    >>> draws = np.clip(rng.normal([[0.67], [0.9]], 0.05, (2, 10000)), -1, 1)
+    >>> DrawsBenchmark(draws).altman()["interpretation"]
+    array(['Moderate', 'Very Good'], dtype=object)
+    """
+
+    def __init__(self, draws, threshold=0.95):
+        draws = np.asarray(draws, dtype=np.float64)
+        if draws.ndim == 0 or draws.shape[-1] < 2:
+            raise ValueError("Please provide at least two draws per coefficient.")
+        draws = np.sort(draws, axis=-1)
+        if np.any(draws[..., -1] > 1):
+            raise ValueError("`draws` values cannot exceed 1.")
+        if not 0 < threshold <= 1:
+            raise ValueError("`threshold` should be in range (0, 1].")
+        self.draws = draws
+        self.coeff = draws.mean(axis=-1)
+        self.se = draws.std(axis=-1, ddof=1)
+        self.threshold = threshold
+
+    def __str__(self):
+        return (
+            f"<DrawsBenchmark scales Coefficients: {self.coeff.size}, "
+            f"Draws: {self.draws.shape[-1]}>"
+        )
+
+    def _cdf(self, bounds):
+        """The fraction of the draws above each bound, or at least -1 for -1."""
+        m = self.draws.shape[-1]
+        bounds = np.asarray(bounds, dtype=np.float64)
+        bounds = np.where(bounds == -1.0, np.nextafter(-1.0, -np.inf), bounds)
+        return (m - _count_le(self.draws, bounds)) / m
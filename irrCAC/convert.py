@@ -0,0 +1,287 @@
+"""Conversions between the formats of the ratings.
+
+The functions in this module convert the "raw" ratings, i.e., tables where each
+row represents a subject and each column a rater, to the distribution of the
+raters by subject and category, to the marginal counts of each rater and to the
+contingency table of two raters. The ratings are integer-encoded once per
+column with :func:`encode_ratings` and counted with a single
+:func:`numpy.bincount`, instead of comparing the whole table with each
+category.
+
+.. versionadded:: 0.5.0
+
+Examples
+--------
+>>> from irrCAC.convert import raw_to_dist
+>>> from irrCAC.datasets import raw_g1g2
+>>> print(raw_to_dist(raw_g1g2()).head())  # doctest: +NORMALIZE_WHITESPACE
+             a  b  c  d  e
+Group Units
+G2    1      3  0  0  0  0
+G1    2      0  3  1  0  0
+G2    3      0  0  4  0  0
+G1    4      0  0  4  0  0
+      5      0  4  0  0  0
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _sorted_categories(uniques):
+    """The sorted categories of the distinct values of each rater.
+
+    The distinct values are raveled into one array, so the values of
+    different raters are compared after the same type promotion as in a
+    single rater. Empty strings are missing ratings.
+    """
+    uniques = [np.asarray(values) for values in uniques]
+    if not uniques:
+        return []
+    values = pd.unique(np.concatenate(uniques))
+    return sorted(values[~_is_missing(values)].tolist())
+
+
+def _is_missing(values):
+    """Whether each value is a missing rating: NaN, None or an empty string."""
+    return pd.isna(values) | pd.Index(values).isin([""])
+
+
+def encode_ratings(ratings, categories=None, strict=True):
+    """Encode the ratings of each rater as the positions of their categories.
+
+    All the modules of the package encode the ratings with this function.
+    Missing ratings (NaN, None or an empty string) get the position q.
+
+    Parameters
+    ----------
+    ratings : DataFrame or sequence of array-like
+        The ratings of each rater, either the columns of a data frame where
+        each row represents one subject, or aligned arrays.
+    categories : list, Index or None, default None
+        The list of all possible categories. If None, the sorted categories
+        reported by the raters are used.
+    strict : bool, default True
+        If True, ratings which are not in ``categories`` raise an error.
+        Otherwise they get the position q + 1.
+
+    Returns
+    -------
+    pandas.Index
+        The categories.
+    ndarray
+        The :math:`r \\times n` positions of the ratings, of the smallest
+        unsigned integer type that holds their largest position.
+
+    Raises
+    ------
+    ValueError
+        If the raters have a different number of ratings, the categories are
+        not unique, or ``strict`` is True and some ratings are not in
+        ``categories``.
+
+    Examples
+    --------
+    >>> from irrCAC.convert import encode_ratings
+    >>> index, codes = encode_ratings([["b", "a", None], ["b", "", "c"]])
+    >>> index.tolist()
+    ['a', 'b', 'c']
+    >>> codes.tolist()
+    [[1, 0, 3], [1, 3, 2]]
+    """
+    if isinstance(ratings, pd.DataFrame):
+        columns = [column.to_numpy() for _, column in ratings.items()]
+    else:
+        # Going through a Series keeps the missing values of mixed lists.
+        columns = [pd.Series(column).to_numpy() for column in ratings]
+    n = len(columns[0]) if columns else 0
+    if any(len(column) != n for column in columns):
+        raise ValueError("The raters should have the same number of ratings.")
+    if categories is None:
+        # Each column is factorized in turn and only its codes of the smallest
+        # unsigned type are kept, with the missing values (code -1) at the end.
+        factorized = []
+        for column in columns:
+            column_codes, uniques = pd.factorize(column)
+            column_codes[column_codes < 0] = len(uniques)
+            dtype = np.min_scalar_type(len(uniques))
+            factorized.append((column_codes.astype(dtype), uniques))
+        index = pd.Index(_sorted_categories(uniques for _, uniques in factorized))
+    else:
+        factorized = None
+        if not isinstance(categories, pd.Index):
+            categories = pd.Index(categories)
+        index = categories
+        if not index.is_unique:
+            raise ValueError("The categories should be unique.")
+    q = len(index)
+    # Ratings which are not in the categories are at q + 1 when not strict.
+    other = q if strict else q + 1
+    codes = np.empty((len(columns), n), dtype=np.min_scalar_type(other))
+    for j, column in enumerate(columns):
+        if factorized is None:
+            # The index of the categories keeps its lookup table between calls.
+            values = column
+        else:
+            column_codes, values = factorized[j]
+            factorized[j] = None
+        positions = index.get_indexer(values)
+        unknown = positions < 0
+        missing = _is_missing(values[unknown])
+        if strict and not np.all(missing):
+            raise ValueError("There are ratings which are not in `categories`.")
+        positions[unknown] = np.where(missing, q, other)
+        if factorized is None:
+            codes[j] = positions
+        else:
+            # The missing values take the appended position q.
+            np.take(
+                np.append(positions, q).astype(codes.dtype), column_codes, out=codes[j]
+            )
+    return index, codes
+
+
+def raw_to_dist(ratings, categories=None):
+    """The number of raters who classified each subject into each category.
+
+    Parameters
+    ----------
+    ratings : DataFrame
+        A data frame of ratings where each column represents one rater and
+        each row one subject.
+    categories : list or None, default None
+        The list of all possible categories. If None, the sorted categories
+        reported by the raters are used.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The :math:`n \\times q` counts, with the index of the ratings and one
+        column for each category. It is the input of :class:`irrCAC.dist.CAC`.
+
+    Raises
+    ------
+    ValueError
+        If some ratings are not in ``categories``.
+    """
+    index, codes = encode_ratings(ratings, categories)
+    q = len(index)
+    cells = codes + np.arange(len(ratings)) * (q + 1)
+    counts = np.bincount(cells.ravel(), minlength=len(ratings) * (q + 1))
+    counts = counts.reshape(len(ratings), q + 1)[:, :q]
+    return pd.DataFrame(counts, index=ratings.index, columns=index)
+
+
+def raw_to_raters(ratings, categories=None):
+    """The number of subjects each rater classified into each category.
+
+    Parameters
+    ----------
+    ratings : DataFrame
+        A data frame of ratings where each column represents one rater and
+        each row one subject.
+    categories : list or None, default None
+        The list of all possible categories. If None, the sorted categories
+        reported by the raters are used.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The :math:`r \\times q` counts, with one row for each rater and one
+        column for each category.
+
+    Raises
+    ------
+    ValueError
+        If some ratings are not in ``categories``.
+    """
+    index, codes = encode_ratings(ratings, categories)
+    q = len(index)
+    cells = codes + np.arange(ratings.shape[1]).reshape(-1, 1) * (q + 1)
+    counts = np.bincount(cells.ravel(), minlength=ratings.shape[1] * (q + 1))
+    counts = counts.reshape(ratings.shape[1], q + 1)[:, :q]
+    return pd.DataFrame(counts, index=ratings.columns, columns=index)
+
+
+def pairs_to_table(rater1, rater2, categories=None):
+    """The contingency table of the paired ratings of two raters.
+
+    Pairs where any of the two ratings is missing (NaN, None or an empty
+    string) are dropped.
+
+    Parameters
+    ----------
+    rater1 : array-like
+        The ratings of the first rater. They are the rows of the table.
+    rater2 : array-like
+        The ratings of the second rater, aligned with ``rater1``. They are the
+        columns of the table.
+    categories : list or None, default None
+        The list of all possible categories. If None, the sorted categories
+        of the complete pairs are used.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The :math:`q \\times q` counts. It is the input of
+        :class:`irrCAC.table.CAC`.
+
+    Raises
+    ------
+    ValueError
+        If the ratings have different lengths or some ratings are not in
+        ``categories``.
+    """
+    index, (rows, cols) = encode_ratings([rater1, rater2], categories)
+    q = len(index)
+    # The last row (column) of the table is for the missing ratings.
+    cells = rows.astype(np.int64) * (q + 1) + cols
+    table = np.bincount(cells, minlength=(q + 1) ** 2).reshape(q + 1, q + 1)
+    table = table[:q, :q]
+    if categories is None:
+        # Keep only the categories of the complete pairs.
+        used = (table.sum(axis=0) + table.sum(axis=1)) > 0
+        index, table = index[used], table[np.ix_(used, used)]
+    return pd.DataFrame(table, index=index, columns=index)
+
+
+def dist_by_group(counts, groups, name="Group"):
+    """Index the counts of the subjects by their group.
+
+    The result has the layout of :func:`irrCAC.datasets.dist_g1g2`, where the
+    first level of the index is the group and the second the subject.
+
+    Parameters
+    ----------
+    counts : DataFrame
+        The number of raters who classified each subject into each category,
+        as returned by :func:`raw_to_dist`.
+    groups : array-like or label
+        The group of each subject, or the label of a column of ``counts``
+        which has the groups. The column is removed from the counts.
+    name : str, default "Group"
+        The name of the group level of the index.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The counts with a two-level index of groups and subjects.
+
+    Raises
+    ------
+    ValueError
+        If the number of groups is not the number of subjects.
+    """
+    if pd.api.types.is_hashable(groups) and groups in counts.columns:
+        counts, groups = counts.drop(columns=groups), counts[groups]
+    groups = pd.Series(groups).to_numpy()
+    if groups.shape != (len(counts),):
+        raise ValueError(
+            f"Expected {len(counts)} groups, one for each subject. "
+            f"Given {groups.size}."
+        )
+    units = counts.index.name if counts.index.name is not None else "Units"
+    index = pd.MultiIndex.from_arrays(
+        [groups, counts.index.to_numpy()], names=(name, units)
+    )
+    return counts.set_axis(index, axis=0)
@@ -1,5 +1,6 @@
 """Sample datasets for demonstrating and testing agreement coefficients."""
 
+import numpy as np
 import pandas as pd
 
 
@@ -393,3 +394,217 @@ def distrib_6raters():
         "Other": [0, 3, 1, 6, 0, 0, 2, 0, 0, 6, 0, 0, 0, 0, 1],
     }
     return pd.DataFrame(data, index=units)
+
+
+def _probabilities(p, shape, name):
+    """Validate and normalize category probabilities of the given shape."""
+    p = np.broadcast_to(np.asarray(p, dtype=np.float64), shape)
+    if np.any(p < 0) or np.any(p.sum(axis=-1) <= 0):
+        raise ValueError(f"`{name}` should be non-negative with a positive sum.")
+    return p / p.sum(axis=-1, keepdims=True)
+
+
+def synthetic_codes(
+    subjects,
+    raters,
+    categories,
+    agreement=0.6,
+    prevalence=None,
+    bias=None,
+    missing=0.0,
+    chunk_size=100000,
+    seed=None,
+):
+    """Generate raw ratings with a controlled agreement, in chunks of codes.
+
+    Each subject has a true category drawn from the ``prevalence`` of the
+    categories. Each rater reports the true category with probability
+    ``agreement`` and otherwise rates at random, from the category
+    probabilities of its ``bias``. Each rating is then missing with
+    probability ``missing``. This is the model of the chance agreement of
+    Gwet's AC1 :cite:p:`Gwe08`, where the raters agree either because the
+    subject is easy to score or by chance.
+
+    The ratings are never materialized as a data frame. They are yielded as
+    integer codes of the smallest signed type for the categories, a chunk of
+    subjects at a time, so datasets of :math:`10^8` ratings and more take the
+    memory of one chunk.
+
+    .. versionadded:: 0.5.0
+
+    Parameters
+    ----------
+    subjects : int
+        The number of subjects.
+    raters : int
+        The number of raters.
+    categories : int
+        The number of categories :math:`q`. The codes of the categories are
+        0 to :math:`q - 1`, and the code of a missing rating is -1.
+    agreement : float, default 0.6
+        The probability that a rater reports the true category of a subject.
+    prevalence : array-like or None, default None
+        The :math:`q` probabilities of the true categories. If None, the
+        categories are equally likely.
+    bias : array-like or None, default None
+        The probabilities of the categories when a rater rates at random,
+        either :math:`q` probabilities shared by all the raters or an
+        :math:`r \\times q` matrix with the probabilities of each rater. If
+        None, the raters rate at random with the ``prevalence``.
+    missing : float or array-like, default 0.0
+        The probability that a rating is missing, either for all the raters or
+        for each rater.
+    chunk_size : int, default 100000
+        The number of subjects of each chunk.
+    seed : int, numpy.random.Generator or None, default None
+        The seed of the random numbers. The same seed and ``chunk_size`` give
+        the same ratings.
+
+    Returns
+    -------
+    iterator of numpy.ndarray
+        The codes of the ratings of each chunk of subjects, with one row per
+        subject and one column per rater.
+
+    Raises
+    ------
+    ValueError
+        If a probability is out of range or has the wrong shape.
+
+    Examples
+    --------
+    Count the pairs of ratings of two raters chunk by chunk, without building
+    the raw ratings. With equally likely categories, Cohen's kappa of this
+    model is the square of the ``agreement``.
+
+    >>> from irrCAC.datasets import synthetic_codes
+    >>> from irrCAC.table import Accumulator
+    >>> accumulator = Accumulator(categories=[0, 1, 2])
+    >>> for codes in synthetic_codes(10**6, 2, 3, agreement=0.7, seed=0):
+    ...     _ = accumulator.update(codes[:, 0], codes[:, 1])
+    >>> print(round(accumulator.cohen()["est"]["coefficient_value"], 2))
+    0.49
+    """
+    if not 0 <= agreement <= 1:
+        raise ValueError("`agreement` should be in range [0, 1].")
+    missing = np.broadcast_to(np.asarray(missing, dtype=np.float64), (raters,))
+    if np.any(missing < 0) or np.any(missing >= 1):
+        raise ValueError("`missing` should be in range [0, 1).")
+    if chunk_size < 1:
+        raise ValueError("`chunk_size` should be a positive integer.")
+    prevalence = _probabilities(
+        np.ones(categories) if prevalence is None else prevalence,
+        (categories,),
+        "prevalence",
+    )
+    if bias is None:
+        bias = prevalence
+    bias = np.asarray(bias, dtype=np.float64)
+    bias = _probabilities(bias, bias.shape[:-1] + (categories,), "bias")
+    if bias.ndim == 2 and bias.shape[0] != raters:
+        raise ValueError(f"Expected `bias` with {raters} rows, one for each rater.")
+    # The cumulative probabilities, to draw categories by searchsorted.
+    prevalence_cdf = np.cumsum(prevalence)
+    bias_cdf = np.cumsum(bias, axis=-1)
+    return _synthetic_chunks(
+        subjects,
+        raters,
+        categories,
+        agreement,
+        prevalence_cdf,
+        bias_cdf,
+        missing,
+        chunk_size,
+        seed,
+    )
+
+
+def _synthetic_chunks(
+    subjects,
+    raters,
+    categories,
+    agreement,
+    prevalence_cdf,
+    bias_cdf,
+    missing,
+    chunk_size,
+    seed,
+):
+    # The generator of `synthetic_codes`, apart so that the arguments are
+    # checked on the call rather than on the first chunk.
+    dtype = np.min_scalar_type(-categories)
+    rng = np.random.default_rng(seed)
+    for start in range(0, subjects, chunk_size):
+        size = min(chunk_size, subjects - start)
+        true = np.searchsorted(prevalence_cdf, rng.random(size), side="right")
+        # One uniform number per rating: below `agreement` the rater reports the
+        # true category, otherwise its rescaled value draws a random category.
+        draws = rng.random((size, raters))
+        easy = draws < agreement
+        if agreement < 1:
+            draws -= agreement
+            draws /= 1 - agreement
+        codes = np.empty((size, raters), dtype=dtype)
+        if bias_cdf.ndim == 1:
+            codes[:] = np.searchsorted(bias_cdf, draws, side="right")
+        else:
+            for j in range(raters):
+                codes[:, j] = np.searchsorted(bias_cdf[j], draws[:, j], side="right")
+        # Rounding may leave the last cumulative probability just below 1.
+        np.minimum(codes, categories - 1, out=codes)
+        np.copyto(codes, true.reshape(-1, 1).astype(dtype), where=easy)
+        if np.any(missing > 0):
+            codes[rng.random((size, raters)) < missing] = -1
+        yield codes
+
+
+def synthetic_ratings(subjects, raters, categories, seed=None, **kwargs):
+    """Generate raw ratings with a controlled agreement, as a data frame.
+
+    The ratings of :func:`synthetic_codes` in the layout of
+    :func:`raw_4raters`, for inputs small enough to fit in memory as a data
+    frame.
+
+    .. versionadded:: 0.5.0
+
+    Parameters
+    ----------
+    subjects : int
+        The number of subjects.
+    raters : int
+        The number of raters.
+    categories : int or list
+        The number of categories, labeled 1 to :math:`q`, or the list of the
+        labels of the categories.
+    seed : int, numpy.random.Generator or None, default None
+        The seed of the random numbers.
+    **kwargs
+        Any other parameter of :func:`synthetic_codes`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The data frame has one column for each rater, ``Rater1`` to
+        ``Rater<r>``, and missing ratings are NaN.
+
+    Examples
+    --------
+    >>> from irrCAC.datasets import synthetic_ratings
+    >>> from irrCAC.raw import CAC
+    >>> ratings = synthetic_ratings(1000, 4, ["a", "b", "c"], seed=0)
+    >>> ratings.shape
+    (1000, 4)
+    """
+    if isinstance(categories, (int, np.integer)):
+        labels = np.arange(1, categories + 1, dtype=np.float64)
+    else:
+        labels = np.asarray(categories, dtype=object)
+    codes = np.concatenate(
+        list(synthetic_codes(subjects, raters, len(labels), seed=seed, **kwargs))
+        or [np.empty((0, raters), dtype=np.int8)]
+    )
+    # The missing code -1 takes the appended NaN.
+    values = np.append(labels, np.nan)[codes]
+    units = pd.Index(np.arange(1, subjects + 1), name="Units")
+    columns = [f"Rater{j + 1}" for j in range(raters)]
+    return pd.DataFrame(values, index=units, columns=columns)
@@ -0,0 +1,163 @@
+"""Chance-corrected Agreement Coefficient for "distribution" ratings.
+
+The functions in this module calculate chance-corrected agreement coefficients
+using the distribution of raters by subject and category, i.e., tables where
+each row represents a subject and each column a category. Each cell has the
+number of raters who classified the subject into the category.
+
+.. versionadded:: 0.5.0
+
+Examples
+--------
+>>> from irrCAC.datasets import distrib_6raters
+>>> from irrCAC.dist import CAC
+>>> data = distrib_6raters()
+>>> print(data.head())  # doctest: +NORMALIZE_WHITESPACE
+       Depression  Personality Disorder  Schizophrenia  Neurosis  Other
+Units
+1               0                     0              0         6      0
+2               0                     3              0         0      3
+3               0                     1              4         0      1
+4               0                     0              0         0      6
+5               0                     3              0         3      0
+
+Initialize a CAC object with the data frame of the counts. The columns are
+the categories.
+
+>>> cac6raters = CAC(data)
+>>> fleiss = cac6raters.fleiss()["est"]
+>>> print(fleiss["coefficient_value"], fleiss["se"], fleiss["pa"], fleiss["pe"])
+0.41393 0.08119 0.55111 0.23407
+
+Get results for any other available method with the same data.
+
+>>> gwet = cac6raters.gwet()["est"]
+>>> print(gwet["coefficient_name"], gwet["coefficient_value"], gwet["se"])
+AC1 0.4448 0.08419
+"""
+
+import numpy as np
+import pandas as pd
+
+from irrCAC import raw
+from irrCAC.profiling import _stages
+
+
+class CAC(raw.BaseCAC):
+    """Chance-corrected Agreement Coefficients (CAC) from the distribution of
+    raters.
+
+    Calculates Gwet's AC1/AC2, Fleiss' kappa, Krippendorff's alpha and the
+    Brennan-Prediger coefficient, with their variances, directly from the
+    :math:`n \\times q` matrix of the number of raters who classified each
+    subject into each category. The results are the same as those of
+    :class:`irrCAC.raw.CAC` for the ratings the counts summarize, but only the
+    count matrix is kept in memory.
+
+    Conger's kappa needs the ratings of each rater and is available only in
+    :class:`irrCAC.raw.CAC`.
+
+    .. versionadded:: 0.5.0
+
+    Parameters
+    ----------
+    ratings : DataFrame or array-like
+        A matrix of counts where each row represents one subject and each
+        column one category. The columns of a data frame are the categories.
+        Subjects with no ratings are dropped.
+    weights : array-like, ndarray, or str, {"identity", "quadratic", "ordinal",\
+    "linear", "radical", "ratio", "circular", "bipolar"}, default: "identity"
+        A mandatory parameter that is either a string variable or a matrix.
+        The string describes one of the predefined weights or a custom scheme
+        registered with :meth:`irrCAC.weights.Weights.register`. If this
+        parameter is a matrix then it must be a square matrix qxq where q
+        is the number of columns of the ratings.
+    categories : list or None, default None
+        The categories of the columns of the ratings. The default value is
+        None. In this case, the columns of a data frame, or the integers
+        1 to q for other arrays, are used.
+    confidence_level : float, default 0.95
+        An optional parameter representing the confidence level associated
+        with the confidence interval. Its default value is 0.95.
+    N : int, default infinity
+        An optional parameter representing the population size (if any).
+        It may be used to perform the final population correction to the
+        variance. Its default value is infinity.
+    digits : int, default 5
+        The number of digits to round the results.
+    dtype : {"float64", "float32"}, default "float64"
+        The floating point type of the weights and of the count matrix.
+    """
+
+    def __init__(
+        self,
+        ratings,
+        weights="identity",
+        categories=None,
+        confidence_level=0.95,
+        N=np.inf,
+        digits=5,
+        dtype=np.float64,
+    ):
+        self._init_settings(confidence_level, dtype)
+
+        stages = _stages(self, "__init__")
+        if isinstance(ratings, pd.DataFrame):
+            columns = ratings.columns.tolist()
+            ratings = ratings.to_numpy(dtype=self.dtype)
+        else:
+            ratings = np.asarray(ratings, dtype=self.dtype)
+            columns = list(range(1, ratings.shape[-1] + 1))
+        if ratings.ndim != 2:
+            raise ValueError(
+                "Expected a 2-D matrix of counts. "
+                f"Given {ratings.ndim} dimension(s)."
+            )
+        if np.any(ratings < 0):
+            raise ValueError("The counts of the ratings must be non-negative.")
+        # Drop subjects with no ratings.
+        ri_vec = ratings.sum(axis=1)
+        if not np.all(ri_vec > 0):
+            ratings = ratings[ri_vec > 0]
+            ri_vec = ri_vec[ri_vec > 0]
+        self.counts = ratings
+        stages.end("cleaning")
+        self.n, self.q = self.counts.shape  # subjects, categories
+        self.r = int(ri_vec.max(initial=0))  # raters of the most rated subject
+        self.f = self.n / N
+        if categories is None:
+            self.categories = columns
+        elif len(categories) != self.q:
+            raise ValueError(
+                f"Expected {self.q} categories, one for each column. "
+                f"Given {len(categories)}."
+            )
+        else:
+            self.categories = list(categories)
+        stages.end("categories")
+        self._init_weights(weights)
+        stages.end("weights")
+        self.digits = digits
+        self._init_agreement()
+
+    def __str__(self):
+        class_path = f"{CAC.__module__}.{CAC.__name__}"
+        subjects = f"Subjects: {self.n}"
+        categories = f"Categories: {self.categories}"
+        weights_name = f'Weights: "{self.weights_name}"'
+        _str = f"{class_path} {subjects}, {categories}, {weights_name}"
+        return f"<{_str}>"
+
+    def _agreement_matrix(self):
+        """The number of raters who classified each subject into each category.
+
+        This is the count matrix given to the constructor.
+        """
+        return self.counts
+
+    def _agreement_patterns(self):
+        """The rows of the agreement matrix and the subjects of each.
+
+        Every subject is a row of its own.
+        """
+        return self.counts, np.ones(self.n, dtype=self.dtype)
@@ -0,0 +1,177 @@
+"""Opt-in profiling of the stages of the coefficients.
+
+The classes :class:`irrCAC.raw.CAC`, :class:`irrCAC.dist.CAC` and
+:class:`irrCAC.table.CAC` mark the end of each stage of their computations,
+such as the cleaning of the ratings, the count matrix, the chance agreement,
+the variance and the t distribution calls. Inside a :class:`Profile` context
+the wall time and the memory allocated by each stage are recorded. Outside of
+it the marks do nothing.
+
+.. versionadded:: 0.5.0
+
+Examples
+--------
+>>> from irrCAC.datasets import raw_4raters
+>>> from irrCAC.profiling import Profile
+>>> from irrCAC.raw import CAC
+>>> with Profile() as profile:
+...     _ = CAC(raw_4raters()).gwet()
+>>> [stage.name for stage in profile.stages]  # doctest: +NORMALIZE_WHITESPACE
+['categories', 'cleaning', 'weights', 'counts', 'pa', 'pe', 'variance',
+ 't_distribution']
+"""
+
+import time
+import tracemalloc
+from collections import namedtuple
+from contextvars import ContextVar
+
+Stage = namedtuple("Stage", ["owner", "name", "seconds", "allocated", "peak"])
+Stage.__doc__ = """The wall time and the memory of a stage of a computation.
+
+The ``owner`` is the method of the stage, e.g., "irrCAC.raw.CAC.gwet". The
+``allocated`` bytes are the net memory allocated during the stage and the
+``peak`` bytes the highest memory above the start of the stage. Both are 0
+when the memory is not traced.
+"""
+
+_active = ContextVar("irrCAC_profile", default=None)
+
+
+class _Stages:
+    """Record the stages of one method call into a profile."""
+
+    def __init__(self, profile, owner):
+        self.profile = profile
+        self.owner = owner
+        self._start()
+
+    def _start(self):
+        self.memory = self.profile._memory_start()
+        self.start = time.perf_counter()
+
+    def end(self, name):
+        """End the current stage with the given name and start the next one."""
+        seconds = time.perf_counter() - self.start
+        allocated, peak = self.profile._memory_since(self.memory)
+        self.profile._add(Stage(self.owner, name, seconds, allocated, peak))
+        self._start()
+
+
+class _NoStages:
+    """The stages outside of a profile, which are not recorded."""
+
+    def end(self, name):
+        pass
+
+
+_NO_STAGES = _NoStages()
+
+
+def _stages(obj, method):
+    """The recorder of the stages of a method of an object.
+
+    It does nothing unless a :class:`Profile` is active.
+    """
+    profile = _active.get()
+    if profile is None:
+        return _NO_STAGES
+    cls = type(obj)
+    return _Stages(profile, f"{cls.__module__}.{cls.__qualname__}.{method}")
+
+
+class Profile:
+    """Context manager that records the stages of the coefficients.
+
+    Parameters
+    ----------
+    callback : callable or None, default None
+        A function called with each :class:`Stage` when it ends, e.g., to log
+        the stages of a long-running process.
+    memory : bool, default True
+        Whether to trace the memory allocations with :mod:`tracemalloc`, which
+        slows down the computations. If False, only the wall time is recorded.
+
+    Attributes
+    ----------
+    stages : list of Stage
+        The recorded stages, in the order they ended.
+    """
+
+    def __init__(self, callback=None, memory=True):
+        self.callback = callback
+        self.memory = memory
+        self.stages = []
+        self._token = None
+        self._started_tracing = False
+
+    def __enter__(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._token = _active.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _active.reset(self._token)
+        self._token = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def __str__(self):
+        seconds = sum(stage.seconds for stage in self.stages)
+        return f"<Profile Stages: {len(self.stages)}, Seconds: {seconds:.6f}>"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def _memory_start(self):
+        if not self.memory:
+            return 0
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+
+    def _memory_since(self, start):
+        if not self.memory:
+            return 0, 0
+        current, peak = tracemalloc.get_traced_memory()
+        return current - start, peak - start
+
+    def _add(self, stage):
+        self.stages.append(stage)
+        if self.callback is not None:
+            self.callback(stage)
+
+    def to_frame(self):
+        """The recorded stages as a data frame, one row per stage.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The columns are the fields of :class:`Stage`.
+        """
+        import pandas as pd
+
+        return pd.DataFrame(self.stages, columns=Stage._fields)
+
+    def summary(self):
+        """The total time and memory of each stage of each method.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The number of calls, the total seconds, the total allocated bytes
+            and the highest peak bytes, indexed by the owner and the name of
+            the stage.
+        """
+        return (
+            self.to_frame()
+            .groupby(["owner", "name"], sort=False)
+            .agg(
+                calls=("seconds", "size"),
+                seconds=("seconds", "sum"),
+                allocated=("allocated", "sum"),
+                peak=("peak", "max"),
+            )
+        )
@@ -85,108 +85,70 @@ To use weights with the calculations, we pass the type of weights as argument.
 from copy import deepcopy
 
 import numpy as np
-from scipy import stats
 
+from irrCAC.convert import encode_ratings
+from irrCAC.profiling import _stages
 from irrCAC.weights import Weights
 
 
-class CAC:
-    """ Chance-corrected Agreement Coefficients (CAC)
+def _t_distribution():
+    """The t distribution of :mod:`scipy.stats`.
 
-    Calculates various chance-corrected agreement coefficients (CAC) among 2 or
-    more raters are provided. Among the CAC coefficients covered are
+    It is imported when the first p-value or confidence interval is computed,
+    because importing :mod:`scipy.stats` is slower than the rest of the package.
+    """
+    from scipy import stats
 
-    * Brennan-Prediger coefficient,
-    * Conger's kappa,
-    * Fleiss' kappa,
-    * Gwet's AC1/AC2 coefficients, and
-    * Krippendorff's Alpha.
+    return stats.t
 
-    Multiple sets of weights are proposed for computing weighted analyses.
-    All of these statistical procedures are described in details in Gwet
-    :cite:p:`Gwe14`.
 
-    Parameters
-    ----------
-    ratings : DataFrame
-        A data frame of ratings where each column represents one rater and
-        each row one subject.
-    weights : array-like, ndarray, or str, {"identity", "quadratic", "ordinal",\
-    "linear", "radical", "ratio", "circular", "bipolar"}, default: "identity"
-        A mandatory parameter that is either a string variable or a matrix.
-        The string describes one of the predefined weights. If this
-        parameter is a matrix then it must be a square matrix qxq where q
-        is the number of possible categories where a subject can be
-        classified. If some of the q possible categories are not used,
-        then it is strongly advised to specify the complete list of
-        possible categories as a vector in parameter ``categories``.
-        Otherwise, the program may not work.
-    categories : list or None, default None
-        An optional vector parameter containing the list of all possible
-        ratings. It may be useful in case some possible ratings are not
-        used by any rater, they will still be used when calculating
-        agreement coefficients. The default value is None. In this case,
-        only categories reported by the raters are used in the calculations.
-    confidence_level : float, default 0.95
-        An optional parameter representing the confidence level associated
-        with the confidence interval. Its default value is 0.95.
-    N : int, default infinity
-        An optional parameter representing the population size (if any).
-        It may be used to perform the final population correction to the
-        variance. Its default value is infinity.
-    digits : int, default 5
-        The number of digits to round the results.
+class BaseCAC:
+    """Base class of the coefficients computed from the agreement matrix.
+
+    The agreement matrix has the number of raters who classified each subject
+    into each category. The subclasses set the number of subjects ``n``, of
+    raters ``r`` and of categories ``q``, the ``categories`` and the
+    population correction ``f``, and provide the agreement matrix with the
+    methods ``_agreement_matrix`` and ``_agreement_patterns``. Gwet's
+    AC1/AC2, Fleiss' kappa, Krippendorff's alpha and the Brennan-Prediger
+    coefficient are computed from them.
+
+    .. versionadded:: 0.5.0
     """
 
-    def __init__(
-        self,
-        ratings,
-        weights="identity",
-        categories=None,
-        confidence_level=0.95,
-        N=np.inf,
-        digits=5,
-    ):
-        weights_choices = (
-            "identity",
-            "quadratic",
-            "ordinal",
-            "linear",
-            "radical",
-            "ratio",
-            "circular",
-            "bipolar",
-        )
+    def _init_settings(self, confidence_level, dtype):
+        """Check and set the confidence level and the floating point type."""
         if not 0.9 <= confidence_level <= 0.99:
             raise ValueError("Please provide a value in range [0.90, 0.99].")
         self.confidence_level = confidence_level
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError("`dtype` can be any of float32 or float64.")
 
-        # Drop subjects with no ratings.
-        self.ratings = ratings.dropna(how="all")
-        self.ratings.replace(to_replace="", value=np.nan, inplace=True)
-        self.n, self.r = self.ratings.shape  # subjects, raters
-        self.f = self.n / N
-        if categories is None:
-            self.categories = sorted(self.ratings.stack().unique().tolist())
-        else:
-            self.categories = categories
-        self.q = len(self.categories)
+    def __repr__(self):
+        return self.__str__()
+
+    def _init_weights(self, weights):
+        """Set the name and the matrix of the weights for the categories."""
+        weights_choices = Weights.schemes()
         if isinstance(weights, str):
             if weights not in weights_choices:
                 raise ValueError(f"weights values can be any of {weights_choices}")
             self.weights_name = weights
-            weights_functions = Weights(self.categories)
+            weights_functions = Weights(self.categories, dtype=self.dtype)
             self.weights_mat = weights_functions[self.weights_name]
         else:
             self.weights_name = "Custom Weights"
-            self.weights_mat = np.asarray(weights)
+            self.weights_mat = np.asarray(weights, dtype=self.dtype)
             rows, cols = self.weights_mat.shape
             if not (rows == self.q and cols == self.q):
                 raise ValueError(
                     f"Expected weights matrix shape is {self.q}x{self.q}. "
                     f"Given size is {rows}x{cols}."
                 )
-        self.digits = digits
+
+    def _init_agreement(self):
+        """Set the attributes of the results before any coefficient is computed."""
         self.coefficient_value = 0
         self.coefficient_name = None
         self.confidence_interval = (0, 0)
@@ -210,18 +172,6 @@ class CAC:
             "categories": self.categories,
         }
 
-    def __str__(self):
-        class_path = f"{CAC.__module__}.{CAC.__name__}"
-        subjects = f"Subjects: {self.n}"
-        raters = f"Raters: {self.r}"
-        categories = f"Categories: {self.categories}"
-        weights_name = f'Weights: "{self.weights_name}"'
-        _str = f"{class_path} {subjects}, {raters}, {categories}, {weights_name}"
-        return f"<{_str}>"
-
-    def __repr__(self):
-        return self.__str__()
-
     def gwet(self):
         """Gwet's AC1/AC2 coefficient.
 
@@ -234,25 +184,33 @@ class CAC:
         The Gwet's AC2 coefficient is the one when using weights for the
         calculation.
         """
-        agree_mat = np.zeros(shape=(self.n, self.q))
-        for k in range(self.q):
-            agree_mat[:, k] = self.ratings[self.ratings == self.categories[k]].count(
-                axis=1
-            )
+        stages = _stages(self, "gwet")
+        agree_mat, subjects = self._agreement_patterns()
+        stages.end("counts")
         agree_mat_w = np.transpose(np.matmul(self.weights_mat, agree_mat.T))
         ri_vec = agree_mat.sum(axis=1)
         sum_q = (agree_mat * (agree_mat_w - 1)).sum(axis=1)
-        n2more = sum(ri_vec >= 2)
-        pa = sum(sum_q[ri_vec >= 2] / (ri_vec * (ri_vec - 1))[ri_vec >= 2]) / n2more
-        pi_vec = (
-            np.repeat(1 / self.n, self.n).reshape(self.n, 1)
-            * (agree_mat / np.repeat(ri_vec, self.q).reshape(self.n, self.q))
-        ).T.sum(axis=1)
+        n2more = int(np.sum(subjects[ri_vec >= 2], dtype=np.float64))
+        pa = (
+            np.sum(
+                (subjects * sum_q)[ri_vec >= 2] / (ri_vec * (ri_vec - 1))[ri_vec >= 2]
+            )
+            / n2more
+        )
+        stages.end("pa")
+        pi_vec = (subjects.reshape(-1, 1) * agree_mat / ri_vec.reshape(-1, 1)).sum(
+            axis=0
+        ) / self.n
         weights_mat_sum = np.sum(np.sum(self.weights_mat))
         if self.q >= 2:
-            pe = weights_mat_sum * sum(pi_vec * (1 - pi_vec)) / (self.q * (self.q - 1))
+            pe = (
+                weights_mat_sum
+                * np.sum(pi_vec * (1 - pi_vec))
+                / (self.q * (self.q - 1))
+            )
         else:
             pe = 1 - 1e-15
+        stages.end("pe")
         ac1 = (pa - pe) / (1 - pe)
         den_ivec = ri_vec * (ri_vec - 1)
         den_ivec = den_ivec - (den_ivec == 0)
@@ -265,15 +223,21 @@ class CAC:
             / ri_vec
         )
         ac1_ivec_x = ac1_ivec - 2 * (1 - ac1) * (pe_ivec - pe) / (1 - pe)
-        var_ac1 = (1 - self.f) / (self.n * (self.n - 1)) * sum((ac1_ivec_x - ac1) ** 2)
+        var_ac1 = (
+            (1 - self.f)
+            / (self.n * (self.n - 1))
+            * np.sum(subjects * (ac1_ivec_x - ac1) ** 2)
+        )
         stderr = np.sqrt(var_ac1)
         if stderr == 0.0:
             stderr = 1e-15
-        p_value = 2 * (1 - stats.t.cdf(abs(ac1 / stderr), self.n - 1))
-        lcb, ucb = stats.t.interval(
+        stages.end("variance")
+        p_value = 2 * (1 - _t_distribution().cdf(abs(ac1 / stderr), self.n - 1))
+        lcb, ucb = _t_distribution().interval(
             self.confidence_level, df=self.n - 1, scale=stderr, loc=ac1
         )
         ucb = min(1, ucb)
+        stages.end("t_distribution")
 
         if weights_mat_sum == self.q:
             coeff_name = "AC1"
@@ -313,33 +277,35 @@ class CAC:
         The calculation of the kappa coefficient here takes into account any
         missing values.
         """
-        agree_mat = np.zeros(shape=(self.n, self.q))
-        for c in range(self.q):
-            agree_mat[:, c] = self.ratings[self.ratings == self.categories[c]].count(
-                axis=1
-            )
+        stages = _stages(self, "fleiss")
+        agree_mat, subjects = self._agreement_patterns()
+        stages.end("counts")
         agree_mat_w = np.transpose(np.matmul(self.weights_mat, agree_mat.T))
         ri_vec = agree_mat.sum(axis=1)
         sum_q = (agree_mat * (agree_mat_w - 1)).sum(axis=1)
-        n2more = sum(ri_vec >= 2)
+        n2more = int(np.sum(subjects[ri_vec >= 2], dtype=np.float64))
         pa = float(
-            sum(sum_q[ri_vec >= 2] / (ri_vec * (ri_vec - 1))[ri_vec >= 2]) / n2more
+            np.sum(
+                (subjects * sum_q)[ri_vec >= 2] / (ri_vec * (ri_vec - 1))[ri_vec >= 2]
+            )
+            / n2more
         )
-        pi_vec = (
-            np.repeat(1 / self.n, self.n).reshape(self.n, 1)
-            * (agree_mat / np.repeat(ri_vec, self.q).reshape(self.n, self.q))
-        ).T.sum(axis=1)
+        stages.end("pa")
+        pi_vec = (subjects.reshape(-1, 1) * agree_mat / ri_vec.reshape(-1, 1)).sum(
+            axis=0
+        ) / self.n
         pe = float(
             np.sum(
                 self.weights_mat
                 * (pi_vec.reshape(self.q, 1) * pi_vec.reshape(1, self.q))
             )
         )
+        stages.end("pe")
         fleiss_kappa = (pa - pe) / (1 - pe)
         den_ivec = ri_vec * (ri_vec - 1)
         den_ivec = den_ivec - (den_ivec == 0)
         pa_ivec = sum_q / den_ivec
-        pe_r2 = pe * (ri_vec >= 2)
+        pe_r2 = pe * (ri_vec >= 2).astype(self.dtype)
         kappa_ivec = (self.n / n2more) * (pa_ivec - pe_r2) / (1 - pe)
         pi_vec_wk_ = np.matmul(self.weights_mat, pi_vec)
         pi_vec_w_k = np.matmul(self.weights_mat.T, pi_vec)
@@ -349,16 +315,20 @@ class CAC:
         var_fleiss = (
             (1 - self.f)
             / (self.n * (self.n - 1))
-            * sum((kappa_ivec_x - fleiss_kappa) ** 2)
+            * np.sum(subjects * (kappa_ivec_x - fleiss_kappa) ** 2)
         )
         stderr = np.sqrt(var_fleiss)
         if stderr == 0.0:
             stderr = 1e-15
-        p_value = float(2 * (1 - stats.t.cdf(abs(fleiss_kappa / stderr), self.n - 1)))
-        lcb, ucb = stats.t.interval(
+        stages.end("variance")
+        p_value = float(
+            2 * (1 - _t_distribution().cdf(abs(fleiss_kappa / stderr), self.n - 1))
+        )
+        lcb, ucb = _t_distribution().interval(
             self.confidence_level, df=self.n - 1, scale=stderr, loc=fleiss_kappa
         )
         ucb = min(1, ucb)
+        stages.end("t_distribution")
 
         self.coefficient_value = round(fleiss_kappa, self.digits)
         self.coefficient_name = "Fleiss' kappa"
@@ -389,24 +359,27 @@ class CAC:
         of raters (2, 3, +) when the input data represent the raw ratings reported for
         each subject and each rater.
         """
-        agree_mat = np.zeros(shape=(self.n, self.q))
-        for k in range(self.q):
-            agree_mat[:, k] = self.ratings[self.ratings == self.categories[k]].count(
-                axis=1
-            )
+        stages = _stages(self, "krippendorff")
+        agree_mat, subjects = self._agreement_patterns()
+        stages.end("counts")
         agree_mat_w = np.transpose(np.matmul(self.weights_mat, agree_mat.T))
         ri_vec = agree_mat.sum(axis=1)
         agree_mat = agree_mat[ri_vec >= 2]
         agree_mat_w = agree_mat_w[ri_vec >= 2]
+        subjects = subjects[ri_vec >= 2]
         ri_vec = ri_vec[ri_vec >= 2]
-        ri_mean = np.mean(ri_vec)
-        n = agree_mat.shape[0]
-        epsi = 1 / np.sum(ri_vec)
+        n = int(np.sum(subjects, dtype=np.float64))
+        ri_mean = np.sum(subjects * ri_vec) / n
+        epsi = 1 / np.sum(subjects * ri_vec)
         sum_q = (agree_mat * (agree_mat_w - 1)).sum(axis=1)
-        paprime = np.sum(sum_q / (ri_mean * (ri_vec - 1))) / n
+        paprime = np.sum(subjects * sum_q / (ri_mean * (ri_vec - 1))) / n
         pa = float((1 - epsi) * paprime + epsi)
-        pi_vec = np.matmul(np.repeat(1 / n, n).reshape(1, n), agree_mat / ri_mean).T
+        stages.end("pa")
+        pi_vec = (
+            (subjects.reshape(-1, 1) * agree_mat).sum(axis=0) / (n * ri_mean)
+        ).reshape(-1, 1)
         pe = float(np.sum(self.weights_mat * np.matmul(pi_vec, pi_vec.T)))
+        stages.end("pe")
         krippen_alpha = (pa - pe) / (1 - pe)
         krippen_alpha_est = np.round(krippen_alpha, self.digits)
         krippen_alpha_prime = (paprime - pe) / (1 - pe)
@@ -426,16 +399,20 @@ class CAC:
         var_krippen = (
             (1 - self.f)
             / (n * (n - 1))
-            * sum((krippen_ivec_x - krippen_alpha_prime) ** 2)
+            * np.sum(
+                subjects.reshape(-1, 1) * (krippen_ivec_x - krippen_alpha_prime) ** 2
+            )
         )
         stderr = np.sqrt(float(var_krippen.item()))
         if stderr == 0.0:
             stderr = 1e-15
-        p_value = 2 * (1 - stats.t.cdf(abs(krippen_alpha / stderr), n - 1))
-        lcb, ucb = stats.t.interval(
+        stages.end("variance")
+        p_value = 2 * (1 - _t_distribution().cdf(abs(krippen_alpha / stderr), n - 1))
+        lcb, ucb = _t_distribution().interval(
             self.confidence_level, df=n - 1, scale=stderr, loc=krippen_alpha
         )
         ucb = min(1, ucb)
+        stages.end("t_distribution")
         self.coefficient_value = round(krippen_alpha_est, self.digits)
         self.coefficient_name = "Krippendorff's Alpha"
         self.confidence_interval = (round(lcb, self.digits), round(ucb, self.digits))
@@ -458,6 +435,241 @@ class CAC:
         )
         return deepcopy(self.agreement)
 
+    def bp(self):
+        """Brennan-Prediger coefficient
+
+        The agreement coefficient recommended by Brennan and Prediger :cite:p:`BP81`
+        assumes that when the rating of a subject is a random process, the subject would
+        be assigned to any of the :math:`q` categories with equal probability
+        :math:`1/q`, resulting in a percent chance agreement of :math:`1/q`.
+
+        .. versionadded:: 0.4.0
+        """
+        stages = _stages(self, "bp")
+        agree_mat, subjects = self._agreement_patterns()
+        stages.end("counts")
+        agree_mat_w = np.transpose(np.matmul(self.weights_mat, agree_mat.T))
+        ri_vec = agree_mat.sum(axis=1)
+        sum_q = (agree_mat * (agree_mat_w - 1)).sum(axis=1)
+        n2more = int(np.sum(subjects[ri_vec >= 2], dtype=np.float64))
+        pa = float(
+            np.sum(
+                (subjects * sum_q)[ri_vec >= 2] / (ri_vec * (ri_vec - 1))[ri_vec >= 2]
+            )
+            / n2more
+        )
+        stages.end("pa")
+        if self.q >= 2:
+            pe = np.sum(self.weights_mat) / (self.q**2)
+        else:
+            pe = 1e-15
+        stages.end("pe")
+        bp_coeff = (pa - pe) / (1 - pe)
+        den_ivec = ri_vec * (ri_vec - 1)
+        den_ivec = den_ivec - (den_ivec == 0)
+        pa_ivec = sum_q / den_ivec
+        pe_r2 = pe * (ri_vec >= 2)
+        bp_ivec = (self.n / n2more) * (pa_ivec - pe_r2) / (1 - pe)
+
+        var_bp = (
+            (1 - self.f)
+            / (self.n * (self.n - 1))
+            * np.sum(subjects * (bp_ivec - bp_coeff) ** 2)
+        )
+        stderr = np.sqrt(var_bp)
+        if stderr == 0.0:
+            stderr = 1e-15
+        stages.end("variance")
+        p_value = 1 - _t_distribution().cdf(abs(bp_coeff / stderr), self.n - 1)
+        lcb, ucb = _t_distribution().interval(
+            self.confidence_level, df=self.n - 1, scale=stderr, loc=bp_coeff
+        )
+        ucb = min(1, ucb)
+        stages.end("t_distribution")
+
+        self.coefficient_value = round(bp_coeff, self.digits)
+        self.coefficient_name = "Brennan-Prediger"
+        self.confidence_interval = (round(lcb, self.digits), round(ucb, self.digits))
+        self.p_value = p_value
+        self.z = round(bp_coeff / stderr, self.digits)
+        self.se = round(stderr, self.digits)
+        self.pa = round(pa, self.digits)
+        self.pe = round(pe, self.digits)
+        self.agreement["est"].update(
+            dict(
+                coefficient_name=self.coefficient_name,
+                pa=self.pa,
+                pe=self.pe,
+                se=self.se,
+                z=self.z,
+                coefficient_value=self.coefficient_value,
+                confidence_interval=self.confidence_interval,
+                p_value=self.p_value,
+            )
+        )
+        return deepcopy(self.agreement)
+
+
+class CAC(BaseCAC):
+    """ Chance-corrected Agreement Coefficients (CAC)
+
+    Calculates various chance-corrected agreement coefficients (CAC) among 2 or
+    more raters are provided. Among the CAC coefficients covered are
+
+    * Brennan-Prediger coefficient,
+    * Conger's kappa,
+    * Fleiss' kappa,
+    * Gwet's AC1/AC2 coefficients, and
+    * Krippendorff's Alpha.
+
+    Multiple sets of weights are proposed for computing weighted analyses.
+    All of these statistical procedures are described in details in Gwet
+    :cite:p:`Gwe14`.
+
+    Parameters
+    ----------
+    ratings : DataFrame
+        A data frame of ratings where each column represents one rater and
+        each row one subject.
+    weights : array-like, ndarray, or str, {"identity", "quadratic", "ordinal",\
+    "linear", "radical", "ratio", "circular", "bipolar"}, default: "identity"
+        A mandatory parameter that is either a string variable or a matrix.
+        The string describes one of the predefined weights or a custom scheme
+        registered with :meth:`irrCAC.weights.Weights.register`. If this
+        parameter is a matrix then it must be a square matrix qxq where q
+        is the number of possible categories where a subject can be
+        classified. If some of the q possible categories are not used,
+        then it is strongly advised to specify the complete list of
+        possible categories as a vector in parameter ``categories``.
+        Otherwise, the program may not work.
+    categories : list or None, default None
+        An optional vector parameter containing the list of all possible
+        ratings. It may be useful in case some possible ratings are not
+        used by any rater, they will still be used when calculating
+        agreement coefficients. The default value is None. In this case,
+        only categories reported by the raters are used in the calculations.
+    confidence_level : float, default 0.95
+        An optional parameter representing the confidence level associated
+        with the confidence interval. Its default value is 0.95.
+    N : int, default infinity
+        An optional parameter representing the population size (if any).
+        It may be used to perform the final population correction to the
+        variance. Its default value is infinity.
+    digits : int, default 5
+        The number of digits to round the results.
+    dtype : {"float64", "float32"}, default "float64"
+        The floating point type of the weights and of the intermediate
+        arrays, including the counts of the agreement matrix. With "float32"
+        the memory of the :math:`n \\times q` and :math:`q \\times q` arrays
+        is halved at the cost of some accuracy.
+
+        .. versionadded:: 0.5.0
+    """
+
+    def __init__(
+        self,
+        ratings,
+        weights="identity",
+        categories=None,
+        confidence_level=0.95,
+        N=np.inf,
+        digits=5,
+        dtype=np.float64,
+    ):
+        self._init_settings(confidence_level, dtype)
+
+        stages = _stages(self, "__init__")
+        # Missing ratings are at q and ratings which are not in the categories
+        # at q + 1. Both are left out of the counts.
+        index, codes = encode_ratings(ratings, categories, strict=False)
+        if categories is None:
+            categories = index.tolist()
+        self.categories = categories
+        self.q = q = len(categories)
+        stages.end("categories")
+        # Drop subjects with no ratings. Subjects with only missing codes may
+        # still have empty strings, so only these few are looked up in the
+        # data frame.
+        subjects = np.any(codes != q, axis=0)
+        unrated = np.flatnonzero(~subjects)
+        subjects[unrated] = ratings.iloc[unrated].notna().any(axis=1).to_numpy()
+        self._source = ratings
+        self._subjects = None if subjects.all() else subjects
+        self._ratings = None
+        self.n, self.r = int(subjects.sum()), ratings.shape[1]  # subjects, raters
+        self.f = self.n / N
+        self.codes = codes if self._subjects is None else codes[:, subjects]
+        stages.end("cleaning")
+        self._init_weights(weights)
+        stages.end("weights")
+        self.digits = digits
+        self._init_agreement()
+
+    def __str__(self):
+        class_path = f"{CAC.__module__}.{CAC.__name__}"
+        subjects = f"Subjects: {self.n}"
+        raters = f"Raters: {self.r}"
+        categories = f"Categories: {self.categories}"
+        weights_name = f'Weights: "{self.weights_name}"'
+        _str = f"{class_path} {subjects}, {raters}, {categories}, {weights_name}"
+        return f"<{_str}>"
+
+    @property
+    def ratings(self):
+        """The ratings of the subjects, where empty strings are NaN.
+
+        The coefficients use the encoded ratings in ``codes``. The data frame
+        is built from the given ratings on first use.
+        """
+        if self._ratings is None:
+            ratings = self._source
+            if self._subjects is not None:
+                ratings = ratings[self._subjects]
+            self._ratings = ratings.replace(to_replace="", value=np.nan)
+        return self._ratings
+
+    def _agreement_matrix(self):
+        """The number of raters who classified each subject into each category.
+
+        The counts are small integers, which are exact in any floating point
+        type, so they are counted directly in an :math:`n \\times q` array of
+        type `dtype`.
+        """
+        agree_mat = np.zeros(shape=(self.n, self.q + 2), dtype=self.dtype)
+        subjects = np.arange(self.n)
+        # Each subject appears once in a column, so the increments don't clash.
+        for positions in self.codes:
+            agree_mat[subjects, positions] += 1
+        return agree_mat[:, : self.q]
+
+    def _agreement_patterns(self):
+        """The distinct rows of the agreement matrix and the subjects of each.
+
+        With two raters the row of a subject depends only on its pair of
+        ratings, so the pairs are encoded and counted in a
+        :math:`(q + 2) \\times (q + 2)` contingency table with one bincount,
+        where the last two rows and columns are for the missing ratings and
+        the ratings out of the categories. Each non-empty cell gives one row.
+        With more raters each subject is a row.
+
+        Returns
+        -------
+        tuple of ndarray
+            The rows of type `dtype` and the number of subjects of each row.
+        """
+        if self.r != 2:
+            return self._agreement_matrix(), np.ones(self.n, dtype=self.dtype)
+        # Missing ratings are at q and ratings out of the categories at q + 1.
+        cells = self.codes[0].astype(np.int64) * (self.q + 2) + self.codes[1]
+        table = np.bincount(cells, minlength=(self.q + 2) ** 2)
+        patterns = np.flatnonzero(table)
+        rows, cols = np.divmod(patterns, self.q + 2)
+        agree_mat = np.zeros((len(patterns), self.q + 2), dtype=self.dtype)
+        subjects = np.arange(len(patterns))
+        agree_mat[subjects, rows] += 1
+        agree_mat[subjects, cols] += 1
+        return agree_mat[:, : self.q], table[patterns].astype(self.dtype)
+
     def conger(self):
         """Conger's generalized kappa coefficient.
 
@@ -467,21 +679,19 @@ class CAC:
 
         .. versionadded:: 0.2.5
         """
-        agree_mat = np.zeros(shape=(self.n, self.q))
-        for k in range(self.q):
-            agree_mat[:, k] = self.ratings[self.ratings == self.categories[k]].count(
-                axis=1
-            )
-        classif_mat = np.zeros(shape=(self.r, self.q))
-        for k in range(self.q):
-            with_mis = self.ratings == self.categories[k]
-            without_mis = with_mis.T.fillna(False)
-            classif_mat[:, k] = without_mis.sum(axis=1)
+        stages = _stages(self, "conger")
+        agree_mat = self._agreement_matrix()
+        # The number of subjects each rater classified into each category.
+        classif_mat = np.stack(
+            [np.bincount(codes, minlength=self.q)[: self.q] for codes in self.codes]
+        ).astype(self.dtype)
+        stages.end("counts")
         ri_vec = agree_mat.sum(axis=1)
         agree_mat_w = np.transpose(np.matmul(self.weights_mat, agree_mat.T))
         sum_q = (agree_mat * (agree_mat_w - 1)).sum(axis=1)
-        n2more = sum(ri_vec >= 2)
-        pa = sum(sum_q[ri_vec >= 2] / (ri_vec * (ri_vec - 1))[ri_vec >= 2]) / n2more
+        n2more = int(np.sum(ri_vec >= 2))
+        pa = np.sum(sum_q[ri_vec >= 2] / (ri_vec * (ri_vec - 1))[ri_vec >= 2]) / n2more
+        stages.end("pa")
         ng_vec = classif_mat.sum(axis=1).reshape(-1, 1)
         pgk_mat = classif_mat / np.broadcast_to(ng_vec, (self.r, self.q))
         p_mean_k = pgk_mat.T.sum(axis=1) / self.r
@@ -490,21 +700,17 @@ class CAC:
             np.matmul(pgk_mat.T, pgk_mat) - self.r * (p_mean_k * p_mean_k.T)
         ) / (self.r - 1)
         pe = np.sum(self.weights_mat * (p_mean_k * p_mean_k.T - s2kl_mat / self.r))
+        stages.end("pe")
         conger_kappa = (pa - pe) / (1 - pe)
         # bkl_mat = (self.weights_mat + self.weights_mat.T) / 2
-        lambda_ig_mat = np.zeros((self.n, self.r))
-        is_numeric_ratings = (
-            self.ratings.map(lambda x: isinstance(x, (int, float))).all(1).sum()
-            == self.n
-        )
-        if is_numeric_ratings:
-            epsi_ig_mat = 1 - self.ratings.isna()
-        else:
-            epsi_ig_mat = self.ratings.map(lambda x: isinstance(x, str))
+        lambda_ig_mat = np.zeros((self.n, self.r), dtype=self.dtype)
+        # Whether each rater rated each subject, even out of the categories.
+        codes = self.codes.T
+        epsi_ig_mat = codes != self.q
         for k in range(self.q):
-            lambda_ig_kmat = np.zeros((self.n, self.r))
+            lambda_ig_kmat = np.zeros((self.n, self.r), dtype=self.dtype)
             for lam in range(self.q):
-                delta_ig_mat = self.ratings == self.categories[lam]
+                delta_ig_mat = codes == lam
                 lambda_ig_kmat += self.weights_mat[k][lam] * (
                     delta_ig_mat
                     - (epsi_ig_mat - ng_vec.T / self.n)
@@ -526,16 +732,20 @@ class CAC:
         var_conger = (
             (1 - self.f)
             / (self.n * (self.n - 1))
-            * sum((conger_ivec_x - conger_kappa) ** 2)
+            * np.sum((conger_ivec_x - conger_kappa) ** 2)
         )
         stderr = np.sqrt(var_conger)
         if stderr == 0.0:
             stderr = 1e-15
-        p_value = float(2 * (1 - stats.t.cdf(abs(conger_kappa / stderr), self.n - 1)))
-        lcb, ucb = stats.t.interval(
+        stages.end("variance")
+        p_value = float(
+            2 * (1 - _t_distribution().cdf(abs(conger_kappa / stderr), self.n - 1))
+        )
+        lcb, ucb = _t_distribution().interval(
             self.confidence_level, df=self.n - 1, scale=stderr, loc=conger_kappa
         )
         ucb = min(1, ucb)
+        stages.end("t_distribution")
 
         self.coefficient_value = round(conger_kappa, self.digits)
         self.coefficient_name = "Conger's kappa"
@@ -558,68 +768,3 @@ class CAC:
             )
         )
         return deepcopy(self.agreement)
-
-    def bp(self):
-        """Brennan-Prediger coefficient
-
-        The agreement coefficient recommended by Brennan and Prediger :cite:p:`BP81`
-        assumes that when the rating of a subject is a random process, the subject would
-        be assigned to any of the :math:`q` categories with equal probability
-        :math:`1/q`, resulting in a percent chance agreement of :math:`1/q`.
-
-        .. versionadded:: 0.4.0
-        """
-        agree_mat = np.zeros(shape=(self.n, self.q))
-        for c in range(self.q):
-            agree_mat[:, c] = self.ratings[self.ratings == self.categories[c]].count(
-                axis=1
-            )
-        agree_mat_w = np.transpose(np.matmul(self.weights_mat, agree_mat.T))
-        ri_vec = agree_mat.sum(axis=1)
-        sum_q = (agree_mat * (agree_mat_w - 1)).sum(axis=1)
-        n2more = sum(ri_vec >= 2)
-        pa = float(
-            sum(sum_q[ri_vec >= 2] / (ri_vec * (ri_vec - 1))[ri_vec >= 2]) / n2more
-        )
-        if self.q >= 2:
-            pe = np.sum(self.weights_mat) / (self.q**2)
-        else:
-            pe = 1e-15
-        bp_coeff = (pa - pe) / (1 - pe)
-        den_ivec = ri_vec * (ri_vec - 1)
-        den_ivec = den_ivec - (den_ivec == 0)
-        pa_ivec = sum_q / den_ivec
-        pe_r2 = pe * (ri_vec >= 2)
-        bp_ivec = (self.n / n2more) * (pa_ivec - pe_r2) / (1 - pe)
-
-        var_bp = (1 - self.f) / (self.n * (self.n - 1)) * sum((bp_ivec - bp_coeff) ** 2)
-        stderr = np.sqrt(var_bp)
-        if stderr == 0.0:
-            stderr = 1e-15
-        p_value = 1 - stats.t.cdf(abs(bp_coeff / stderr), self.n - 1)
-        lcb, ucb = stats.t.interval(
-            self.confidence_level, df=self.n - 1, scale=stderr, loc=bp_coeff
-        )
-        ucb = min(1, ucb)
-
-        self.coefficient_value = round(bp_coeff, self.digits)
-        self.coefficient_name = "Brennan-Prediger"
-        self.confidence_interval = (round(lcb, self.digits), round(ucb, self.digits))
-        self.p_value = p_value
-        self.z = round(bp_coeff / stderr, self.digits)
-        self.se = round(stderr, self.digits)
-        self.pa = round(pa, self.digits)
-        self.pe = round(pe, self.digits)
-        self.agreement["est"].update(
-            dict(
-                coefficient_name=self.coefficient_name,
-                pa=self.pa,
-                pe=self.pe,
-                se=self.se,
-                z=self.z,
-                coefficient_value=self.coefficient_value,
-                confidence_interval=self.confidence_interval,
-                p_value=self.p_value,
-            )
-        )
-        return deepcopy(self.agreement)
@@ -46,15 +46,331 @@ To use weights with the calculations, we pass the type of weights as argument.
 'categories': ['Ectopic', 'AIU', 'NIU']}
 """
 
-from copy import deepcopy
+import sys
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
-from scipy import stats
+import pandas as pd
 
+from irrCAC.convert import encode_ratings, pairs_to_table
+from irrCAC.profiling import _stages
 from irrCAC.weights import Weights
 
 
-class CAC:
+def _t_cdf(x, df):
+    """The distribution function of the t distribution.
+
+    The same as :func:`scipy.stats.t.cdf`, without its overhead per call.
+    """
+    from scipy import special
+
+    return special.stdtr(df, np.asarray(x, dtype=np.float64))[()]
+
+
+def _t_interval(confidence_level, df, loc, scale):
+    """The confidence interval of the t distribution.
+
+    The same as :func:`scipy.stats.t.interval`, without its overhead per call.
+    """
+    from scipy import special
+
+    scale = np.where(scale > 0, scale, np.nan)
+    lower = special.stdtrit(df, (1.0 - confidence_level) / 2) * scale + loc
+    upper = special.stdtrit(df, (1.0 + confidence_level) / 2) * scale + loc
+    return lower[()], upper[()]
+
+
+def _issparse(ratings):
+    """Whether the ratings are a :mod:`scipy.sparse` array or matrix.
+
+    A sparse input exists only if :mod:`scipy.sparse` is already imported, so
+    it is not imported for the dense tables.
+    """
+    sparse = sys.modules.get("scipy.sparse")
+    return sparse is not None and sparse.issparse(ratings)
+
+
+def _identity(q, dtype):
+    """A read-only :math:`q \\times q` identity matrix in :math:`O(q)` memory.
+
+    The matrix is a strided view of a vector with a single one, where the cell
+    :math:`(k, l)` is the element :math:`q - 1 - k + l` of the vector.
+    """
+    line = np.zeros(2 * q - 1, dtype=dtype)
+    line[q - 1] = 1
+    step = line.itemsize
+    return np.lib.stride_tricks.as_strided(
+        line[slice(q - 1, None)], shape=(q, q), strides=(-step, step), writeable=False
+    )
+
+
+def _permutation_tail(
+    rows, cols, weights_mat, expected, deviation, batch_size, draws, seed
+):
+    """Count the shuffles of ``cols`` with an agreement at least ``deviation`` away
+    from the ``expected`` one.
+
+    The agreement is the number of equal pairs, or the sum of the weights of the
+    pairs if ``weights_mat`` is not None.
+    """
+    rng = np.random.default_rng(seed)
+    extreme = 0
+    for start in range(0, draws, batch_size):
+        size = min(batch_size, draws - start)
+        shuffled = rng.permuted(np.broadcast_to(cols, (size, len(cols))), axis=1)
+        if weights_mat is None:
+            agreement = np.count_nonzero(shuffled == rows, axis=1)
+        else:
+            agreement = weights_mat[rows, shuffled].sum(axis=1)
+        extreme += np.count_nonzero(np.abs(agreement - expected) >= deviation)
+    return extreme
+
+
+# The most half-lives between two decays of the totals of a WindowAccumulator,
+# so that the stored counts stay below 2**512.
+_MAX_HALF_LIVES = 512
+
+
+class _Coefficients:
+    """The coefficients of one or more contingency tables of two raters.
+
+    The formulas are written once for a single table and for a stack of
+    tables. The subclasses set the normalized tables ``pkl``, their marginals
+    and the weighted percent agreement ``pa``, with an optional leading axis
+    of tables, and format the estimates in :meth:`_results`.
+    """
+
+    def _init_settings(self, confidence_level, dtype):
+        """Check and set the confidence level and the floating point type."""
+        if not 0.9 <= confidence_level <= 0.99:
+            raise ValueError("Please provide a value in range [0.90, 0.99].")
+        self.confidence_level = confidence_level
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError("`dtype` can be any of float32 or float64.")
+        self.count_dtype = np.dtype(np.int32 if self.dtype == np.float32 else np.int64)
+
+    def _cast_counts(self, counts):
+        """Cast integer counts to ``count_dtype`` and other counts to ``dtype``.
+
+        Raises a ValueError if some integer counts do not fit in
+        ``count_dtype``, instead of letting them wrap around.
+        """
+        if counts.dtype.kind not in "biu":
+            return counts.astype(self.dtype)
+        limits = np.iinfo(self.count_dtype)
+        if counts.size and (counts.max() > limits.max or counts.min() < limits.min):
+            raise ValueError(
+                f"The counts do not fit in {self.count_dtype}. "
+                "Please use dtype float64."
+            )
+        return counts.astype(self.count_dtype)
+
+    def _init_weights(self, weights):
+        """Set the name and the matrix of the weights of the q categories."""
+        weights_choices = Weights.schemes()
+        if isinstance(weights, str):
+            if weights not in weights_choices:
+                raise ValueError(f"weights values can be any of {weights_choices}")
+            self.weights_name = weights
+            weights_functions = Weights(list(range(1, self.q + 1)), dtype=self.dtype)
+            self.weights_mat = weights_functions[self.weights_name]
+        else:
+            self.weights_name = "Custom Weights"
+            self.weights_mat = np.asarray(weights, dtype=self.dtype)
+            rows, cols = self.weights_mat.shape
+            if not (rows == self.q and cols == self.q):
+                raise ValueError(
+                    f"Expected weights matrix shape is {self.q}x{self.q}. "
+                    f"Given size is {rows}x{cols}."
+                )
+
+    def _constant(self, value):
+        """The value for every table, in the shape of ``pa``."""
+        return np.full(np.shape(self.pa), value, dtype=self.dtype)[()]
+
+    def _cell_sum(self, scale=0, rows=None, cols=None):
+        """Sum :math:`p_{kl}(w_{kl} - scale (rows_k + cols_l))^2` over the cells."""
+        term = self.weights_mat
+        if rows is not None:
+            scale = np.asarray(scale)[..., np.newaxis, np.newaxis]
+            term = term - scale * (rows[..., :, np.newaxis] + cols[..., np.newaxis, :])
+        return np.sum(self.pkl * term**2, axis=(-2, -1))
+
+    def _variance(self, coeff, pe, sum1):
+        """The variance of a coefficient whose chance agreement depends on the
+        marginals."""
+        return ((1 - self.f) / (self.n * (1 - pe) ** 2)) * (
+            sum1 - (self.pa - 2 * (1 - coeff) * pe) ** 2
+        )
+
+    def _agreement(self, stages, name, coeff, stderr, pa, pe, t_stat):
+        """The results of a coefficient with its p-value and confidence interval."""
+        p_value = 2 * (1 - _t_cdf(t_stat, self.n - 1))
+        lcb, ucb = _t_interval(self.confidence_level, self.n - 1, coeff, stderr)
+        ucb = np.minimum(1, ucb)
+        stages.end("t_distribution")
+        digits = self.digits
+        return self._results(
+            dict(
+                coefficient_value=np.round(coeff, digits),
+                coefficient_name=name,
+                confidence_interval=(np.round(lcb, digits), np.round(ucb, digits)),
+                p_value=np.round(p_value, digits),
+                z=np.round(coeff / stderr, digits),
+                se=np.round(stderr, digits),
+                pa=np.round(pa, digits),
+                pe=np.round(pe, digits),
+            )
+        )
+
+    def _results(self, est):
+        """The results in the format of :class:`CAC`."""
+        return {
+            "est": est,
+            "weights": self.weights_mat,
+            "categories": self.categories,
+        }
+
+    def _estimate(self, coefficient):
+        """The point estimate of a coefficient, without its variance.
+
+        Returns the name of the coefficient, its value, the percent agreement
+        and the percent chance agreement.
+        """
+        pa = self.pa
+        if coefficient == "bp":
+            name = "Brennan-Prediger"
+            pe = self._constant(self.tw / pow(self.q, 2))
+        elif coefficient == "cohen":
+            name = "Cohen's kappa"
+            pe = np.sum(self.pbl_dot * self.p_dot_l, axis=-1)
+        elif coefficient == "gwet":
+            name = "Gwet's AC1" if self.tw == self.q else "Gwet's AC2"
+            scale = self.tw / (self.q * (self.q - 1))
+            pe = scale * np.sum(self.pi_dot_k * (1 - self.pi_dot_k), axis=-1)
+        elif coefficient == "krippendorff":
+            name = "Krippendorff's Alpha"
+            epsi = 1 / (2 * self.n)
+            pa = (1 - epsi) * pa + epsi
+            pe = np.sum(self.pbk * self.pi_dot_k, axis=-1)
+        elif coefficient == "pa2":
+            name = "Percent Agreement"
+            pe = self._constant(0)
+        else:
+            name = "Scott's Pi"
+            pe = np.sum(self.pbk * self.pi_dot_k, axis=-1)
+        return name, (pa - pe) / (1 - pe), pa, pe
+
+    def bp(self):
+        """Brennan and Prediger :cite:p:`BP81` coefficient for 2 raters."""
+        stages = _stages(self, "bp")
+        name, bp_coeff, pa, pe = self._estimate("bp")
+        stages.end("pe")
+        sum1 = self._cell_sum()
+        var_bp = ((1 - self.f) / (self.n * (1 - pe) ** 2)) * (sum1 - self.pa**2)
+        stderr = np.sqrt(var_bp)
+        stages.end("variance")
+        t_stat = np.maximum(bp_coeff, 0) / stderr
+        return self._agreement(stages, name, bp_coeff, stderr, pa, pe, t_stat)
+
+    def cohen(self):
+        """Cohen's kappa coefficient for 2 raters.
+
+        Cohen's kappa :cite:p:`Coh60,Coh68` measures the
+        agreement between two raters who each classify N subjects into :math:`q`
+        mutually exclusive categories.
+        """
+        stages = _stages(self, "cohen")
+        name, kappa, pa, pe = self._estimate("cohen")
+        stages.end("pe")
+        sum1 = self._cell_sum(1 - kappa, self.pb_dot_k, self.pbl_dot)
+        stderr = np.sqrt(self._variance(kappa, pe, sum1))
+        stages.end("variance")
+        t_stat = np.abs(kappa / stderr)
+        return self._agreement(stages, name, kappa, stderr, pa, pe, t_stat)
+
+    def gwet(self):
+        """Gwet's AC1/AC2 coefficient for 2 raters.
+
+        The AC1 coefficient was suggested by Gwet :cite:p:`Gwe08` as a
+        paradox-resistant alternative to Cohen’s Kappa. The percent chance agreement it
+        is defined as the propensity for raters to agree on hard-to-score subjects and
+        is calculated by multiplying the probability to agree when the rating is random
+        by the probability to select a hard-to-score subject.
+
+        The Gwet's AC2 coefficient is the one when using weights for the
+        calculation.
+        """
+        stages = _stages(self, "gwet")
+        name, ac1, pa, pe = self._estimate("gwet")
+        stages.end("pe")
+        pi_dot_k = self.pi_dot_k
+        scale = self.tw / (self.q * (self.q - 1))
+        sum1 = self._cell_sum(
+            2 * (1 - ac1) * scale, (1 - pi_dot_k) / 2, (1 - pi_dot_k) / 2
+        )
+        stderr = np.sqrt(self._variance(ac1, pe, sum1))
+        stages.end("variance")
+        t_stat = np.maximum(ac1, 0) / stderr
+        return self._agreement(stages, name, ac1, stderr, pa, pe, t_stat)
+
+    def krippendorff(self):
+        """Krippendorff’s Alpha :cite:p:`Kri70,Kri80` coefficient for 2 raters.
+
+        .. versionadded:: 0.2.0
+        """
+        stages = _stages(self, "krippendorff")
+        name, kripen_coeff, pa, pe = self._estimate("krippendorff")
+        kcoeff = (self.pa - pe) / (1 - pe)
+        stages.end("pe")
+        sum1 = self._cell_sum(1 - kcoeff, self.pbk, self.pbk)
+        stderr = np.sqrt(self._variance(kcoeff, pe, sum1))
+        stages.end("variance")
+        t_stat = np.maximum(kripen_coeff, 0) / stderr
+        return self._agreement(stages, name, kripen_coeff, stderr, pa, pe, t_stat)
+
+    def pa2(self):
+        r"""Percent Agreement coefficient for 2 raters.
+
+        The percent agreement is defined as
+
+        .. math::
+            p_a = \frac{1}{n} \sum_{i=1}^{n} p_{a|i}, \quad
+            where \quad p_{a|i}=\sum_{k=1}^{q} \frac{r_{ik}(r_{ik}-1)}{r(r-1)}
+
+        with :math:`n` representing the number of subjects, :math:`r` the number of
+        raters, :math:`q` the number of categories, and :math:`r_{ik}` the number of
+        raters who classified subject :math:`i` into category :math:`k`
+        :cite:p:`Gwe16`.
+
+        .. versionadded:: 0.2.0
+        """
+        stages = _stages(self, "pa2")
+        name, pa_coeff, pa, pe = self._estimate("pa2")
+        sum1 = self._cell_sum()
+        var_pa = ((1 - self.f) / self.n) * (sum1 - self.pa**2)
+        stderr = np.sqrt(var_pa)
+        stages.end("variance")
+        t_stat = np.maximum(pa_coeff, 0) / stderr
+        return self._agreement(stages, name, pa_coeff, stderr, pa, pe, t_stat)
+
+    def scott(self):
+        """Scott’s Pi :cite:p:`Sco55` coefficient for 2 raters.
+
+        .. versionadded:: 0.2.0
+        """
+        stages = _stages(self, "scott")
+        name, scott, pa, pe = self._estimate("scott")
+        stages.end("pe")
+        sum1 = self._cell_sum(1 - scott, self.pbk, self.pbk)
+        stderr = np.sqrt(self._variance(scott, pe, sum1))
+        stages.end("variance")
+        t_stat = np.maximum(scott, 0) / stderr
+        return self._agreement(stages, name, scott, stderr, pa, pe, t_stat)
+
+
+class CAC(_Coefficients):
     """ Chance-corrected Agreement Coefficients (CAC)
 
     The following chance-corrected agreement coefficients (CAC) among 2 raters
@@ -73,13 +389,19 @@ class CAC:
 
     Parameters
     ----------
-    ratings : DataFrame
+    ratings : DataFrame, ndarray or sparse array
         A data frame of ratings where each column represents one rater and
-        each row one subject.
+        each row one subject. A :mod:`scipy.sparse` contingency table is
+        counted in :math:`O(nnz + q)` without a dense :math:`q \\times q`
+        array, but only with identity weights.
+
+        .. versionchanged:: 0.5.0
+           Accept NumPy arrays and :mod:`scipy.sparse` contingency tables.
     weights : array-like, ndarray, or str, {"identity", "quadratic", "ordinal",\
     "linear", "radical", "ratio", "circular", "bipolar"}, default: "identity"
         A mandatory parameter that is either a string variable or a matrix.
-        The string describes one of the predefined weights. If this
+        The string describes one of the predefined weights or a custom scheme
+        registered with :meth:`irrCAC.weights.Weights.register`. If this
         parameter is a matrix then it must be a square matrix qxq where q
         is the number of possible categories where a subject can be
         classified. If some of the q possible categories are not used,
@@ -95,51 +417,90 @@ class CAC:
         variance. Its default value is infinity.
     digits : int, default 5
         The number of digits to round the results.
+    dtype : {"float64", "float32"}, default "float64"
+        The floating point type of the weights and of the intermediate
+        arrays. With "float32" the counts are kept in int32, which halves the
+        memory of the :math:`q \\times q` arrays at the cost of some accuracy.
+
+        .. versionadded:: 0.5.0
+    categories : list or None, default None
+        The names of the categories. If None, the index of a data frame is
+        used, or the categories of an array are numbered from 1 to :math:`q`.
+
+        .. versionadded:: 0.5.0
     """
 
     def __init__(
-        self, ratings, weights="identity", confidence_level=0.95, N=np.inf, digits=5
+        self,
+        ratings,
+        weights="identity",
+        confidence_level=0.95,
+        N=np.inf,
+        digits=5,
+        dtype=np.float64,
+        categories=None,
     ):
-        weights_choices = (
-            "identity",
-            "quadratic",
-            "ordinal",
-            "linear",
-            "radical",
-            "ratio",
-            "circular",
-            "bipolar",
-        )
-        if not 0.9 <= confidence_level <= 0.99:
-            raise ValueError("Please provide a value in range [0.90, 0.99].")
-        self.confidence_level = confidence_level
+        self._init_settings(confidence_level, dtype)
+
+        stages = _stages(self, "__init__")
+        self.ratings = ratings
+        self.sparse = _issparse(ratings)
+        if self.sparse:
+            from scipy import sparse
 
-        if ratings.shape[0] != ratings.shape[1]:
+            if not (isinstance(weights, str) and weights == "identity"):
+                raise ValueError(
+                    "Sparse contingency tables support only the identity weights."
+                )
+            self.counts = sparse.coo_array(ratings)
+            # Each cell is stored once, so the diagonal is found by its coordinates.
+            self.counts.sum_duplicates()
+        elif isinstance(ratings, pd.DataFrame):
+            self.counts = ratings.to_numpy()
+            if categories is None:
+                categories = ratings.index.to_list()
+        else:
+            self.counts = np.asarray(ratings)
+        if self.counts.ndim != 2 or self.counts.shape[0] != self.counts.shape[1]:
             raise ValueError(
                 "The contingency table should have the same "
                 "number of rows and columns."
             )
-        self.ratings = ratings
-        self.n = np.sum(ratings.values)
+        self.counts = self._cast_counts(self.counts)
+        stages.end("cleaning")
+        self.n = self.counts.sum().item()
         self.f = self.n / N
-        self.q = len(self.ratings)
-        if isinstance(weights, str):
-            if weights not in weights_choices:
-                raise ValueError(f"weights values can be any of {weights_choices}")
+        self.q = self.counts.shape[0]
+        if categories is None:
+            categories = list(range(1, self.q + 1))
+        elif len(categories) != self.q:
+            raise ValueError(f"Expected {self.q} categories.")
+        stages.end("categories")
+        if self.sparse:
             self.weights_name = weights
-            weights_functions = Weights(list(range(1, len(ratings) + 1)))
-            self.weights_mat = weights_functions[self.weights_name]
+            self.weights_mat = sparse.eye_array(self.q, dtype=self.dtype, format="csr")
         else:
-            self.weights_name = "Custom Weights"
-            self.weights_mat = np.asarray(weights)
-            rows, cols = self.weights_mat.shape
-            if not (rows == self.q and cols == self.q):
-                raise ValueError(
-                    f"Expected weights matrix shape is {self.q}x{self.q}. "
-                    f"Given size is {rows}x{cols}."
-                )
+            self._init_weights(weights)
+        stages.end("weights")
 
-        self.pa = np.sum(self.ratings.values * self.weights_mat / self.n)
+        # The normalized table and its marginals are shared by all coefficients.
+        if self.sparse:
+            pkl = np.divide(self.counts.data, self.n, dtype=self.dtype)
+            self.pkl = sparse.coo_array(
+                (pkl, (self.counts.row, self.counts.col)), shape=self.counts.shape
+            )
+            self.pa = np.sum(pkl[self.pkl.row == self.pkl.col])
+        else:
+            self.pkl = np.divide(self.counts, self.n, dtype=self.dtype)
+            self.pa = np.sum(self.pkl * self.weights_mat)
+        self.pk_dot = np.divide(self.counts.sum(axis=1), self.n, dtype=self.dtype)
+        self.p_dot_l = np.divide(self.counts.sum(axis=0), self.n, dtype=self.dtype)
+        self.pi_dot_k = (self.pk_dot + self.p_dot_l) / 2
+        self.pb_dot_k = self.p_dot_l @ self.weights_mat
+        self.pbl_dot = self.pk_dot @ self.weights_mat
+        self.pbk = (self.pb_dot_k + self.pbl_dot) / 2
+        self.tw = self.weights_mat.sum()
+        stages.end("counts")
         self.digits = digits
         self.agreement = {
             "est": dict(
@@ -152,10 +513,44 @@ class CAC:
                 pa=self.pa,
                 pe=0,
             ),
-            "weights": self.weights_mat,
-            "categories": self.ratings.index.to_list(),
+            "weights": (
+                _identity(self.q, self.dtype) if self.sparse else self.weights_mat
+            ),
+            "categories": list(categories),
         }
 
+    @classmethod
+    def from_pairs(cls, rater1, rater2, categories=None, **kwargs):
+        """Create the coefficients from the paired ratings of two raters.
+
+        The two aligned arrays of ratings are integer-encoded and the
+        :math:`q \\times q` contingency table is counted with a single
+        :func:`numpy.bincount`, without an intermediate cross tabulation.
+        Pairs where any of the two ratings is missing (NaN, None or an empty
+        string) are dropped.
+
+        .. versionadded:: 0.5.0
+
+        Parameters
+        ----------
+        rater1 : array-like
+            The ratings of the first rater. They are the rows of the table.
+        rater2 : array-like
+            The ratings of the second rater, aligned with ``rater1``. They are
+            the columns of the table.
+        categories : list or None, default None
+            The list of all possible categories. If None, the sorted
+            categories of the complete pairs are used.
+        **kwargs
+            Any other parameter of :class:`CAC`.
+
+        Returns
+        -------
+        CAC
+            The coefficients of the contingency table.
+        """
+        return cls(pairs_to_table(rater1, rater2, categories), **kwargs)
+
     def __str__(self):
         subjects = f"Subjects: {self.n}"
         categories = f"Categories: {self.agreement['categories']}"
@@ -167,284 +562,714 @@ class CAC:
     def __repr__(self):
         return self.__str__()
 
-    def bp(self):
-        """Brennan and Prediger :cite:p:`BP81` coefficient for 2 raters."""
+    def _results(self, est):
+        """Keep the estimates and return a copy, which is not changed by the
+        next calls."""
+        self.agreement["est"].update(est)
+        weights = self.agreement["weights"]
+        return {
+            "est": dict(self.agreement["est"]),
+            # The dense identity of a sparse table is a read-only view.
+            "weights": weights if self.sparse else weights.copy(),
+            "categories": list(self.agreement["categories"]),
+        }
 
-        tw = np.sum(self.weights_mat)
-        pe = tw / pow(self.q, 2)
-        bp_coeff = (self.pa - pe) / (1 - pe)
-        pkl = self.ratings.values / self.n
-        sum1 = 0
-        for k in range(self.q):
-            for n in range(self.q):
-                sum1 += pkl[k, n] * self.weights_mat[k, n] ** 2
-        var_bp = ((1 - self.f) / (self.n * (1 - pe) ** 2)) * (sum1 - self.pa**2)
-        stderr = np.sqrt(var_bp)
-        p_value = 2 * (1 - stats.t.cdf(max(bp_coeff, 0) / stderr, self.n - 1))
-        lcb, ucb = stats.t.interval(
-            self.confidence_level, df=self.n - 1, scale=stderr, loc=bp_coeff
-        )
-        ucb = min(1, ucb)
-        self.agreement["est"].update(
-            dict(
-                coefficient_name="Brennan-Prediger",
-                pa=np.round(self.pa, self.digits),
-                pe=np.round(pe, self.digits),
-                se=round(stderr, self.digits),
-                z=round(bp_coeff / stderr, self.digits),
-                coefficient_value=round(bp_coeff, self.digits),
-                confidence_interval=(round(lcb, self.digits), round(ucb, self.digits)),
-                p_value=np.round(p_value, self.digits),
-            )
-        )
-        return deepcopy(self.agreement)
+    def _cell_sum(self, scale=0, rows=None, cols=None):
+        """Sum :math:`p_{kl}(w_{kl} - scale (rows_k + cols_l))^2` over the cells.
 
-    def cohen(self):
-        """Cohen's kappa coefficient for 2 raters.
+        Only the non-zero cells of a sparse table are visited.
+        """
+        if not self.sparse:
+            return super()._cell_sum(scale, rows, cols)
+        k, el = self.pkl.row, self.pkl.col
+        term = (k == el).astype(self.dtype)
+        if rows is not None:
+            term = term - scale * (rows[k] + cols[el])
+        return np.sum(self.pkl.data * term**2)
 
-        Cohen's kappa :cite:p:`Coh60,Coh68` measures the
-        agreement between two raters who each classify N subjects into :math:`q`
-        mutually exclusive categories.
+    def diagnostics(self):
+        r"""Diagnostics of the agreement from the marginals of the table.
+
+        All the diagnostics are unweighted and are computed from the diagonal
+        and the marginals of the normalized table.
+
+        * The prevalence index :math:`|p_{k+} + p_{+k} - 1|`
+          and the bias index :math:`|p_{k+} - p_{+k}|` of each category,
+          computed on the :math:`2 \times 2` table of the category against all
+          others :cite:p:`BBC93`. For two categories they are the indices of the
+          table.
+        * The prevalence-adjusted bias-adjusted kappa (PABAK)
+          :math:`(q p_a - 1) / (q - 1)`.
+        * The maximum attainable Cohen's kappa given the marginals, with
+          :math:`p_a = \sum_k \min(p_{k+}, p_{+k})`.
+        * The specific agreement :math:`2 p_{kk} / (p_{k+} + p_{+k})` of each
+          category.
+
+        .. versionadded:: 0.5.0
+
+        Returns
+        -------
+        dict
+            The diagnostics, with one value per category for the prevalence
+            index, the bias index and the specific agreement.
         """
-        pk_dot = (self.ratings.sum(axis=1) / self.n).values.reshape(-1, 1)
-        p_dot_l = (self.ratings.sum(axis=0) / self.n).values.reshape(-1, 1)
-        pe = np.sum(self.weights_mat * np.matmul(pk_dot, p_dot_l.T))
-        kappa = (self.pa - pe) / (1 - pe)
-        pkl = self.ratings.values / self.n
-        pb_dot_k = (self.weights_mat * p_dot_l).sum(axis=0)
-        pbl_dot = (self.weights_mat * pk_dot).sum(axis=0)
-        sum1 = 0
-        for k in range(self.q):
-            for n in range(self.q):
-                sum1 += (
-                    pkl[k][n]
-                    * (
-                        self.weights_mat[k][n]
-                        - (1 - kappa) * (pb_dot_k[k] + pbl_dot[n])
-                    )
-                    ** 2
-                )
-        var_kappa = ((1 - self.f) / (self.n * (1 - pe) ** 2)) * (
-            sum1 - (self.pa - 2 * (1 - kappa) * pe) ** 2
-        )
-        stderr = np.sqrt(var_kappa)
-        p_value = 2 * (1 - stats.t.cdf(abs(kappa / stderr), self.n - 1))
-        lcb, ucb = stats.t.interval(
-            self.confidence_level, df=self.n - 1, scale=stderr, loc=kappa
-        )
-        ucb = min(1, ucb)
-        self.agreement["est"].update(
-            dict(
-                coefficient_name="Cohen's kappa",
-                pa=np.round(self.pa, self.digits),
-                pe=np.round(pe, self.digits),
-                se=np.round(stderr, self.digits),
-                z=np.round(kappa / stderr, self.digits),
-                coefficient_value=np.round(kappa, self.digits),
-                confidence_interval=(
-                    np.round(lcb, self.digits),
-                    np.round(ucb, self.digits),
-                ),
-                p_value=np.round(p_value, self.digits),
-            )
+        pkk = self.pkl.diagonal()
+        rows, cols = self.pk_dot, self.p_dot_l
+        pa = np.sum(pkk)
+        pe = np.dot(rows, cols)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            specific = 2 * pkk / (rows + cols)
+        return dict(
+            prevalence_index=np.round(np.abs(rows + cols - 1), self.digits),
+            bias_index=np.round(np.abs(rows - cols), self.digits),
+            pabak=np.round((self.q * pa - 1) / (self.q - 1), self.digits),
+            max_kappa=np.round(
+                (np.sum(np.minimum(rows, cols)) - pe) / (1 - pe), self.digits
+            ),
+            specific_agreement=np.round(specific, self.digits),
+            categories=list(self.agreement["categories"]),
         )
-        return deepcopy(self.agreement)
 
-    def gwet(self):
-        """Gwet's AC1/AC2 coefficient for 2 raters.
+    def monte_carlo(self, draws=100000, batch_size=None, n_jobs=None, seed=None):
+        """Monte Carlo p-value of the agreement for small tables.
 
-        The AC1 coefficient was suggested by Gwet :cite:p:`Gwe08` as a
-        paradox-resistant alternative to Cohen’s Kappa. The percent chance agreement it
-        is defined as the propensity for raters to agree on hard-to-score subjects and
-        is calculated by multiplying the probability to agree when the rating is random
-        by the probability to select a hard-to-score subject.
+        The t approximation of the p-values of the coefficients is poor for
+        few subjects. Instead, contingency tables with the same marginals are
+        sampled by shuffling the ratings of the second rater against those of
+        the first, which is the distribution of the table when the raters are
+        independent. With fixed marginals every coefficient is an increasing
+        function of the weighted percent agreement, so the p-value is the same
+        for all of them. As the p-values of the coefficients, it is two-sided:
+        it is the probability of an agreement at least as far from its expected
+        value under independence as the observed one.
 
-        The Gwet's AC2 coefficient is the one when using weights for the
-        calculation.
+        .. versionadded:: 0.5.0
+
+        Parameters
+        ----------
+        draws : int, default 100000
+            The number of sampled tables.
+        batch_size : int or None, default None
+            The number of tables sampled at once. If None, a batch holds about
+            :math:`2^{22}` ratings.
+        n_jobs : int or None, default None
+            The number of processes to share the draws. If None or 1, the draws
+            are done in the current process.
+        seed : int or None, default None
+            The seed of the random generator.
+
+        Returns
+        -------
+        float
+            The estimated two-sided p-value, :math:`(b + 1) / (draws + 1)`,
+            where :math:`b` is the number of sampled tables with an agreement at
+            least as far from the expected one as the observed agreement.
         """
-        pk_dot = (self.ratings.sum(axis=1) / self.n).values.reshape(-1, 1)
-        p_dot_l = (self.ratings.sum(axis=0) / self.n).values.reshape(-1, 1)
-        pi_dot_k = (pk_dot + p_dot_l) / 2
-        tw = np.sum(self.weights_mat)
-        pe = tw * np.sum(pi_dot_k * (1 - pi_dot_k)) / (self.q * (self.q - 1))
-        ac1 = (self.pa - pe) / (1 - pe)
-        pkl = self.ratings.values / self.n
-        sum1 = 0
-        for k in range(self.q):
-            for n in range(self.q):
-                term = self.weights_mat[k, n] - 2 * (1 - ac1) * tw * (
-                    1 - (pi_dot_k[k] + pi_dot_k[n]) / 2
-                ) / (self.q * (self.q - 1))
-                sum1 += pkl[k, n] * (term**2)
-
-        var_gwet = ((1 - self.f) / (self.n * (1 - pe) ** 2)) * (
-            sum1 - (self.pa - 2 * (1 - ac1) * pe) ** 2
-        )
-        stderr = np.sqrt(var_gwet)
-        p_value = 2 * (1 - stats.t.cdf(max(ac1, 0) / stderr, self.n - 1))
-        lcb, ucb = stats.t.interval(
-            self.confidence_level, df=self.n - 1, scale=stderr, loc=ac1
-        )
-        ucb = min(1, ucb)
-        if np.sum(self.weights_mat) == self.q:
-            coeff_name = "Gwet's AC1"
+        if n_jobs is None:
+            n_jobs = 1
+        elif n_jobs < 1:
+            raise ValueError("The `n_jobs` should be a positive integer.")
+        if self.sparse:
+            counts = self.counts.toarray()
         else:
-            coeff_name = "Gwet's AC2"
-        self.agreement["est"].update(
-            dict(
-                coefficient_name=coeff_name,
-                pa=np.round(self.pa, self.digits),
-                pe=np.round(pe, self.digits),
-                se=np.round(stderr, self.digits),
-                z=np.round(ac1 / stderr, self.digits),
-                coefficient_value=np.round(ac1, self.digits),
-                confidence_interval=(
-                    np.round(lcb, self.digits),
-                    np.round(ucb, self.digits),
-                ),
-                p_value=np.round(p_value, self.digits),
-            )
-        )
-        return deepcopy(self.agreement)
+            counts = self.counts
+        if np.any(counts != np.round(counts)):
+            raise ValueError("The Monte Carlo p-value needs a table of counts.")
+        counts = counts.astype(np.int64)
+        q = np.arange(self.q)
+        row_totals, col_totals = counts.sum(axis=1), counts.sum(axis=0)
+        rows = np.repeat(q, row_totals)
+        cols = np.repeat(q, col_totals)
+        if self.weights_name == "identity":
+            weights_mat = None
+            observed = np.trace(counts)
+            expected = row_totals @ col_totals / len(rows)
+        else:
+            weights_mat = np.asarray(self.weights_mat, dtype=np.float64)
+            observed = np.sum(counts * weights_mat)
+            expected = row_totals @ weights_mat @ col_totals / len(rows)
+        # Leave room for the rounding errors of the sums.
+        deviation = abs(observed - expected) - 1e-7
+        if batch_size is None:
+            batch_size = max(1, 2**22 // max(1, len(rows)))
+        seeds = np.random.SeedSequence(seed).spawn(n_jobs)
+        chunks = [draws // n_jobs + (i < draws % n_jobs) for i in range(n_jobs)]
+        args = (rows, cols, weights_mat, expected, deviation, batch_size)
+        if n_jobs == 1:
+            extreme = _permutation_tail(*args, chunks[0], seeds[0])
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                futures = [
+                    executor.submit(_permutation_tail, *args, chunk, chunk_seed)
+                    for chunk, chunk_seed in zip(chunks, seeds)
+                ]
+                extreme = sum(future.result() for future in futures)
+        return round((extreme + 1) / (draws + 1), self.digits)
 
-    def krippendorff(self):
-        """Krippendorff’s Alpha :cite:p:`Kri70,Kri80` coefficient for 2 raters.
+    def posterior(
+        self,
+        coefficient="cohen",
+        draws=10000,
+        prior=1.0,
+        quantiles=(0.025, 0.5, 0.975),
+        batch_size=None,
+        seed=None,
+    ):
+        """Bayesian posterior of a coefficient.
 
-        .. versionadded:: 0.2.0
+        The probabilities of the cells of the table get a Dirichlet posterior,
+        with the counts of the table added to the ``prior`` of each cell. The
+        probabilities are sampled in batches and the point estimate of the
+        coefficient is evaluated on each batch at once with the formulas of
+        :class:`BatchCAC`, for :math:`n` subjects distributed by the sampled
+        probabilities. The variances of the sampled tables are not computed.
+
+        The samples are drawn one after the other from the same random stream,
+        so for a given ``seed`` the results do not depend on ``batch_size``.
+
+        .. versionadded:: 0.5.0
+
+        Parameters
+        ----------
+        coefficient : {"bp", "cohen", "gwet", "krippendorff", "pa2", "scott"},\
+        default "cohen"
+            The name of the method of the coefficient.
+        draws : int, default 10000
+            The number of samples of the posterior.
+        prior : float, default 1.0
+            The concentration of the Dirichlet prior on each cell. With 1 the
+            prior is uniform.
+        quantiles : sequence of float, default (0.025, 0.5, 0.975)
+            The posterior quantiles to compute.
+        batch_size : int or None, default None
+            The number of samples evaluated at once. If None, a batch holds about
+            :math:`2^{22}` cells.
+        seed : int or None, default None
+            The seed of the random generator.
+
+        Returns
+        -------
+        dict
+            The name of the coefficient, the posterior mean and the posterior
+            quantiles.
         """
-        epsi = 1 / (2 * self.n)
-        pa = (1 - epsi) * self.pa + epsi
-        pk_dot = (self.ratings.sum(axis=1) / self.n).values.reshape(-1, 1)
-        p_dot_l = (self.ratings.sum(axis=0) / self.n).values.reshape(-1, 1)
-        pi_dot_k = (pk_dot + p_dot_l) / 2
-        pe = np.sum(self.weights_mat * (pi_dot_k * pi_dot_k.T))
-        kripen_coeff = (pa - pe) / (1 - pe)
-        pkl = self.ratings.values / self.n
-        pb_dot_k = (self.weights_mat * p_dot_l).sum(axis=0)
-        pbl_dot = (self.weights_mat * pk_dot).sum(axis=0)
-        pbk = (pb_dot_k + pbl_dot) / 2
-        kcoeff = (self.pa - pe) / (1 - pe)
-        sum1 = 0
-        for k in range(self.q):
-            for n in range(self.q):
-                sum1 += (
-                    pkl[k][n]
-                    * (self.weights_mat[k][n] - (1 - kcoeff) * (pbk[k] + pbk[n])) ** 2
-                )
-        var_kripp = ((1 - self.f) / (self.n * (1 - pe) ** 2)) * (
-            sum1 - (self.pa - 2 * (1 - kcoeff) * pe) ** 2
-        )
-        stderr = np.sqrt(var_kripp)
-        p_value = 2 * (1 - stats.t.cdf(max(kripen_coeff, 0) / stderr, self.n - 1))
-        lcb, ucb = stats.t.interval(
-            self.confidence_level, df=self.n - 1, scale=stderr, loc=kripen_coeff
+        coefficients = ["bp", "cohen", "gwet", "krippendorff", "pa2", "scott"]
+        if coefficient not in coefficients:
+            raise ValueError(f"coefficient can be any of {coefficients}")
+        if prior <= 0:
+            raise ValueError("The `prior` should be positive.")
+        if self.sparse:
+            raise ValueError("The posterior needs a dense contingency table.")
+        alpha = (self.counts + prior).astype(self.dtype)
+        if batch_size is None:
+            batch_size = max(1, 2**22 // alpha.size)
+        rng = np.random.default_rng(seed)
+        samples = []
+        for start in range(0, draws, batch_size):
+            size = min(batch_size, draws - start)
+            tables = rng.standard_gamma(alpha, size=(size, self.q, self.q))
+            tables *= self.n / tables.sum(axis=(1, 2)).reshape(-1, 1, 1)
+            batch = BatchCAC(tables, weights=self.weights_mat, dtype=self.dtype)
+            name, coeff, _, _ = batch._estimate(coefficient)
+            samples.append(coeff)
+        samples = np.concatenate(samples)
+        values = np.quantile(samples, quantiles)
+        return dict(
+            coefficient_name=name,
+            mean=np.round(np.mean(samples), self.digits),
+            quantiles={
+                quantile: np.round(value, self.digits)
+                for quantile, value in zip(quantiles, values)
+            },
         )
-        ucb = min(1, ucb)
-        self.agreement["est"].update(
-            dict(
-                coefficient_name="Krippendorff's Alpha",
-                pa=np.round(pa, self.digits),
-                pe=np.round(pe, self.digits),
-                se=np.round(stderr, self.digits),
-                z=np.round(kripen_coeff / stderr, self.digits),
-                coefficient_value=np.round(kripen_coeff, self.digits),
-                confidence_interval=(
-                    np.round(lcb, self.digits),
-                    np.round(ucb, self.digits),
-                ),
-                p_value=np.round(p_value, self.digits),
-            )
-        )
-        return deepcopy(self.agreement)
 
-    def pa2(self):
-        r"""Percent Agreement coefficient for 2 raters.
 
-        The percent agreement is defined as
+class BatchCAC(_Coefficients):
+    """Chance-corrected Agreement Coefficients for a stack of contingency tables
 
-        .. math::
-            p_a = \frac{1}{n} \sum_{i=1}^{n} p_{a|i}, \quad
-            where \quad p_{a|i}=\sum_{k=1}^{q} \frac{r_{ik}(r_{ik}-1)}{r(r-1)}
+    The coefficients of :class:`CAC` computed at once for :math:`k` contingency
+    tables with the same categories, such as per day or per pair of raters
+    confusion matrices. Every estimate in the results is an array with one
+    value per table.
 
-        with :math:`n` representing the number of subjects, :math:`r` the number of
-        raters, :math:`q` the number of categories, and :math:`r_{ik}` the number of
-        raters who classified subject :math:`i` into category :math:`k`
-        :cite:p:`Gwe16`.
+    .. versionadded:: 0.5.0
 
-        .. versionadded:: 0.2.0
+    Parameters
+    ----------
+    tables : array-like
+        A :math:`k \\times q \\times q` array of counts, where the rows of each
+        table are the ratings of the first rater and the columns the ratings of
+        the second rater.
+    weights : ndarray, or str, default: "identity"
+        The name of a predefined or registered set of weights, or a
+        :math:`q \\times q` matrix, as in :class:`CAC`.
+    categories : list or None, default None
+        The names of the :math:`q` categories. If None, the categories are
+        numbered from 1 to :math:`q`.
+    confidence_level : float, default 0.95
+        The confidence level associated with the confidence intervals.
+    N : int, default infinity
+        The population size, used for the final population correction to the
+        variance.
+    digits : int, default 5
+        The number of digits to round the results.
+    dtype : {"float64", "float32"}, default "float64"
+        The floating point type of the weights and of the intermediate arrays.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from irrCAC.table import BatchCAC
+    >>> tables = np.array([[[13, 0], [2, 15]], [[10, 3], [4, 13]]])
+    >>> BatchCAC(tables).cohen()["est"]["coefficient_value"]
+    array([0.86667, 0.52915])
+    """
+
+    def __init__(
+        self,
+        tables,
+        weights="identity",
+        categories=None,
+        confidence_level=0.95,
+        N=np.inf,
+        digits=5,
+        dtype=np.float64,
+    ):
+        self._init_settings(confidence_level, dtype)
+
+        self.counts = np.asarray(tables)
+        if self.counts.ndim != 3 or self.counts.shape[1] != self.counts.shape[2]:
+            raise ValueError("The contingency tables should be a kxqxq array.")
+        self.counts = self._cast_counts(self.counts)
+        self.k, self.q = self.counts.shape[:2]
+        if categories is None:
+            categories = list(range(1, self.q + 1))
+        if len(categories) != self.q:
+            raise ValueError(f"Expected {self.q} categories.")
+        self.categories = list(categories)
+        self.N = N
+        self._init_weights(weights)
+
+        self.tw = np.sum(self.weights_mat)
+        self.digits = digits
+        self._update_marginals()
+
+    def __str__(self):
+        tables = f"Tables: {self.k}"
+        categories = f"Categories: {self.categories}"
+        weights_name = f'Weights: "{self.weights_name}"'
+        class_path = f"{BatchCAC.__module__}.{BatchCAC.__name__}"
+        _str = f"{class_path} {tables}, {categories}, {weights_name}"
+        return f"<{_str}>"
+
+    def __repr__(self):
+        return self.__str__()
+
+    def _totals(self):
+        """The row and the column totals of each table."""
+        return self.counts.sum(axis=2), self.counts.sum(axis=1)
+
+    def _update_marginals(self):
+        """Normalize the tables and compute their marginals, one row per table."""
+        rows, cols = self._totals()
+        self.n = rows.sum(axis=1).astype(self.dtype)
+        self.f = self.n / self.N
+        n = self.n.reshape(-1, 1)
+        self.pkl = np.divide(self.counts, n[:, np.newaxis], dtype=self.dtype)
+        self.pk_dot = np.divide(rows, n, dtype=self.dtype)
+        self.p_dot_l = np.divide(cols, n, dtype=self.dtype)
+        self.pi_dot_k = (self.pk_dot + self.p_dot_l) / 2
+        if self.weights_name == "identity":
+            # The weighted marginals are the marginals and the weighted agreement
+            # is on the diagonal.
+            self.pb_dot_k, self.pbl_dot = self.p_dot_l, self.pk_dot
+            self.pa = np.trace(self.pkl, axis1=1, axis2=2)
+        else:
+            self.pb_dot_k = np.matmul(self.p_dot_l, self.weights_mat)
+            self.pbl_dot = np.matmul(self.pk_dot, self.weights_mat)
+            self.pa = np.einsum("kij,ij->k", self.pkl, self.weights_mat)
+        self.pbk = (self.pb_dot_k + self.pbl_dot) / 2
+
+
+class Accumulator(_Coefficients):
+    """Incremental contingency table of two raters
+
+    The pairs of ratings are counted batch by batch. The row and the column
+    totals and the weighted agreement of the table are updated with each pair,
+    so a batch of :math:`m` pairs costs :math:`O(m + q)`, and a batch of more
+    pairs than cells is counted with one :func:`numpy.bincount`. The
+    coefficients of :class:`CAC`, such as :meth:`cohen` and :meth:`gwet`, are
+    available at any time for the pairs seen so far. They normalize the table
+    when they are computed, which costs :math:`O(q^2)`. With identity weights
+    the point estimates need only the agreement and the marginals, in
+    :math:`O(q)`, and the variances one product of the table with a vector.
+
+    The counts are always 64-bit integers, so that a long stream of pairs
+    does not overflow them.
+
+    .. versionadded:: 0.5.0
+
+    Parameters
+    ----------
+    categories : list
+        The list of all possible categories.
+    weights : ndarray, or str, default: "identity"
+        The name of a predefined or registered set of weights, or a
+        :math:`q \\times q` matrix, as in :class:`CAC`.
+    confidence_level : float, default 0.95
+        The confidence level associated with the confidence intervals.
+    N : int, default infinity
+        The population size, used for the final population correction to the
+        variance.
+    digits : int, default 5
+        The number of digits to round the results.
+    dtype : {"float64", "float32"}, default "float64"
+        The floating point type of the weights and of the intermediate arrays.
+
+    Examples
+    --------
+    >>> from irrCAC.table import Accumulator
+    >>> accumulator = Accumulator(["a", "b"])
+    >>> accumulator.update(["a", "a", "b"], ["a", "b", "b"])
+    <irrCAC.table.Accumulator Pairs: 3, Categories: ['a', 'b'], Weights: "identity">
+    >>> float(accumulator.pa2()["est"]["pa"])
+    0.66667
+    """
+
+    def __init__(
+        self,
+        categories,
+        weights="identity",
+        confidence_level=0.95,
+        N=np.inf,
+        digits=5,
+        dtype=np.float64,
+    ):
+        self._init_settings(confidence_level, dtype)
+        self.categories = list(categories)
+        self.index = pd.Index(self.categories)
+        if not self.index.is_unique:
+            raise ValueError("The categories should be unique.")
+        self.q = len(self.categories)
+        self._init_weights(weights)
+        self.tw = np.sum(self.weights_mat)
+        self.N = N
+        self.digits = digits
+        self._counts = np.zeros((self.q, self.q), dtype=np.int64)
+        self._row_totals = np.zeros(self.q, dtype=np.int64)
+        self._col_totals = np.zeros(self.q, dtype=np.int64)
+        # The sum of the weights of the counted pairs.
+        self._agreement_total = 0.0
+        # The factor from the stored totals to the counts of the pairs.
+        self._scale = 1
+
+    def __str__(self):
+        pairs = f"Pairs: {self._row_totals.sum() * self._scale}"
+        categories = f"Categories: {self.categories}"
+        weights_name = f'Weights: "{self.weights_name}"'
+        class_path = f"{type(self).__module__}.{type(self).__name__}"
+        _str = f"{class_path} {pairs}, {categories}, {weights_name}"
+        return f"<{_str}>"
+
+    def __repr__(self):
+        return self.__str__()
+
+    @property
+    def counts(self):
+        """The table of the counts of the pairs."""
+        return self._counts * self._scale
+
+    @property
+    def row_totals(self):
+        """The number of pairs in each row of the table."""
+        return self._row_totals * self._scale
+
+    @property
+    def col_totals(self):
+        """The number of pairs in each column of the table."""
+        return self._col_totals * self._scale
+
+    @property
+    def n(self):
+        """The number of counted pairs."""
+        return np.asarray(self._row_totals.sum() * self._scale, dtype=self.dtype)[()]
+
+    @property
+    def f(self):
+        return self.n / self.N
+
+    @property
+    def pa(self):
+        total = self._row_totals.sum()
+        return np.asarray(self._agreement_total / total, dtype=self.dtype)[()]
+
+    @property
+    def pkl(self):
+        return np.divide(self._counts, self._row_totals.sum(), dtype=self.dtype)
+
+    @property
+    def pk_dot(self):
+        return np.divide(self._row_totals, self._row_totals.sum(), dtype=self.dtype)
+
+    @property
+    def p_dot_l(self):
+        return np.divide(self._col_totals, self._row_totals.sum(), dtype=self.dtype)
+
+    @property
+    def pi_dot_k(self):
+        return (self.pk_dot + self.p_dot_l) / 2
+
+    @property
+    def pb_dot_k(self):
+        if self.weights_name == "identity":
+            return self.p_dot_l
+        return self.p_dot_l @ self.weights_mat
+
+    @property
+    def pbl_dot(self):
+        if self.weights_name == "identity":
+            return self.pk_dot
+        return self.pk_dot @ self.weights_mat
+
+    @property
+    def pbk(self):
+        if self.weights_name == "identity":
+            return self.pi_dot_k
+        return self.pi_dot_k @ self.weights_mat
+
+    def _cell_sum(self, scale=0, rows=None, cols=None):
+        """Sum :math:`p_{kl}(w_{kl} - scale (rows_k + cols_l))^2` over the cells.
+
+        With identity weights the sum is expanded into the diagonal, the
+        marginals and one product of the table with ``rows`` and ``cols``, so
+        no :math:`q \\times q` arrays are built.
         """
-        pkl = self.ratings.values / self.n
-        sum1 = 0
-        for k in range(self.q):
-            for n in range(self.q):
-                sum1 += pkl[k][n] * self.weights_mat[k][n] ** 2
-        var_pa = ((1 - self.f) / self.n) * (sum1 - self.pa**2)
-        stderr = np.sqrt(var_pa)
-        p_value = 2 * (1 - stats.t.cdf(max(self.pa, 0) / stderr, self.n - 1))
-        lcb, ucb = stats.t.interval(
-            self.confidence_level, df=self.n - 1, scale=stderr, loc=self.pa
-        )
-        ucb = min(1, ucb)
-        self.agreement["est"].update(
-            dict(
-                coefficient_name="Percent Agreement",
-                pa=np.round(self.pa, self.digits),
-                pe=0,
-                se=np.round(stderr, self.digits),
-                z=np.round(self.pa / stderr, self.digits),
-                coefficient_value=np.round(self.pa, self.digits),
-                confidence_interval=(
-                    np.round(lcb, self.digits),
-                    np.round(ucb, self.digits),
-                ),
-                p_value=np.round(p_value, self.digits),
-            )
-        )
-        return deepcopy(self.agreement)
+        if self.weights_name != "identity":
+            return super()._cell_sum(scale, rows, cols)
+        if rows is None:
+            return self.pa
+        total = self._row_totals.sum()
+        diagonal = np.divide(np.diagonal(self._counts), total, dtype=self.dtype)
+        cross = rows @ np.divide(self._counts @ cols, total, dtype=self.dtype)
+        squares = self.pk_dot @ rows**2 + self.p_dot_l @ cols**2 + 2 * cross
+        return self.pa - 2 * scale * (diagonal @ (rows + cols)) + scale**2 * squares
 
-    def scott(self):
-        """Scott’s Pi :cite:p:`Sco55` coefficient for 2 raters.
+    def update(self, rater1, rater2):
+        """Count a batch of paired ratings.
 
-        .. versionadded:: 0.2.0
+        Pairs where any of the two ratings is missing are dropped.
+
+        Parameters
+        ----------
+        rater1 : array-like
+            The ratings of the first rater, counted in the rows of the table.
+        rater2 : array-like
+            The ratings of the second rater, aligned with ``rater1`` and counted
+            in the columns of the table.
+
+        Returns
+        -------
+        Accumulator
+            The accumulator itself, to chain the calls.
         """
-        pk_dot = (self.ratings.sum(axis=1) / self.n).values.reshape(-1, 1)
-        p_dot_l = (self.ratings.sum(axis=0) / self.n).values.reshape(-1, 1)
-        pi_dot_k = (pk_dot + p_dot_l) / 2
-        pe = np.sum(self.weights_mat * (pi_dot_k * pi_dot_k.T))
-        scott = (self.pa - pe) / (1 - pe)
-        pkl = self.ratings.values / self.n
-        pb_dot_k = (self.weights_mat * p_dot_l).sum(axis=0)
-        pbl_dot = (self.weights_mat * pk_dot).sum(axis=0)
-        pbk = (pb_dot_k + pbl_dot) / 2
-        sum1 = 0
-        for k in range(self.q):
-            for n in range(self.q):
-                sum1 += (
-                    pkl[k][n]
-                    * (self.weights_mat[k][n] - (1 - scott) * (pbk[k] + pbk[n])) ** 2
-                )
-        var_scott = ((1 - self.f) / (self.n * (1 - pe) ** 2)) * (
-            sum1 - (self.pa - 2 * (1 - scott) * pe) ** 2
+        rows, cols = self._complete_pairs(rater1, rater2)
+        self._add_pairs(rows, cols)
+        return self
+
+    def reset(self):
+        """Remove all the counted pairs."""
+        self._counts[:] = 0
+        self._row_totals[:] = 0
+        self._col_totals[:] = 0
+        self._agreement_total = 0.0
+        self._scale = 1
+
+    def _complete_pairs(self, rater1, rater2):
+        """The rows and the columns of the cells of the complete pairs."""
+        _, (rows, cols) = encode_ratings([rater1, rater2], self.index)
+        complete = (rows < self.q) & (cols < self.q)
+        return rows[complete], cols[complete]
+
+    def _add_pairs(self, rows, cols, weights=1):
+        """Add the pairs, with a count of ``weights`` each, to the totals."""
+        q = self.q
+        # A scalar count multiplies the number of pairs, so that integer
+        # counts stay integers.
+        scalar = np.ndim(weights) == 0
+        counts = None if scalar else weights
+        if len(rows) >= q * q:
+            cells = rows.astype(np.int64) * q + cols
+            table = np.bincount(cells, counts, minlength=q * q).reshape(q, q)
+            self._counts += table * weights if scalar else table
+        else:
+            # Fewer pairs than cells are added one by one.
+            np.add.at(self._counts, (rows, cols), weights)
+        for totals, positions in [(self._row_totals, rows), (self._col_totals, cols)]:
+            added = np.bincount(positions, counts, minlength=q)
+            totals += added * weights if scalar else added
+        self._agreement_total += np.sum(
+            self.weights_mat[rows, cols] * weights, dtype=np.float64
         )
-        stderr = np.sqrt(var_scott)
-        p_value = 2 * (1 - stats.t.cdf(max(scott, 0) / stderr, self.n - 1))
-        lcb, ucb = stats.t.interval(
-            self.confidence_level, df=self.n - 1, scale=stderr, loc=scott
+
+
+class WindowAccumulator(Accumulator):
+    """Agreement of two raters over their most recent pairs of ratings
+
+    Either only the last ``window`` complete pairs are counted, or the count of
+    each pair decays exponentially as :math:`2^{-a/h}`, where :math:`a` is the
+    number of complete pairs counted after it and :math:`h` is the
+    ``half_life``. With decay, the number of subjects used for the standard
+    errors is the sum of the decayed counts.
+
+    The window keeps the table cell of each of its pairs in a ring buffer,
+    which is used to remove the pairs that leave the window. In both cases
+    the totals of the table are updated per pair, so a batch of :math:`m`
+    pairs costs :math:`O(m)` amortized.
+
+    .. versionadded:: 0.5.0
+
+    Parameters
+    ----------
+    categories : list
+        The list of all possible categories.
+    window : int or None, default None
+        The number of most recent pairs to count.
+    half_life : float or None, default None
+        The number of pairs after which the count of a pair is halved.
+    weights : ndarray, or str, default: "identity"
+        The name of a predefined or registered set of weights, or a
+        :math:`q \\times q` matrix, as in :class:`CAC`.
+    confidence_level : float, default 0.95
+        The confidence level associated with the confidence intervals.
+    N : int, default infinity
+        The population size, used for the final population correction to the
+        variance.
+    digits : int, default 5
+        The number of digits to round the results.
+    dtype : {"float64", "float32"}, default "float64"
+        The floating point type of the weights and of the intermediate arrays.
+
+    Examples
+    --------
+    >>> from irrCAC.table import WindowAccumulator
+    >>> accumulator = WindowAccumulator(["a", "b"], window=4)
+    >>> accumulator = accumulator.update(["a", "a", "b", "b"], ["b", "a", "b", "b"])
+    >>> accumulator = accumulator.update(["a", "b"], ["a", "a"])
+    >>> float(accumulator.n), float(accumulator.pa2()["est"]["pa"])
+    (4.0, 0.75)
+    """
+
+    def __init__(
+        self,
+        categories,
+        window=None,
+        half_life=None,
+        weights="identity",
+        confidence_level=0.95,
+        N=np.inf,
+        digits=5,
+        dtype=np.float64,
+    ):
+        if (window is None) == (half_life is None):
+            raise ValueError("Please provide one of `window` or `half_life`.")
+        if window is not None and window < 1:
+            raise ValueError("The `window` should be a positive integer.")
+        if half_life is not None and half_life <= 0:
+            raise ValueError("The `half_life` should be positive.")
+        super().__init__(
+            categories,
+            weights=weights,
+            confidence_level=confidence_level,
+            N=N,
+            digits=digits,
+            dtype=dtype,
         )
-        ucb = min(1, ucb)
-        self.agreement["est"].update(
-            dict(
-                coefficient_name="Scott's Pi",
-                pa=np.round(self.pa, self.digits),
-                pe=0,
-                se=np.round(stderr, self.digits),
-                z=np.round(scott / stderr, self.digits),
-                coefficient_value=np.round(scott, self.digits),
-                confidence_interval=(
-                    np.round(lcb, self.digits),
-                    np.round(ucb, self.digits),
-                ),
-                p_value=np.round(p_value, self.digits),
+        self.window = window
+        self.half_life = half_life
+        if window is not None:
+            # The rows and the columns of the pairs in the window, with -1 for
+            # the empty slots.
+            self._rows = np.full(window, -1, dtype=np.int64)
+            self._cols = np.full(window, -1, dtype=np.int64)
+            self._position = 0
+        else:
+            self.decay = 0.5 ** (1 / half_life)
+            # The decayed counts are not integers.
+            self._counts = self._counts.astype(np.float64)
+            self._row_totals = self._row_totals.astype(np.float64)
+            self._col_totals = self._col_totals.astype(np.float64)
+            # The number of pairs counted since the stored totals were last
+            # decayed, and the most pairs between two decays of the totals.
+            self._age = 0
+            self._max_age = max(int(_MAX_HALF_LIVES * half_life), 1)
+
+    def update(self, rater1, rater2):
+        """Count a batch of paired ratings as the most recent ones.
+
+        Pairs where any of the two ratings is missing are dropped.
+
+        Parameters
+        ----------
+        rater1 : array-like
+            The ratings of the first rater, counted in the rows of the table.
+        rater2 : array-like
+            The ratings of the second rater, aligned with ``rater1`` and counted
+            in the columns of the table.
+
+        Returns
+        -------
+        WindowAccumulator
+            The accumulator itself, to chain the calls.
+        """
+        rows, cols = self._complete_pairs(rater1, rater2)
+        if self.window is None:
+            self._add_decayed(rows, cols)
+        else:
+            # Only the most recent pairs of the batch can be in the window.
+            rows, cols = (
+                rows[slice(-self.window, None)],
+                cols[slice(-self.window, None)],
             )
-        )
-        return deepcopy(self.agreement)
+            slots = (self._position + np.arange(len(rows))) % self.window
+            evicted = slots[self._rows[slots] >= 0]
+            self._add_pairs(self._rows[evicted], self._cols[evicted], -1)
+            self._rows[slots], self._cols[slots] = rows, cols
+            self._position = (self._position + len(rows)) % self.window
+            self._add_pairs(rows, cols)
+        return self
+
+    def reset(self):
+        """Remove all the counted pairs."""
+        super().reset()
+        if self.window is not None:
+            self._rows[:] = -1
+            self._cols[:] = -1
+            self._position = 0
+        else:
+            self._age = 0
+
+    def _add_decayed(self, rows, cols):
+        """Add the pairs, in their order, to the decayed totals.
+
+        Instead of decaying all the counts with each new pair, the stored
+        count of a new pair grows as :math:`2^{a/h}`, where :math:`a` is the
+        number of pairs counted after the last decay of the stored totals,
+        and ``_scale`` decays the stored totals to the counts. The stored
+        totals are decayed only when :math:`a` would exceed ``_max_age``, so
+        each pair costs :math:`O(1)` amortized. Pairs older than ``_max_age``
+        within a batch have counts below :math:`2^{-512}` and are dropped.
+        """
+        pairs = len(rows)
+        dropped = max(pairs - self._max_age, 0)
+        if dropped or self._age + pairs > self._max_age:
+            factor = self.decay ** (self._age + dropped)
+            self._counts *= factor
+            self._row_totals *= factor
+            self._col_totals *= factor
+            self._agreement_total *= factor
+            self._age = 0
+            rows, cols = rows[dropped:], cols[dropped:]
+        ages = self._age + 1 + np.arange(len(rows))
+        self._add_pairs(rows, cols, self.decay ** (-ages.astype(np.float64)))
+        self._age += len(rows)
+        self._scale = self.decay**self._age
@@ -2,8 +2,17 @@
 coefficients.
 """
 
+import sys
+from collections import OrderedDict
+
 import numpy as np
-import pandas as pd
+
+
+def _is_data_frame(value):
+    # A data frame can only be given once pandas is imported, so the check
+    # does not import it.
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(value, pd.DataFrame)
 
 
 class Weights:
@@ -19,9 +28,31 @@ class Weights:
     * quadratic
     * radial
     * ratio
+    * taxonomy
+
+    Custom schemes can be registered by name with :meth:`register` and are then
+    available everywhere a predefined scheme name is accepted.
     """
 
-    def __init__(self, categories):
+    _builtin = (
+        "identity",
+        "quadratic",
+        "ordinal",
+        "linear",
+        "radical",
+        "ratio",
+        "circular",
+        "bipolar",
+    )
+    _registry = {}
+    # The evaluated weights matrices, shared by all the instances, with the
+    # least recently used first. The cache holds at most `_cache_bytes` and
+    # larger matrices are not cached.
+    _cache = OrderedDict()
+    _cache_bytes = 2**26
+    _cache_used = 0
+
+    def __init__(self, categories, dtype=np.float64):
         """Initialize a `Weights` class based on the rating categories.
 
         Parameters
@@ -31,6 +62,10 @@ class Weights:
             ratings. If the `categories` has numerical values, the vector is
             sorted. If the `categories` are categorical labels, the vector is
             a sequence of numbers in range `1…len(categories)`.
+        dtype : {"float64", "float32"}, default "float64"
+            The floating point type of the weights matrices.
+
+            .. versionadded:: 0.5.0
 
         Raises
         ------
@@ -38,11 +73,12 @@ class Weights:
 
             * The provided value for `categories` is not one of a list, a numpy
               array or a pandas dataframe.
+            * The `dtype` is not a float32 or float64 type.
             * Giving an unknown name of weights type.
         """
         if isinstance(categories, list):
             self.q = len(categories)
-        elif isinstance(categories, (np.ndarray, pd.DataFrame)):
+        elif isinstance(categories, np.ndarray) or _is_data_frame(categories):
             self.q = categories.shape[-1]
         else:
             raise ValueError(
@@ -51,11 +87,18 @@ class Weights:
             )
         if all(isinstance(n, (int, float)) for n in categories):
             self.categ_vec = sorted(categories)
+            self.categ_values = self.categ_vec
         else:
             self.categ_vec = list(range(1, len(categories) + 1))
+            self.categ_values = list(categories)
         self.xmin, self.xmax = min(self.categ_vec), max(self.categ_vec)
+        self.dtype = np.dtype(dtype)
+        if self.dtype not in (np.float32, np.float64):
+            raise ValueError("`dtype` can be any of float32 or float64.")
 
     def __getitem__(self, item):
+        if item in self._registry:
+            return self.custom(item)
         if item == "bipolar":
             return self.bipolar()
         elif item == "circular":
@@ -78,6 +121,184 @@ class Weights:
     def __str__(self):
         return f"Weights for {self.q} categories."
 
+    @classmethod
+    def register(cls, name, func=None):
+        r"""Register a custom weights scheme under a name.
+
+        The function is evaluated once, with broadcasting, on the category
+        values: it receives a column vector and a row vector of the values
+        and must return a :math:`q \times q` matrix of weights. The result is
+        cached unless it is large, so repeated calls for the same categories do
+        not evaluate the function again. Once registered, the name can be used
+        as ``CAC(ratings, weights=name)``.
+
+        The method can also be used as a decorator.
+
+        >>> import numpy as np
+        >>> from irrCAC.weights import Weights
+        >>> @Weights.register("exponential")
+        ... def exponential(k, el):
+        ...     return np.exp(-abs(k - el))
+        >>> np.round(Weights([1, 2, 3])["exponential"], 3)
+        array([[1.   , 0.368, 0.135],
+               [0.368, 1.   , 0.368],
+               [0.135, 0.368, 1.   ]])
+        >>> Weights.unregister("exponential")
+
+        Parameters
+        ----------
+        name : str
+            The name of the scheme. It cannot be the name of a predefined
+            scheme.
+        func : callable, optional
+            A vectorized function ``func(k, el)`` of the category values. For
+            numerical categories the values are the sorted categories,
+            otherwise they are the category labels.
+
+        Raises
+        ------
+        ValueError
+            If `name` is a predefined scheme or `func` is not callable.
+        """
+        if name in cls._builtin:
+            raise ValueError(f'"{name}" is a predefined type of weights.')
+
+        def decorator(function):
+            if not callable(function):
+                raise ValueError("The weights function should be callable.")
+            cls._registry[name] = function
+            cls._clear_cache(name)
+            return function
+
+        if func is None:
+            return decorator
+        return decorator(func)
+
+    @classmethod
+    def unregister(cls, name):
+        """Remove a custom weights scheme registered with :meth:`register`.
+
+        Parameters
+        ----------
+        name : str
+            The name of the scheme.
+
+        Raises
+        ------
+        KeyError
+            If there is no custom scheme with that name.
+        """
+        del cls._registry[name]
+        cls._clear_cache(name)
+
+    @classmethod
+    def schemes(cls):
+        """The names of all the predefined and the registered weights schemes.
+
+        Returns
+        -------
+        tuple
+            The valid values for the `weights` parameter of the coefficients.
+        """
+        return cls._builtin + tuple(cls._registry)
+
+    @classmethod
+    def _clear_cache(cls, name):
+        for key in [key for key in cls._cache if key[0] == name]:
+            cls._cache_used -= cls._cache.pop(key).nbytes
+
+    @classmethod
+    def _store(cls, key, weights):
+        """Cache a weights matrix, removing the least recently used ones to keep
+        the cache within `_cache_bytes`."""
+        if weights.nbytes > cls._cache_bytes:
+            return
+        cls._cache[key] = weights
+        cls._cache_used += weights.nbytes
+        while cls._cache_used > cls._cache_bytes:
+            _, removed = cls._cache.popitem(last=False)
+            cls._cache_used -= removed.nbytes
+
+    def custom(self, name):
+        r"""Function for computing the weights of a registered scheme.
+
+        Parameters
+        ----------
+        name : str
+            The name used to register the scheme.
+
+        Returns
+        -------
+        :math:`\mathbb{R}^{q \times q}` matrix
+            A read-only square matrix of weights to be used for calculating the
+            weighted coefficients.
+
+        Raises
+        ------
+        ValueError
+            If the function does not return a :math:`q \times q` matrix.
+        """
+        return self._evaluate(name, self._registry[name])
+
+    def taxonomy(self, parents):
+        r"""Function for computing the Taxonomy Weights
+
+        When the categories are the nodes of a hierarchy, the weights give
+        partial credit according to the distance of two categories in the tree.
+        The taxonomy weights of a matrix
+        :math:`\mathbf{W} \in \mathbb{R}^{q \times q}` are defined for each cell
+        :math:`w_{kl}, (k,l=1, \ldots, q)` by
+
+        .. math::
+            w_{kl} = 1 - \frac{d(k, l)}{\max_{k,l} d(k, l)}
+
+        where :math:`d(k, l)` is the number of edges in the path between the
+        categories :math:`k` and :math:`l` through their lowest common ancestor.
+        The matrix is cached unless it is large, so reusing the same
+        :class:`Taxonomy` object does not compute the distances again.
+
+        .. versionadded:: 0.5.0
+
+        Parameters
+        ----------
+        parents : dict or Taxonomy
+            The taxonomy as a mapping from each node to its parent, with `None`
+            as the parent of a root, or a precomputed :class:`Taxonomy`.
+
+        Returns
+        -------
+        :math:`\mathbb{R}^{q \times q}` matrix
+            A read-only square matrix of taxonomy weights to be used for
+            calculating the weighted coefficients.
+        """
+        if not isinstance(parents, Taxonomy):
+            parents = Taxonomy(parents)
+        return self._evaluate(parents, parents)
+
+    def _evaluate(self, name, func):
+        """Evaluate a vectorized weights function on the categories, once."""
+        key = (name, tuple(self.categ_values), self.dtype)
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+        values = np.asarray(self.categ_values)
+        weights = np.asarray(
+            func(values[:, np.newaxis], values[np.newaxis, :]), dtype=self.dtype
+        )
+        if weights.shape != (self.q, self.q):
+            raise ValueError(
+                f'Weights "{name}" should be a {self.q}x{self.q} matrix. '
+                f"Got shape {weights.shape}."
+            )
+        weights.flags.writeable = False
+        self._store(key, weights)
+        return weights
+
+    def _grid(self):
+        """The category values as a column and a row vector for broadcasting."""
+        values = np.asarray(self.categ_vec, dtype=self.dtype)
+        return values[:, np.newaxis], values[np.newaxis, :]
+
     def bipolar(self):
         r"""Function for computing the Bipolar Weights
 
@@ -97,16 +318,12 @@ class Weights:
             A square matrix of bipolar weights to be used for calculating the
             weighted coefficients.
         """
-        weights = np.eye(self.q)
-        for k in range(self.q):
-            for el in range(self.q):
-                if k != el:
-                    weights[k][el] = pow(self.categ_vec[k] - self.categ_vec[el], 2) / (
-                        (self.categ_vec[k] + self.categ_vec[el] - 2 * self.xmin)
-                        * (2 * self.xmax - self.categ_vec[k] - self.categ_vec[el])
-                    )
-                else:
-                    weights[k][el] = 0
+        k, el = self._grid()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = (k - el) ** 2 / (
+                (k + el - 2 * self.xmin) * (2 * self.xmax - k - el)
+            )
+        np.fill_diagonal(weights, 0)
         weights = 1 - weights / np.max(weights)
         return weights
 
@@ -128,13 +345,9 @@ class Weights:
             A square matrix of circular weights to be used for calculating the
             weighted coefficients.
         """
-        weights = np.eye(self.q)
+        k, el = self._grid()
         U = self.xmax - self.xmin + 1
-        for k in range(self.q):
-            for el in range(self.q):
-                weights[k][el] = pow(
-                    np.sin(np.pi * (self.categ_vec[k] - self.categ_vec[el]) / U), 2
-                )
+        weights = np.sin(np.pi * (k - el) / U) ** 2
         weights = 1 - weights / np.max(weights)
         return weights
 
@@ -153,7 +366,7 @@ class Weights:
             A square matrix of identity weights to be used for calculating the
             weighted coefficients.
         """
-        weights = np.eye(self.q)
+        weights = np.eye(self.q, dtype=self.dtype)
         return weights
 
     def linear(self):
@@ -172,12 +385,8 @@ class Weights:
             A square matrix of linear weights to be used for calculating the
             weighted coefficients.
         """
-        weights = np.eye(self.q)
-        for k in range(self.q):
-            for el in range(self.q):
-                weights[k][el] = 1 - abs(self.categ_vec[k] - self.categ_vec[el]) / abs(
-                    self.xmax - self.xmin
-                )
+        k, el = self._grid()
+        weights = 1 - np.abs(k - el) / abs(self.xmax - self.xmin)
         return weights
 
     def ordinal(self):
@@ -197,11 +406,9 @@ class Weights:
             A square matrix of ordinal weights to be used for calculating the
             weighted coefficients.
         """
-        weights = np.eye(self.q)
-        for k in range(self.q):
-            for el in range(self.q):
-                nkl = max(k, el) - min(k, el) + 1
-                weights[k][el] = nkl * (nkl - 1) / 2
+        index = np.arange(self.q, dtype=self.dtype)
+        nkl = np.abs(index[:, np.newaxis] - index[np.newaxis, :]) + 1
+        weights = nkl * (nkl - 1) / 2
         weights = 1 - weights / np.max(weights)
         return weights
 
@@ -221,13 +428,9 @@ class Weights:
             A square matrix of quadratic weights to be used for calculating the
             weighted coefficients.
         """
-        weights = np.eye(self.q)
+        k, el = self._grid()
         diff = self.xmax - self.xmin
-        for k in range(self.q):
-            for el in range(self.q):
-                weights[k][el] = 1 - pow(
-                    (self.categ_vec[k] - self.categ_vec[el]) / diff, 2
-                )
+        weights = 1 - ((k - el) / diff) ** 2
         return weights
 
     def radical(self):
@@ -248,12 +451,8 @@ class Weights:
             A square matrix of radical weights to be used for calculating the
             weighted coefficients.
         """
-        weights = np.eye(self.q)
-        for k in range(self.q):
-            for el in range(self.q):
-                weights[k][el] = 1 - np.sqrt(
-                    abs(self.categ_vec[k] - self.categ_vec[el])
-                ) / np.sqrt(abs(self.xmax - self.xmin))
+        k, el = self._grid()
+        weights = 1 - np.sqrt(np.abs(k - el)) / abs(self.xmax - self.xmin) ** 0.5
         return weights
 
     def ratio(self):
@@ -287,14 +486,223 @@ class Weights:
                 " 0 as a category because it produce a"
                 " division by 0."
             )
-        weights = np.eye(self.q)
-        for k in range(self.q):
-            for el in range(self.q):
-                weights[k][el] = 1 - (
-                    pow(
-                        (self.categ_vec[k] - self.categ_vec[el])
-                        / (self.categ_vec[k] + self.categ_vec[el]),
-                        2,
-                    )
-                ) / pow((self.xmax - self.xmin) / (self.xmax + self.xmin), 2)
+        k, el = self._grid()
+        weights = (
+            1
+            - ((k - el) / (k + el)) ** 2
+            / ((self.xmax - self.xmin) / (self.xmax + self.xmin)) ** 2
+        )
         return weights
+
+
+class Taxonomy:
+    """Tree distances between the nodes of a taxonomy.
+
+    The tree is flattened once into its Euler tour. The depth of the lowest
+    common ancestor (LCA) of two nodes is the minimum depth of the tour between
+    their first occurrences, so all the distances of one category to the
+    others are computed with a single running minimum over the tour, in
+    :math:`O(m)` time for :math:`m` nodes. Arbitrary pairs of nodes are
+    answered in constant time from a sparse table of range minima over the
+    tour, which is built in :math:`O(m \\log m)` time.
+
+    A `Taxonomy` is a vectorized weights function, so it can be registered as a
+    named scheme with :meth:`Weights.register`.
+
+    >>> from irrCAC.weights import Taxonomy
+    >>> animals = Taxonomy(
+    ...     {"animal": None, "cat": "animal", "lion": "cat", "tiger": "cat",
+    ...      "dog": "animal", "wolf": "dog"})
+    >>> animals.distance("lion", ["tiger", "wolf", "animal"])
+    array([2, 4, 2])
+
+    .. versionadded:: 0.5.0
+
+    Parameters
+    ----------
+    parents : dict
+        A mapping from each node to its parent. Roots have `None` as parent or
+        appear only as a parent. A forest is joined under a virtual root.
+
+    Raises
+    ------
+    ValueError
+        If the parents contain a cycle.
+    """
+
+    _block_size = 2**22
+
+    def __init__(self, parents):
+        import pandas as pd
+
+        self.parents = dict(parents)
+        nodes = list(self.parents)
+        nodes += [p for p in self.parents.values() if p is not None]
+        self.nodes = pd.Index(list(dict.fromkeys(nodes)))
+        m = len(self.nodes)
+        # Index `m` is the virtual root of all the trees.
+        parent = np.full(m + 1, m)
+        parent[m] = -1
+        children = [child for child, p in self.parents.items() if p is not None]
+        parent[self.nodes.get_indexer(children)] = self.nodes.get_indexer(
+            [self.parents[child] for child in children]
+        )
+        order = np.argsort(parent, kind="stable")
+        starts = np.searchsorted(parent[order], np.arange(m + 2)).tolist()
+        order = order.tolist()
+
+        depth = [0] * (m + 1)
+        first = [0] * (m + 1)
+        euler = [m]
+        nxt = starts[:-1]
+        stack = [m]
+        while stack:
+            node = stack[-1]
+            if nxt[node] < starts[node + 1]:
+                child = order[nxt[node]]
+                nxt[node] += 1
+                depth[child] = depth[node] + 1
+                first[child] = len(euler)
+                euler.append(child)
+                stack.append(child)
+            else:
+                stack.pop()
+                if stack:
+                    euler.append(stack[-1])
+        if len(euler) != 2 * m + 1:
+            raise ValueError("The taxonomy should not contain cycles.")
+        self.depth = np.asarray(depth)
+        self._first = np.asarray(first)
+        euler = np.asarray(euler)
+
+        # The nodes of the tour are encoded as `depth * base + node`, so the
+        # minimum key of a window is its shallowest node. sparse[j, i] is the
+        # minimum key of the window of length 2**j starting at position i.
+        self._base = m + 1
+        self._euler_depth = self.depth[euler].astype(np.int32)
+        keys = self.depth[euler] * self._base + euler
+        size = len(euler)
+        levels = max(1, size.bit_length())
+        dtype = np.int32 if self._base**2 < 2**31 else np.int64
+        self._sparse = np.empty((levels, size), dtype=dtype)
+        self._sparse[0] = keys
+        for j in range(1, levels):
+            half = 1 << (j - 1)
+            prev, row = self._sparse[j - 1], self._sparse[j]
+            np.minimum(prev[:-half], prev[half:], out=row[:-half])
+            row[-half:] = prev[-half:]
+
+    def __str__(self):
+        return f"Taxonomy of {len(self.nodes)} nodes."
+
+    def __call__(self, k, el):
+        """Taxonomy weights between the nodes `k` and `el`."""
+        k, el = np.asarray(k, dtype=object), np.asarray(el, dtype=object)
+        if k.ndim == el.ndim == 2 and k.shape[1] == el.shape[0] == 1:
+            distance = self.pairwise(k[:, 0], el[0])
+        else:
+            distance = self.distance(k, el)
+        weights = distance.astype(float)
+        max_distance = np.max(weights, initial=0)
+        if max_distance == 0:
+            return np.ones(weights.shape)
+        weights /= -max_distance
+        weights += 1
+        return weights
+
+    def _index(self, nodes):
+        nodes = np.asarray(nodes, dtype=object)
+        index = self.nodes.get_indexer(nodes.ravel())
+        if np.any(index < 0):
+            unknown = nodes.ravel()[index < 0].tolist()
+            raise ValueError(f"Unknown nodes in the taxonomy: {unknown}.")
+        return index.reshape(nodes.shape)
+
+    def _lca(self, u, v):
+        """The key `depth * base + node` of the lowest common ancestors."""
+        lo = np.minimum(self._first[u], self._first[v])
+        hi = np.maximum(self._first[u], self._first[v]) + 1
+        j = np.frexp(hi - lo)[1] - 1
+        return np.minimum(self._sparse[j, lo], self._sparse[j, hi - (1 << j)])
+
+    def lca(self, a, b):
+        """The lowest common ancestors of the nodes `a` and `b`.
+
+        Parameters
+        ----------
+        a, b : node or array-like of nodes
+            Nodes of the taxonomy. The arrays are broadcast together.
+
+        Returns
+        -------
+        ndarray
+            The lowest common ancestor of each pair. Nodes of different trees
+            have `None` as ancestor.
+        """
+        u, v = np.broadcast_arrays(self._index(a), self._index(b))
+        lca = self._lca(u.ravel(), v.ravel()) % self._base
+        labels = np.append(np.asarray(self.nodes, dtype=object), None)
+        return labels[lca].reshape(u.shape)[()]
+
+    def distance(self, a, b):
+        """The number of edges between the nodes `a` and `b`.
+
+        Parameters
+        ----------
+        a, b : node or array-like of nodes
+            Nodes of the taxonomy. The arrays are broadcast together and the
+            distances are computed a block of rows at a time.
+
+        Returns
+        -------
+        ndarray
+            The distance of each pair. Nodes of different trees are connected
+            through the virtual root.
+        """
+        u, v = np.broadcast_arrays(
+            np.atleast_1d(self._index(a)), np.atleast_1d(self._index(b))
+        )
+        distance = np.empty(u.shape, dtype=np.int64)
+        rows = max(1, self._block_size // max(1, u[0].size))
+        for start in range(0, len(u), rows):
+            block = slice(start, start + rows)
+            ui, vi = u[block].ravel(), v[block].ravel()
+            lca_depth = self._lca(ui, vi) // self._base
+            distance[block] = (self.depth[ui] + self.depth[vi] - 2 * lca_depth).reshape(
+                distance[block].shape
+            )
+        return distance.reshape(np.broadcast_shapes(np.shape(a), np.shape(b)))[()]
+
+    def pairwise(self, a, b=None):
+        """The number of edges between all the pairs of the nodes `a` and `b`.
+
+        For each node of `a` a running minimum of the depths over the Euler tour,
+        starting at the node, gives the depth of its lowest common ancestor with
+        every other node, in time linear in the size of the taxonomy.
+
+        Parameters
+        ----------
+        a : array-like of nodes
+            Nodes of the taxonomy, for the rows.
+        b : array-like of nodes, optional
+            Nodes of the taxonomy, for the columns. The default is `a`.
+
+        Returns
+        -------
+        ndarray
+            A ``len(a) x len(b)`` matrix of distances.
+        """
+        u = self._index(np.ravel(np.asarray(a, dtype=object)))
+        v = u if b is None else self._index(np.ravel(np.asarray(b, dtype=object)))
+        first_v, depth_v = self._first[v], self.depth[v].astype(np.int32)
+        distance = np.empty((len(u), len(v)), dtype=np.int32)
+        lca_depth = np.empty_like(self._euler_depth)
+        for row, node in enumerate(u):
+            first = self._first[node]
+            np.minimum.accumulate(self._euler_depth[first:], out=lca_depth[first:])
+            np.minimum.accumulate(
+                self._euler_depth[first::-1], out=lca_depth[first::-1]
+            )
+            np.subtract(depth_v, 2 * lca_depth[first_v], out=distance[row])
+            distance[row] += self.depth[node]
+        return distance
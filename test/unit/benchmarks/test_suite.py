@@ -0,0 +1,21 @@
+import inspect
+from unittest import TestCase
+
+from benchmarks import bench_raw, bench_table, bench_weights
+
+
+class TestSuite(TestCase):
+    def test_smallest_params(self):
+        # Run every benchmark once with the first value of each parameter, so
+        # the suite keeps working with the current API.
+        for module in (bench_raw, bench_table, bench_weights):
+            for _, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ != module.__name__:
+                    continue
+                params = [values[0] for values in cls.params]
+                benchmark = cls()
+                benchmark.setup(*params)
+                for name, method in inspect.getmembers(benchmark, inspect.ismethod):
+                    if name.startswith(("time_", "peakmem_")):
+                        with self.subTest(benchmark=f"{cls.__name__}.{name}"):
+                            method(*params)
@@ -0,0 +1,63 @@
+from unittest import TestCase
+
+import numpy as np
+
+from irrCAC.benchmark import BatchBenchmark, Benchmark
+
+SCALES = ["altman", "cicchetti_sparrow", "fleiss", "landis_koch", "regier"]
+
+
+class TestBatchBenchmark(TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.coeff = rng.uniform(-0.5, 1.0, size=50)
+        self.se = rng.uniform(0.01, 0.3, size=50)
+        self.benchmark = BatchBenchmark(self.coeff, self.se)
+
+    def test_same_as_benchmark(self):
+        for scale in SCALES:
+            result = getattr(self.benchmark, scale)()
+            for i, (coeff, se) in enumerate(zip(self.coeff, self.se)):
+                expected = getattr(Benchmark(coeff, se), scale)()
+                np.testing.assert_allclose(
+                    expected["CumProb"], result["CumProb"][i], atol=1e-5
+                )
+                self.assertListEqual(expected["scale"], result["scale"])
+
+    def test_interpretation(self):
+        result = BatchBenchmark([0.67, 0.9, 0.67], [0.15, 0.02, 0.01]).altman()
+        self.assertListEqual(
+            ["Moderate", "Very Good", "Good"], result["interpretation"].tolist()
+        )
+
+    def test_no_interpretation(self):
+        my_scale = dict(
+            lb=[0.6, 0.3], ub=[1.0, 0.6], interp=["Good", "Fair"], scale_name="Mine"
+        )
+        result = BatchBenchmark([0.9, -0.5], 0.05).interpret(my_scale)
+        self.assertListEqual(["Good", None], result["interpretation"].tolist())
+
+    def test_broadcast(self):
+        coeff = self.coeff.reshape(5, 10)
+        result = BatchBenchmark(coeff, 0.1).fleiss()
+        self.assertEqual((5, 10, 3), result["CumProb"].shape)
+        self.assertEqual((5, 10), result["interpretation"].shape)
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            _ = BatchBenchmark([0.5, 1.5], 0.1)
+        with self.assertRaises(ValueError):
+            _ = BatchBenchmark(0.5, 0.1, threshold=0)
+        with self.assertRaises(ValueError):
+            _ = self.benchmark.interpret(dict())
+
+    def test_interpret_all(self):
+        results = self.benchmark.interpret_all()
+        for scale in SCALES:
+            expected = getattr(self.benchmark, scale)()
+            # The second key of the results is the scale name.
+            result = results[list(expected)[1]]
+            np.testing.assert_array_equal(expected["CumProb"], result["CumProb"])
+            np.testing.assert_array_equal(
+                expected["interpretation"], result["interpretation"]
+            )
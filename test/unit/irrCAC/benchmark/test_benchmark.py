@@ -53,3 +53,35 @@ class TestBenchmark(TestCase):
         error_scale = dict()
         with self.assertRaises(ValueError):
             _ = self.benchmark.interpret(error_scale)
+
+    def test_interpret_all(self):
+        my_scale = dict(
+            lb=[0.0, 0.3, 0.6],
+            ub=[0.3, 0.6, 1.0],
+            interp=["Poor", "Acceptable", "Excellent"],
+            scale_name="My Scale",
+        )
+        results = self.benchmark.interpret_all(["altman", "fleiss", my_scale])
+        self.assertListEqual(["Altman", "Fleiss", "My Scale"], list(results))
+        self.assertDictEqual(self.benchmark.altman(), results["Altman"])
+        self.assertDictEqual(self.benchmark.fleiss(), results["Fleiss"])
+        self.assertDictEqual(self.benchmark.interpret(my_scale), results["My Scale"])
+        results = self.benchmark.interpret_all()
+        self.assertDictEqual(self.benchmark.regier(), results["Regier"])
+
+    def test_interpret_all_raises_valueerror(self):
+        with self.assertRaises(ValueError):
+            _ = self.benchmark.interpret_all(["unknown"])
+        with self.assertRaises(ValueError):
+            _ = self.benchmark.interpret_all([dict()])
+        renamed = dict(Benchmark._scales["altman"], scale_name="Fleiss")
+        with self.assertRaises(ValueError):
+            _ = self.benchmark.interpret_all(["fleiss", renamed])
+
+    def test_results_are_copies(self):
+        expected = self.benchmark.altman()
+        result = self.benchmark.altman()
+        result["Altman"].append("Unknown")
+        result["scale"].clear()
+        self.assertDictEqual(expected, self.benchmark.altman())
+        self.assertDictEqual(expected, self.benchmark.interpret_all()["Altman"])
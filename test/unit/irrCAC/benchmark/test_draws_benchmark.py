@@ -0,0 +1,65 @@
+from unittest import TestCase
+
+import numpy as np
+
+from irrCAC.benchmark import BatchBenchmark, DrawsBenchmark, _count_le
+
+
+class TestDrawsBenchmark(TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        # Bootstrap-like draws with ties at the bounds of the scales.
+        self.draws = np.round(rng.uniform(-0.2, 1.0, size=(30, 500)), 1)
+        self.benchmark = DrawsBenchmark(self.draws)
+
+    def test_count_le(self):
+        sorted_draws = np.sort(self.draws, axis=-1)
+        bounds = [-1.0, 0.0, 0.2, 0.25, 1.0, 1.5]
+        expected = [np.searchsorted(row, bounds, side="right") for row in sorted_draws]
+        np.testing.assert_array_equal(expected, _count_le(sorted_draws, bounds))
+
+    def test_fractions(self):
+        result = self.benchmark.landis_koch()
+        for i, draws in enumerate(self.draws):
+            in_intervals = [
+                np.mean((lb < draws) & (draws <= ub)) for lb, ub in result["scale"]
+            ]
+            np.testing.assert_allclose(
+                np.round(np.cumsum(in_intervals), 5), result["CumProb"][i]
+            )
+
+    def test_lower_end(self):
+        draws = np.array([[-1.0, -1.0, -0.5, 0.5], [-1.0, -1.0, -1.0, -1.0]])
+        result = DrawsBenchmark(draws).altman()
+        np.testing.assert_array_equal(1.0, np.asarray(result["CumProb"])[:, -1])
+        np.testing.assert_array_equal([0.25, 0.0], np.asarray(result["CumProb"])[:, 2])
+        np.testing.assert_array_equal(["Poor", "Poor"], result["interpretation"])
+
+    def test_normal_draws(self):
+        rng = np.random.default_rng(1)
+        coeff, se = np.array([0.3, 0.67, 0.85]), np.array([0.1, 0.15, 0.05])
+        draws = rng.normal(coeff[:, np.newaxis], se[:, np.newaxis], (3, 200000))
+        expected = BatchBenchmark(coeff, se).altman()
+        result = DrawsBenchmark(np.clip(draws, -1, 1)).altman()
+        np.testing.assert_allclose(expected["CumProb"], result["CumProb"], atol=0.01)
+        np.testing.assert_array_equal(
+            expected["interpretation"], result["interpretation"]
+        )
+
+    def test_interpret_all(self):
+        results = self.benchmark.interpret_all(["fleiss", "regier"])
+        np.testing.assert_array_equal(
+            self.benchmark.fleiss()["CumProb"], results["Fleiss"]["CumProb"]
+        )
+        np.testing.assert_array_equal(
+            self.benchmark.regier()["interpretation"],
+            results["Regier"]["interpretation"],
+        )
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            _ = DrawsBenchmark([0.5])
+        with self.assertRaises(ValueError):
+            _ = DrawsBenchmark([[0.5, 1.2]])
+        with self.assertRaises(ValueError):
+            _ = DrawsBenchmark(self.draws, threshold=1.5)
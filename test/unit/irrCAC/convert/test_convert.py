@@ -0,0 +1,88 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from irrCAC.convert import (
+    dist_by_group,
+    encode_ratings,
+    pairs_to_table,
+    raw_to_dist,
+    raw_to_raters,
+)
+from irrCAC.datasets import dist_g1g2, raw_4raters, raw_g1g2
+
+
+class TestConvert(TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        ratings = rng.choice(["a", "b", "c", "d", None, ""], size=(200, 3))
+        self.ratings = pd.DataFrame(ratings, columns=["r1", "r2", "r3"])
+        self.categories = ["a", "b", "c", "d"]
+
+    def test_raw_to_dist(self):
+        expected = pd.DataFrame(
+            {k: (self.ratings == k).sum(axis=1) for k in self.categories}
+        )
+        result = raw_to_dist(self.ratings)
+        np.testing.assert_array_equal(expected, result)
+        self.assertListEqual(self.categories, result.columns.tolist())
+        self.assertTrue(raw_to_dist(raw_g1g2()).equals(dist_g1g2()))
+
+    def test_raw_to_raters(self):
+        expected = pd.DataFrame(
+            {k: (self.ratings == k).sum(axis=0) for k in self.categories}
+        )
+        result = raw_to_raters(self.ratings)
+        np.testing.assert_array_equal(expected, result)
+        self.assertListEqual(["r1", "r2", "r3"], result.index.tolist())
+
+    def test_categories(self):
+        ratings = raw_4raters()
+        categories = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+        result = raw_to_dist(ratings, categories)
+        self.assertListEqual(categories, result.columns.tolist())
+        np.testing.assert_array_equal(0, result[6.0])
+        self.assertEqual(ratings.count().sum(), result.to_numpy().sum())
+        with self.assertRaises(ValueError):
+            _ = raw_to_raters(ratings, [1.0, 2.0])
+
+    def test_pairs_to_table(self):
+        complete = self.ratings.replace("", None).dropna(subset=["r1", "r2"])
+        expected = pd.crosstab(complete["r1"], complete["r2"])
+        result = pairs_to_table(self.ratings["r1"], self.ratings["r2"])
+        np.testing.assert_array_equal(expected, result)
+        self.assertListEqual(self.categories, result.index.tolist())
+
+    def test_encode_ratings(self):
+        index, codes = encode_ratings(self.ratings)
+        self.assertListEqual(self.categories, index.tolist())
+        self.assertEqual(np.uint8, codes.dtype)
+        for j, column in enumerate(self.ratings):
+            expected = index.get_indexer(self.ratings[column])
+            np.testing.assert_array_equal(np.where(expected < 0, 4, expected), codes[j])
+        _, arrays = encode_ratings(
+            [self.ratings[column].tolist() for column in self.ratings], index
+        )
+        np.testing.assert_array_equal(codes, arrays)
+
+    def test_strict(self):
+        ratings = [["a", "b", None], ["c", "", "a"]]
+        with self.assertRaises(ValueError):
+            _ = encode_ratings(ratings, ["a", "b"])
+        _, codes = encode_ratings(ratings, ["a", "b"], strict=False)
+        np.testing.assert_array_equal([[0, 1, 2], [3, 2, 0]], codes)
+        with self.assertRaises(ValueError):
+            _ = encode_ratings([["a", "b"], ["a"]])
+        with self.assertRaises(ValueError):
+            _ = encode_ratings(ratings, ["a", "a"])
+
+    def test_dist_by_group(self):
+        expected = dist_g1g2()
+        counts = expected.droplevel("Group")
+        groups = expected.index.get_level_values("Group")
+        self.assertTrue(dist_by_group(counts, groups).equals(expected))
+        with_column = counts.assign(Group=groups.to_numpy())
+        self.assertTrue(dist_by_group(with_column, "Group").equals(expected))
+        with self.assertRaises(ValueError):
+            _ = dist_by_group(counts, ["G1", "G2"])
@@ -0,0 +1,79 @@
+from unittest import TestCase
+
+import numpy as np
+
+from irrCAC.datasets import synthetic_codes, synthetic_ratings
+from irrCAC.raw import CAC
+
+
+class TestSyntheticCodes(TestCase):
+    def test_chunks(self):
+        chunks = list(synthetic_codes(2500, 3, 4, chunk_size=1000, seed=0))
+        self.assertListEqual(
+            [(1000, 3), (1000, 3), (500, 3)], [c.shape for c in chunks]
+        )
+        self.assertEqual(np.int8, chunks[0].dtype)
+        self.assertEqual(np.int16, next(synthetic_codes(10, 3, 300)).dtype)
+
+    def test_seed(self):
+        first = np.concatenate(list(synthetic_codes(1000, 3, 4, seed=1)))
+        second = np.concatenate(list(synthetic_codes(1000, 3, 4, seed=1)))
+        np.testing.assert_array_equal(first, second)
+
+    def test_perfect_agreement(self):
+        codes = next(synthetic_codes(1000, 5, 4, agreement=1.0, seed=0))
+        self.assertTrue(np.all(codes == codes[:, [0]]))
+
+    def test_prevalence_and_missing(self):
+        prevalence = [0.7, 0.2, 0.1]
+        codes = next(
+            synthetic_codes(
+                10**5, 4, 3, prevalence=prevalence, missing=[0.0, 0.5, 0, 0], seed=0
+            )
+        )
+        self.assertFalse(np.any(codes[:, 0] < 0))
+        self.assertAlmostEqual(0.5, np.mean(codes[:, 1] < 0), 2)
+        frequencies = np.bincount(codes[:, 0], minlength=3) / len(codes)
+        np.testing.assert_allclose(prevalence, frequencies, atol=0.01)
+
+    def test_bias(self):
+        bias = [[1.0, 0.0, 0.0], [0.0, 0.0, 1.0]]
+        codes = next(synthetic_codes(10**4, 2, 3, agreement=0.0, bias=bias, seed=0))
+        np.testing.assert_array_equal(0, codes[:, 0])
+        np.testing.assert_array_equal(2, codes[:, 1])
+
+    def test_agreement(self):
+        # With uniform categories the expected Fleiss' kappa is agreement**2.
+        ratings = synthetic_ratings(20000, 3, 4, agreement=0.8, seed=0)
+        kappa = CAC(ratings).fleiss()["est"]["coefficient_value"]
+        self.assertAlmostEqual(0.64, kappa, 1)
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            next(synthetic_codes(10, 2, 3, agreement=1.5))
+        with self.assertRaises(ValueError):
+            next(synthetic_codes(10, 2, 3, missing=1.0))
+        with self.assertRaises(ValueError):
+            next(synthetic_codes(10, 2, 3, prevalence=[1, -1, 1]))
+        with self.assertRaises(ValueError):
+            next(synthetic_codes(10, 2, 3, bias=np.ones((3, 3))))
+
+    def test_exceptions_on_call(self):
+        # The arguments are checked before any chunk is drawn.
+        with self.assertRaises(ValueError):
+            synthetic_codes(10, 2, 3, agreement=1.5)
+        with self.assertRaises(ValueError):
+            synthetic_codes(10, 2, 3, chunk_size=0)
+
+
+class TestSyntheticRatings(TestCase):
+    def test_labels(self):
+        ratings = synthetic_ratings(100, 4, ["a", "b"], missing=0.2, seed=0)
+        self.assertListEqual(["Rater1", "Rater2", "Rater3", "Rater4"], list(ratings))
+        self.assertSetEqual({"a", "b"}, set(ratings.stack().unique()))
+        self.assertTrue(ratings.isna().any().any())
+
+    def test_codes(self):
+        codes = next(synthetic_codes(100, 2, 3, missing=0.2, seed=0))
+        ratings = synthetic_ratings(100, 2, 3, missing=0.2, seed=0)
+        np.testing.assert_array_equal(np.where(codes < 0, np.nan, codes + 1), ratings)
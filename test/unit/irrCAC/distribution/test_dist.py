@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from irrCAC import raw
+from irrCAC.datasets import dist_g1g2, raw_4raters, raw_g1g2
+from irrCAC.dist import CAC
+
+METHODS = ["gwet", "fleiss", "krippendorff", "bp"]
+
+
+class TestDist(TestCase):
+    def assert_same_as_raw(self, counts, ratings, **kwargs):
+        for method in METHODS:
+            expected = getattr(raw.CAC(ratings.copy(), **kwargs), method)()["est"]
+            result = getattr(CAC(counts, **kwargs), method)()["est"]
+            self.assertDictEqual(expected, result, msg=method)
+
+    def test_g1g2(self):
+        ratings = raw_g1g2()[["Rater1", "Rater2", "Rater3", "Rater4"]]
+        self.assert_same_as_raw(dist_g1g2(), ratings)
+
+    def test_raw4raters_weights(self):
+        ratings = raw_4raters()
+        categories = [1.0, 2.0, 3.0, 4.0, 5.0]
+        counts = pd.DataFrame(
+            {k: (ratings == k).sum(axis=1) for k in categories}, index=ratings.index
+        )
+        for weights in ["quadratic", "bipolar"]:
+            self.assert_same_as_raw(counts, ratings, weights=weights)
+
+    def test_ndarray(self):
+        counts = dist_g1g2()
+        expected = CAC(counts).gwet()
+        result = CAC(counts.to_numpy(), categories=counts.columns.tolist()).gwet()
+        self.assertDictEqual(expected["est"], result["est"])
+        self.assertListEqual([1, 2, 3, 4, 5], CAC(counts.to_numpy()).categories)
+
+    def test_drop_empty_subjects(self):
+        counts = dist_g1g2()
+        expected = CAC(counts).fleiss()["est"]
+        empty = pd.DataFrame([[0, 0, 0, 0, 0]], columns=counts.columns)
+        cac = CAC(pd.concat([counts, empty]))
+        self.assertEqual(14, cac.n)
+        self.assertDictEqual(expected, cac.fleiss()["est"])
+
+    def test_float32(self):
+        counts = dist_g1g2()
+        expected = CAC(counts).krippendorff()["est"]
+        result = CAC(counts, dtype=np.float32).krippendorff()["est"]
+        self.assertAlmostEqual(
+            expected["coefficient_value"], result["coefficient_value"], 4
+        )
+
+    def test_interface(self):
+        cac = CAC(dist_g1g2())
+        self.assertIsInstance(cac, raw.BaseCAC)
+        self.assertNotIsInstance(cac, raw.CAC)
+        for name in ["conger", "ratings", "codes"]:
+            self.assertFalse(hasattr(cac, name), msg=name)
+
+    def test_exceptions(self):
+        counts = dist_g1g2()
+        with self.assertRaises(ValueError):
+            _ = CAC(counts, categories=["a", "b"])
+        with self.assertRaises(ValueError):
+            _ = CAC(-counts)
+        with self.assertRaises(ValueError):
+            _ = CAC(counts.to_numpy().ravel())
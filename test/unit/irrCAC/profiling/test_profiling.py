@@ -0,0 +1,83 @@
+import tracemalloc
+from unittest import TestCase
+
+from irrCAC import dist, raw, table
+from irrCAC.convert import raw_to_dist
+from irrCAC.datasets import raw_4raters, table_cont3x3abstractors
+from irrCAC.profiling import Profile, Stage
+
+
+class TestProfile(TestCase):
+    def test_raw_stages(self):
+        with Profile() as profile:
+            raw.CAC(raw_4raters()).conger()
+        self.assertListEqual(
+            [
+                "categories",
+                "cleaning",
+                "weights",
+                "counts",
+                "pa",
+                "pe",
+                "variance",
+                "t_distribution",
+            ],
+            [stage.name for stage in profile.stages],
+        )
+        self.assertEqual("irrCAC.raw.CAC.__init__", profile.stages[0].owner)
+        self.assertEqual("irrCAC.raw.CAC.conger", profile.stages[-1].owner)
+        self.assertTrue(all(stage.seconds >= 0 for stage in profile.stages))
+        self.assertTrue(all(stage.peak >= 0 for stage in profile.stages))
+
+    def test_table_and_dist_owners(self):
+        with Profile() as profile:
+            table.CAC(table_cont3x3abstractors()).pa2()
+            dist.CAC(raw_to_dist(raw_4raters())).gwet()
+        owners = list(dict.fromkeys(stage.owner for stage in profile.stages))
+        self.assertListEqual(
+            [
+                "irrCAC.table.CAC.__init__",
+                "irrCAC.table.CAC.pa2",
+                "irrCAC.dist.CAC.__init__",
+                "irrCAC.dist.CAC.gwet",
+            ],
+            owners,
+        )
+
+    def test_callback(self):
+        received = []
+        with Profile(callback=received.append) as profile:
+            table.CAC(table_cont3x3abstractors()).gwet()
+        self.assertListEqual(profile.stages, received)
+        self.assertIsInstance(received[0], Stage)
+
+    def test_without_memory(self):
+        with Profile(memory=False) as profile:
+            self.assertFalse(tracemalloc.is_tracing())
+            raw.CAC(raw_4raters()).fleiss()
+        self.assertTrue(all(stage.allocated == 0 for stage in profile.stages))
+        self.assertTrue(all(stage.peak == 0 for stage in profile.stages))
+
+    def test_tracing_is_restored(self):
+        with Profile():
+            self.assertTrue(tracemalloc.is_tracing())
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_outside_of_profile(self):
+        profile = Profile()
+        with profile:
+            pass
+        raw.CAC(raw_4raters()).gwet()
+        self.assertListEqual([], profile.stages)
+
+    def test_summary(self):
+        with Profile() as profile:
+            cac = raw.CAC(raw_4raters())
+            cac.gwet()
+            cac.gwet()
+        summary = profile.summary()
+        self.assertEqual(2, summary.loc[("irrCAC.raw.CAC.gwet", "pa"), "calls"])
+        self.assertEqual(
+            1, summary.loc[("irrCAC.raw.CAC.__init__", "weights"), "calls"]
+        )
+        self.assertEqual(len(profile.stages), len(profile.to_frame()))
@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from irrCAC.datasets import raw_4raters, raw_g1g2
+from irrCAC.raw import CAC
+
+
+class TestDtype(TestCase):
+    methods = ("gwet", "fleiss", "krippendorff", "conger", "bp")
+
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        truth = rng.integers(1, 6, 5000)
+        ratings = {}
+        for rater in range(4):
+            noise = rng.integers(1, 6, truth.size)
+            rater_ratings = np.where(rng.random(truth.size) < 0.8, truth, noise)
+            missing = rng.random(truth.size) < 0.1
+            ratings[f"Rater{rater + 1}"] = np.where(missing, np.nan, rater_ratings)
+        self.large = pd.DataFrame(ratings)
+
+    def assert_accuracy(self, data, weights, tolerance):
+        cac64 = CAC(data, weights=weights, digits=12)
+        cac32 = CAC(data, weights=weights, digits=12, dtype="float32")
+        self.assertEqual(np.float32, cac32.weights_mat.dtype)
+        for method in self.methods:
+            est64 = getattr(cac64, method)()["est"]
+            est32 = getattr(cac32, method)()["est"]
+            for key in ("coefficient_value", "se", "pa", "pe"):
+                error = abs(float(est64[key]) - float(est32[key]))
+                self.assertLess(error, tolerance, f"{method} {key} error {error}.")
+
+    def test_float32_raw4raters(self):
+        for weights in ("identity", "quadratic", "bipolar"):
+            self.assert_accuracy(raw_4raters(), weights, 1e-6)
+
+    def test_float32_raw_g1g2(self):
+        self.assert_accuracy(raw_g1g2(), "linear", 1e-6)
+
+    def test_float32_large(self):
+        for weights in ("identity", "quadratic"):
+            self.assert_accuracy(self.large, weights, 1e-6)
+
+    def test_float32_counts(self):
+        cac = CAC(raw_4raters(), dtype=np.float32)
+        agree_mat = cac._agreement_matrix()
+        self.assertEqual(np.float32, agree_mat.dtype)
+        self.assertEqual(41, agree_mat.sum())
+
+    def test_dtype_exception(self):
+        with self.assertRaises(ValueError):
+            _ = CAC(raw_4raters(), dtype="int32")
@@ -0,0 +1,82 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from irrCAC.datasets import raw_4raters
+from irrCAC.raw import CAC
+
+
+class TestEncoding(TestCase):
+    def setUp(self) -> None:
+        self.data = pd.DataFrame(
+            {
+                "r1": ["a", "", None, "b", "c"],
+                "r2": ["a", "b", None, "", "c"],
+                "r3": ["b", "b", np.nan, "b", "d"],
+            }
+        )
+
+    def test_input_is_not_changed(self):
+        expected = self.data.copy()
+        CAC(self.data).gwet()
+        pd.testing.assert_frame_equal(expected, self.data)
+
+    def test_subjects_and_categories(self):
+        cac = CAC(self.data)
+        self.assertEqual((4, 3), (cac.n, cac.r))
+        self.assertListEqual(["a", "b", "c", "d"], cac.categories)
+        self.assertEqual(np.uint8, cac.codes.dtype)
+        np.testing.assert_array_equal(
+            [[0, 4, 1, 2], [0, 1, 4, 2], [1, 1, 1, 3]], cac.codes
+        )
+
+    def test_conger_out_of_categories(self):
+        # Conger's variance counts the ratings out of the categories as rated,
+        # unlike the missing ratings.
+        data = raw_4raters()
+        categories = [1.0, 2.0, 3.0]
+        conger = CAC(data, categories=categories).conger()["est"]
+        self.assertEqual(0.18828, conger["se"])
+        self.assertEqual((0.25427, 1), conger["confidence_interval"])
+        masked = CAC(data.where(data.isin(categories)), categories=categories)
+        self.assertEqual(
+            conger["coefficient_value"], masked.conger()["est"]["coefficient_value"]
+        )
+        self.assertEqual(0.18965, masked.conger()["est"]["se"])
+
+    def test_ratings(self):
+        ratings = CAC(self.data).ratings
+        self.assertListEqual([0, 1, 3, 4], ratings.index.to_list())
+        self.assertTrue(pd.isna(ratings.loc[1, "r1"]))
+        self.assertTrue(pd.isna(ratings.loc[3, "r2"]))
+
+    def test_input_changed_after_construction(self):
+        data = raw_4raters()
+        expected = CAC(data.copy())
+        cac = CAC(data)
+        data.iloc[:, 0] = 1.0
+        data.iloc[0, :] = np.nan
+        for method in ["conger", "gwet", "fleiss", "krippendorff", "bp"]:
+            self.assertDictEqual(
+                getattr(expected, method)()["est"], getattr(cac, method)()["est"]
+            )
+
+    def test_agreement_matrix(self):
+        data = raw_4raters()
+        cac = CAC(data)
+        ratings = data.dropna(how="all")
+        expected = np.stack(
+            [(ratings == k).sum(axis=1).to_numpy() for k in cac.categories], axis=1
+        )
+        np.testing.assert_array_equal(expected, cac._agreement_matrix())
+
+    def test_ratings_out_of_categories(self):
+        cac = CAC(self.data, categories=["a", "b"])
+        np.testing.assert_array_equal(
+            [[2, 1], [0, 2], [0, 2], [0, 0]], cac._agreement_matrix()
+        )
+
+    def test_duplicate_categories(self):
+        with self.assertRaises(ValueError):
+            CAC(self.data, categories=["a", "b", "a"])
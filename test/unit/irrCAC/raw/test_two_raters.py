@@ -0,0 +1,53 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from irrCAC.datasets import raw_ben_gerry
+from irrCAC.raw import CAC
+
+METHODS = ["gwet", "fleiss", "krippendorff", "bp"]
+
+
+class TestTwoRaters(TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        rater1 = rng.choice(["a", "b", "c", "d", None], size=300)
+        rater2 = np.where(
+            rng.uniform(size=300) < 0.6, rater1, rng.choice(["a", "b", "c"], 300)
+        )
+        missing = pd.isna(rater1)
+        rater2[missing] = "a"
+        rater2[~missing & (rng.uniform(size=300) < 0.1)] = ""
+        self.data = pd.DataFrame({"r1": rater1, "r2": rater2})
+
+    def assert_same_as_subjects(self, data, **kwargs):
+        for method in METHODS:
+            expected_cac = CAC(data.copy(), **kwargs)
+            # Every subject in its own row, as with more than two raters.
+            expected_cac._agreement_patterns = lambda: (
+                expected_cac._agreement_matrix(),
+                np.ones(expected_cac.n),
+            )
+            expected = getattr(expected_cac, method)()["est"]
+            result = getattr(CAC(data.copy(), **kwargs), method)()["est"]
+            for key in ["coefficient_value", "se", "pa", "pe"]:
+                self.assertAlmostEqual(expected[key], result[key], 5, msg=method)
+
+    def test_identity(self):
+        self.assert_same_as_subjects(self.data)
+
+    def test_quadratic(self):
+        self.assert_same_as_subjects(self.data, weights="quadratic")
+
+    def test_categories(self):
+        self.assert_same_as_subjects(self.data, categories=["a", "b", "c", "d", "e"])
+
+    def test_ben_gerry(self):
+        self.assert_same_as_subjects(raw_ben_gerry())
+
+    def test_patterns(self):
+        data = pd.DataFrame({"r1": [1, 1, 2, 2, np.nan], "r2": [1, 1, 1, np.nan, 2]})
+        agree_mat, subjects = CAC(data)._agreement_patterns()
+        np.testing.assert_array_equal([[2, 0], [1, 1], [0, 1], [0, 1]], agree_mat)
+        np.testing.assert_array_equal([2, 1, 1, 1], subjects)
@@ -0,0 +1,89 @@
+from unittest import TestCase
+
+import numpy as np
+
+from irrCAC.table import CAC, Accumulator
+
+METHODS = ["bp", "cohen", "gwet", "krippendorff", "pa2", "scott"]
+
+
+class TestAccumulator(TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.categories = ["a", "b", "c", "d"]
+        self.rater1 = rng.choice(self.categories, size=500)
+        self.rater2 = np.where(
+            rng.uniform(size=500) < 0.6,
+            self.rater1,
+            rng.choice(self.categories, size=500),
+        )
+
+    def assert_same_as_cac(self, weights):
+        accumulator = Accumulator(self.categories, weights=weights, digits=10)
+        for batch in np.array_split(np.arange(500), 7):
+            accumulator.update(self.rater1[batch], self.rater2[batch])
+        cac = CAC.from_pairs(self.rater1, self.rater2, weights=weights, digits=10)
+        for method in METHODS:
+            expected = getattr(cac, method)()["est"]
+            result = getattr(accumulator, method)()["est"]
+            for key in ["coefficient_value", "se", "p_value"]:
+                self.assertAlmostEqual(expected[key], result[key], 8, msg=method)
+            np.testing.assert_allclose(
+                expected["confidence_interval"], result["confidence_interval"]
+            )
+
+    def test_identity(self):
+        self.assert_same_as_cac("identity")
+
+    def test_quadratic(self):
+        self.assert_same_as_cac("quadratic")
+
+    def test_identity_shortcut(self):
+        identity = Accumulator(self.categories, digits=10)
+        custom = Accumulator(self.categories, weights=np.eye(4), digits=10)
+        # Batches with fewer and with more pairs than cells.
+        for batch in [slice(0, 5), slice(5, 300), slice(300, 500)]:
+            identity.update(self.rater1[batch], self.rater2[batch])
+            custom.update(self.rater1[batch], self.rater2[batch])
+        np.testing.assert_array_equal(custom.counts, identity.counts)
+        for method in METHODS:
+            expected = getattr(custom, method)()["est"]
+            result = getattr(identity, method)()["est"]
+            for key in ["coefficient_value", "se", "pa", "pe"]:
+                self.assertAlmostEqual(expected[key], result[key], 8, msg=method)
+
+    def test_totals(self):
+        accumulator = Accumulator(self.categories)
+        accumulator.update(["a", "b", None], ["a", "c", "d"])
+        accumulator.update(["d"], ["c"])
+        np.testing.assert_array_equal([1, 1, 0, 1], accumulator.row_totals)
+        np.testing.assert_array_equal([1, 0, 2, 0], accumulator.col_totals)
+        self.assertEqual(3, accumulator.n)
+        accumulator.reset()
+        self.assertEqual(0, accumulator.counts.sum())
+        self.assertEqual(0, accumulator.n)
+
+    def test_float32(self):
+        accumulator = Accumulator(self.categories, dtype=np.float32)
+        accumulator.update(self.rater1, self.rater2)
+        self.assertEqual(np.int64, accumulator.counts.dtype)
+        self.assertEqual(np.float32, accumulator.cohen()["est"]["se"].dtype)
+
+    def test_agreement(self):
+        accumulator = Accumulator(self.categories, weights="quadratic")
+        accumulator.update(self.rater1[:200], self.rater2[:200])
+        accumulator.update(self.rater1[200:], self.rater2[200:])
+        cac = CAC.from_pairs(
+            self.rater1, self.rater2, categories=self.categories, weights="quadratic"
+        )
+        np.testing.assert_array_equal(cac.ratings.values, accumulator.counts)
+        self.assertAlmostEqual(cac.pa, accumulator.pa)
+        np.testing.assert_allclose(cac.pbl_dot, accumulator.pbl_dot)
+        np.testing.assert_allclose(cac.pb_dot_k, accumulator.pb_dot_k)
+
+    def test_exceptions(self):
+        accumulator = Accumulator(self.categories)
+        with self.assertRaises(ValueError):
+            accumulator.update(["a", "e"], ["a", "b"])
+        with self.assertRaises(ValueError):
+            _ = Accumulator(["a", "a"])
@@ -0,0 +1,75 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from irrCAC.datasets import table_cont3x3abstractors
+from irrCAC.table import BatchCAC, CAC
+
+METHODS = ["bp", "cohen", "gwet", "krippendorff", "pa2", "scott"]
+
+
+class TestBatchCAC(TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.tables = rng.integers(0, 30, size=(6, 4, 4)) + 10 * np.eye(4, dtype=int)
+
+    def assert_same_as_cac(self, batch, weights):
+        for method in METHODS:
+            result = getattr(batch, method)()["est"]
+            for i, table in enumerate(self.tables):
+                cac = CAC(pd.DataFrame(table), weights=weights)
+                expected = getattr(cac, method)()["est"]
+                self.assertEqual(
+                    expected["coefficient_name"], result["coefficient_name"]
+                )
+                for key in ["coefficient_value", "se", "z", "p_value", "pa", "pe"]:
+                    self.assertAlmostEqual(
+                        expected[key], result[key][i], places=4, msg=method
+                    )
+                lcb, ucb = result["confidence_interval"]
+                self.assertAlmostEqual(expected["confidence_interval"][0], lcb[i], 4)
+                self.assertAlmostEqual(expected["confidence_interval"][1], ucb[i], 4)
+
+    def test_identity(self):
+        self.assert_same_as_cac(BatchCAC(self.tables), "identity")
+
+    def test_quadratic(self):
+        batch = BatchCAC(self.tables, weights="quadratic")
+        self.assert_same_as_cac(batch, "quadratic")
+
+    def test_custom_weights(self):
+        weights = np.random.default_rng(1).uniform(size=(4, 4))
+        self.assert_same_as_cac(BatchCAC(self.tables, weights=weights), weights)
+
+    def test_cont3x3abstractors(self):
+        data = table_cont3x3abstractors()
+        batch = BatchCAC([data.values], categories=data.index.to_list())
+        result = batch.gwet()
+        self.assertEqual(0.84933, result["est"]["coefficient_value"][0])
+        self.assertListEqual(data.index.to_list(), result["categories"])
+
+    def test_float32(self):
+        expected = BatchCAC(self.tables, digits=10)
+        result = BatchCAC(self.tables, digits=10, dtype=np.float32)
+        self.assertEqual(np.int32, result.counts.dtype)
+        for method in METHODS:
+            coeff = getattr(result, method)()["est"]["coefficient_value"]
+            self.assertEqual(np.float32, coeff.dtype)
+            np.testing.assert_allclose(
+                getattr(expected, method)()["est"]["coefficient_value"],
+                coeff,
+                atol=1e-6,
+            )
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            _ = BatchCAC(self.tables[0])
+        with self.assertRaises(ValueError):
+            _ = BatchCAC(self.tables, weights="unknown")
+        with self.assertRaises(ValueError):
+            _ = BatchCAC(self.tables, weights=np.eye(3))
+        with self.assertRaises(ValueError):
+            _ = BatchCAC(self.tables, categories=["a", "b"])
+        with self.assertRaises(ValueError):
+            _ = BatchCAC(self.tables, confidence_level=0.5)
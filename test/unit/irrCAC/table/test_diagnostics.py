@@ -0,0 +1,39 @@
+from unittest import TestCase
+
+import numpy as np
+from scipy import sparse
+
+from irrCAC.datasets import table_cont3x3abstractors
+from irrCAC.table import CAC
+
+
+class TestDiagnostics(TestCase):
+    def test_two_categories(self):
+        # a = 40, b = 9, c = 6, d = 45 in Byrt et al.
+        cac = CAC(np.array([[40, 9], [6, 45]]))
+        result = cac.diagnostics()
+        np.testing.assert_allclose([0.05, 0.05], result["prevalence_index"])
+        np.testing.assert_allclose([0.03, 0.03], result["bias_index"])
+        self.assertAlmostEqual(0.7, result["pabak"])
+        self.assertAlmostEqual(cac.bp()["est"]["coefficient_value"], result["pabak"], 5)
+        np.testing.assert_allclose(
+            [80 / 95, 90 / 105], result["specific_agreement"], atol=1e-5
+        )
+
+    def test_max_kappa(self):
+        data = table_cont3x3abstractors()
+        result = CAC(data, weights="quadratic").diagnostics()
+        rows, cols = data.sum(axis=1) / 100, data.sum(axis=0) / 100
+        pe = np.dot(rows, cols)
+        expected = (np.minimum(rows, cols).sum() - pe) / (1 - pe)
+        self.assertAlmostEqual(expected, result["max_kappa"], 5)
+        self.assertListEqual(data.index.to_list(), result["categories"])
+
+    def test_sparse(self):
+        table = np.array([[5, 1, 0, 0], [1, 4, 0, 0], [0, 2, 6, 0], [0, 0, 0, 0]])
+        expected = CAC(table).diagnostics()
+        result = CAC(sparse.csr_array(table)).diagnostics()
+        for key in ["prevalence_index", "bias_index", "specific_agreement"]:
+            np.testing.assert_array_equal(expected[key], result[key])
+        self.assertTrue(np.isnan(result["specific_agreement"][3]))
+        self.assertEqual(expected["pabak"], result["pabak"])
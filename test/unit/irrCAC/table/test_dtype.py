@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from irrCAC.datasets import table_cont3x3abstractors, table_cont4x4diagnosis
+from irrCAC.table import CAC, BatchCAC
+
+
+class TestDtype(TestCase):
+    methods = ("bp", "cohen", "gwet", "krippendorff", "pa2", "scott")
+
+    def assert_accuracy(self, data, weights, tolerance):
+        cac64 = CAC(data, weights=weights, digits=12)
+        cac32 = CAC(data, weights=weights, digits=12, dtype="float32")
+        self.assertEqual(np.int32, cac32.counts.dtype)
+        self.assertEqual(np.float32, cac32.weights_mat.dtype)
+        for method in self.methods:
+            est64 = getattr(cac64, method)()["est"]
+            est32 = getattr(cac32, method)()["est"]
+            for key in ("coefficient_value", "se", "pa", "pe"):
+                error = abs(float(np.ravel(est64[key])[0] - np.ravel(est32[key])[0]))
+                self.assertLess(error, tolerance, f"{method} {key} error {error}.")
+
+    def test_float32_cont3x3abstractors(self):
+        for weights in ("identity", "quadratic", "ratio"):
+            self.assert_accuracy(table_cont3x3abstractors(), weights, 1e-6)
+
+    def test_float32_cont4x4diagnosis(self):
+        for weights in ("identity", "linear", "bipolar"):
+            self.assert_accuracy(table_cont4x4diagnosis(), weights, 1e-6)
+
+    def test_float32_large(self):
+        rng = np.random.default_rng(0)
+        counts = rng.integers(0, 1000, size=(50, 50)) + np.diag(np.full(50, 10000))
+        self.assert_accuracy(pd.DataFrame(counts), "quadratic", 1e-6)
+
+    def test_float32_count_overflow(self):
+        counts = np.array([[3_000_000_000, 10], [20, 3_000_000_000]])
+        with self.assertRaises(ValueError):
+            _ = CAC(counts, dtype=np.float32)
+        with self.assertRaises(ValueError):
+            _ = BatchCAC(counts[np.newaxis], dtype=np.float32)
+        cac = CAC(counts)
+        self.assertEqual(6_000_000_030, cac.n)
+        self.assertGreater(cac.cohen()["est"]["coefficient_value"], 0.99)
+
+    def test_dtype_exception(self):
+        with self.assertRaises(ValueError):
+            _ = CAC(table_cont3x3abstractors(), dtype=np.int64)
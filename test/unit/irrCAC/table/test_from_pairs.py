@@ -0,0 +1,46 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from irrCAC.datasets import raw_4raters
+from irrCAC.table import CAC
+
+
+class TestFromPairs(TestCase):
+    def setUp(self) -> None:
+        self.data = raw_4raters()
+
+    def test_crosstab(self):
+        rater1, rater2 = self.data["Rater1"], self.data["Rater2"]
+        expected = pd.crosstab(rater1, rater2)
+        cac = CAC.from_pairs(rater1, rater2, weights="quadratic")
+        np.testing.assert_array_equal(expected.values, cac.ratings.values)
+        self.assertListEqual(expected.index.to_list(), cac.ratings.index.to_list())
+        expected_gwet = CAC(expected, weights="quadratic").gwet()["est"]
+        self.assertEqual(
+            expected_gwet["coefficient_value"],
+            cac.gwet()["est"]["coefficient_value"],
+        )
+
+    def test_labels(self):
+        rater1 = ["a", "b", "", None, "c", "a"]
+        rater2 = ["a", "c", "b", "b", np.nan, "b"]
+        cac = CAC.from_pairs(rater1, rater2)
+        expected = [[1, 1, 0], [0, 0, 1], [0, 0, 0]]
+        np.testing.assert_array_equal(expected, cac.ratings.values)
+        self.assertListEqual(["a", "b", "c"], cac.ratings.index.to_list())
+        self.assertEqual(3, cac.n)
+
+    def test_categories(self):
+        cac = CAC.from_pairs([1, 2, 2], [1, 2, 1], categories=[1, 2, 3, 4])
+        self.assertEqual((4, 4), cac.ratings.shape)
+        self.assertEqual(1, cac.ratings.loc[2, 1])
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            _ = CAC.from_pairs([1, 2], [1, 2, 3])
+        with self.assertRaises(ValueError):
+            _ = CAC.from_pairs([1, 2, 3], [1, 2, 3], categories=[1, 2])
+        with self.assertRaises(ValueError):
+            _ = CAC.from_pairs([1, 2], [1, 2], categories=[1, 1, 2])
@@ -0,0 +1,33 @@
+from unittest import TestCase
+
+import numpy as np
+
+from irrCAC.datasets import table_cont3x3abstractors
+from irrCAC.table import CAC
+
+
+class TestMarginals(TestCase):
+    def setUp(self) -> None:
+        self.data = table_cont3x3abstractors()
+        self.cac = CAC(self.data, weights="quadratic")
+
+    def test_marginals(self):
+        np.testing.assert_allclose([0.13, 0.27, 0.6], self.cac.pk_dot)
+        np.testing.assert_allclose([0.13, 0.24, 0.63], self.cac.p_dot_l)
+        np.testing.assert_allclose([0.13, 0.255, 0.615], self.cac.pi_dot_k)
+        np.testing.assert_allclose(self.data.values / 100, self.cac.pkl)
+
+    def test_weighted_marginals(self):
+        weights = self.cac.weights_mat
+        np.testing.assert_allclose(weights.T @ self.cac.p_dot_l, self.cac.pb_dot_k)
+        np.testing.assert_allclose(weights.T @ self.cac.pk_dot, self.cac.pbl_dot)
+        np.testing.assert_allclose(
+            (self.cac.pb_dot_k + self.cac.pbl_dot) / 2, self.cac.pbk
+        )
+
+    def test_marginals_not_modified(self):
+        pk_dot = self.cac.pk_dot.copy()
+        for method in ("bp", "cohen", "gwet", "krippendorff", "pa2", "scott"):
+            getattr(self.cac, method)()
+        np.testing.assert_array_equal(pk_dot, self.cac.pk_dot)
+        self.assertEqual(0.9725, round(self.cac.pa, 5))
@@ -0,0 +1,46 @@
+from unittest import TestCase
+
+import numpy as np
+from scipy import stats
+
+from irrCAC.table import CAC
+
+
+class TestMonteCarlo(TestCase):
+    def setUp(self) -> None:
+        self.table = np.array([[8, 2], [3, 7]])
+
+    def test_hypergeometric(self):
+        # For 2x2 tables the agreement is twice the first cell plus a constant,
+        # which is hypergeometric given the marginals.
+        for table in [self.table, np.array([[3, 4], [5, 2]])]:
+            first = stats.hypergeom(table.sum(), table[:, 0].sum(), table[0].sum())
+            cells = np.arange(table[0].sum() + 1)
+            extreme = np.abs(cells - first.mean()) >= abs(table[0, 0] - first.mean())
+            expected = first.pmf(cells[extreme]).sum()
+            result = CAC(table).monte_carlo(draws=200000, seed=0)
+            self.assertAlmostEqual(expected, result, 2)
+
+    def test_weights(self):
+        table = np.array([[5, 1, 0], [1, 4, 1], [0, 2, 6]])
+        weighted = CAC(table, weights="quadratic").monte_carlo(draws=20000, seed=0)
+        self.assertLess(weighted, 0.01)
+        weights = np.ones((3, 3))
+        # All the tables have the same agreement.
+        self.assertEqual(1, CAC(table, weights=weights).monte_carlo(draws=100, seed=0))
+
+    def test_seed(self):
+        cac = CAC(self.table)
+        self.assertEqual(
+            cac.monte_carlo(draws=1000, seed=1), cac.monte_carlo(draws=1000, seed=1)
+        )
+        self.assertEqual(
+            cac.monte_carlo(draws=1000, seed=1, n_jobs=2),
+            cac.monte_carlo(draws=1000, seed=1, n_jobs=2),
+        )
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            _ = CAC(self.table / 3).monte_carlo(draws=10)
+        with self.assertRaises(ValueError):
+            _ = CAC(self.table).monte_carlo(draws=10, n_jobs=0)
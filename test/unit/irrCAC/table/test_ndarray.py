@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+import numpy as np
+
+from irrCAC.datasets import table_cont3x3abstractors
+from irrCAC.table import CAC
+
+METHODS = ["bp", "cohen", "gwet", "krippendorff", "pa2", "scott"]
+
+
+class TestNdarray(TestCase):
+    def setUp(self) -> None:
+        self.data = table_cont3x3abstractors()
+
+    def test_same_as_dataframe(self):
+        expected = CAC(self.data, weights="quadratic")
+        for table in [self.data.to_numpy(), self.data.to_numpy().tolist()]:
+            cac = CAC(table, weights="quadratic", categories=self.data.index.to_list())
+            for method in METHODS:
+                expected_result = getattr(expected, method)()
+                result = getattr(cac, method)()
+                self.assertEqual(expected_result["est"], result["est"])
+                self.assertEqual(expected_result["categories"], result["categories"])
+
+    def test_categories(self):
+        cac = CAC(self.data.to_numpy())
+        self.assertListEqual([1, 2, 3], cac.gwet()["categories"])
+        cac = CAC(self.data, categories=["a", "b", "c"])
+        self.assertListEqual(["a", "b", "c"], cac.gwet()["categories"])
+
+    def test_results(self):
+        cac = CAC(self.data.to_numpy())
+        first = cac.cohen()
+        first["est"]["coefficient_value"] = None
+        first["weights"][0, 0] = 0
+        second = cac.cohen()
+        self.assertIsInstance(second["est"]["coefficient_value"], np.float64)
+        self.assertIsInstance(second["est"]["confidence_interval"][0], np.float64)
+        self.assertEqual(1, second["weights"][0, 0])
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            _ = CAC(self.data.to_numpy()[:, :2])
+        with self.assertRaises(ValueError):
+            _ = CAC(np.ones(3))
+        with self.assertRaises(ValueError):
+            _ = CAC(self.data.to_numpy(), categories=["a", "b"])
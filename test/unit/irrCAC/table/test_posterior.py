@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from scipy import sparse
+
+from irrCAC.datasets import table_cont3x3abstractors
+from irrCAC.table import CAC
+
+METHODS = ["bp", "cohen", "gwet", "krippendorff", "pa2", "scott"]
+
+
+class TestPosterior(TestCase):
+    def setUp(self) -> None:
+        self.table = table_cont3x3abstractors().to_numpy()
+
+    def test_large_sample(self):
+        # With many subjects the posterior is close to the sampling distribution.
+        cac = CAC(self.table * 100, weights="quadratic")
+        for method in METHODS:
+            expected = getattr(cac, method)()["est"]
+            result = cac.posterior(method, draws=4000, seed=0)
+            self.assertEqual(expected["coefficient_name"], result["coefficient_name"])
+            self.assertAlmostEqual(
+                expected["coefficient_value"], result["quantiles"][0.5], 2
+            )
+            lcb, ucb = expected["confidence_interval"]
+            self.assertAlmostEqual(lcb, result["quantiles"][0.025], 2)
+            self.assertAlmostEqual(ucb, result["quantiles"][0.975], 2)
+
+    def test_seed(self):
+        cac = CAC(self.table)
+        first = cac.posterior(draws=1000, quantiles=[0.1, 0.9], seed=1)
+        second = cac.posterior(draws=1000, quantiles=[0.1, 0.9], seed=1, batch_size=300)
+        self.assertLess(first["quantiles"][0.1], first["quantiles"][0.9])
+        self.assertLess(first["quantiles"][0.9], 1)
+        self.assertEqual(first, second)
+        self.assertEqual(first, cac.posterior(draws=1000, quantiles=[0.1, 0.9], seed=1))
+        third = cac.posterior(draws=1000, quantiles=[0.1, 0.9], seed=2)
+        self.assertNotEqual(first["mean"], third["mean"])
+
+    def test_exceptions(self):
+        cac = CAC(self.table)
+        with self.assertRaises(ValueError):
+            _ = cac.posterior("fleiss")
+        with self.assertRaises(ValueError):
+            _ = cac.posterior(prior=0)
+        with self.assertRaises(ValueError):
+            _ = CAC(sparse.csr_array(self.table)).posterior()
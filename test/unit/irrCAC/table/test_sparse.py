@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from irrCAC.table import CAC
+
+METHODS = ["bp", "cohen", "gwet", "krippendorff", "pa2", "scott"]
+
+
+class TestSparse(TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.table = rng.integers(0, 20, size=(6, 6)) * (rng.uniform(size=(6, 6)) < 0.4)
+        self.table += np.diag(rng.integers(5, 30, size=6))
+
+    def test_same_as_dense(self):
+        dense = CAC(pd.DataFrame(self.table), digits=10)
+        for table in [sparse.csr_matrix(self.table), sparse.coo_array(self.table)]:
+            cac = CAC(table, digits=10)
+            for method in METHODS:
+                expected = getattr(dense, method)()["est"]
+                result = getattr(cac, method)()["est"]
+                for key in ["coefficient_value", "se", "pa", "pe"]:
+                    self.assertAlmostEqual(expected[key], result[key], 8, msg=method)
+
+    def test_duplicates(self):
+        rows, cols = np.nonzero(self.table)
+        data = self.table[rows, cols]
+        # Split every count in two entries of the same cell.
+        table = sparse.coo_array(
+            (
+                np.concatenate([data - data // 2, data // 2]),
+                (np.tile(rows, 2), np.tile(cols, 2)),
+            ),
+            shape=self.table.shape,
+        )
+        expected = CAC(pd.DataFrame(self.table)).gwet()["est"]
+        self.assertEqual(expected, CAC(table).gwet()["est"])
+
+    def test_large(self):
+        q = 20000
+        cells = np.arange(q)
+        table = sparse.coo_array(
+            (np.full(2 * q, 5), (np.tile(cells, 2), np.r_[cells, np.roll(cells, 1)])),
+            shape=(q, q),
+        )
+        cac = CAC(table)
+        self.assertAlmostEqual(0.5, cac.pa)
+        self.assertEqual((q, q), cac.cohen()["weights"].shape)
+        self.assertAlmostEqual(0.5, cac.cohen()["est"]["coefficient_value"], 4)
+
+    def test_weights(self):
+        result = CAC(sparse.csr_matrix(self.table)).cohen()
+        self.assertIsInstance(result["weights"], np.ndarray)
+        np.testing.assert_array_equal(np.eye(6), result["weights"])
+        self.assertFalse(result["weights"].flags.writeable)
+
+    def test_float32(self):
+        cac = CAC(sparse.csr_array(self.table), dtype=np.float32)
+        self.assertEqual(np.float32, cac.pkl.dtype)
+        self.assertEqual(np.int32, cac.counts.dtype)
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            _ = CAC(sparse.csr_array(self.table), weights="quadratic")
+        with self.assertRaises(ValueError):
+            _ = CAC(sparse.csr_array(self.table[:, :-1]))
@@ -0,0 +1,81 @@
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from irrCAC.datasets import table_cont3x3abstractors, table_cont4x4diagnosis
+from irrCAC.table import CAC
+
+
+def loop_variance(cac, method):
+    """The variance of a coefficient with the `sum1` term summed cell by cell."""
+    q, n, w = cac.q, cac.n, cac.weights_mat
+    pkl = cac.ratings.values / n
+    pa = np.sum(pkl * w)
+    pk_dot = pkl.sum(axis=1)
+    p_dot_l = pkl.sum(axis=0)
+    pi_k = (pk_dot + p_dot_l) / 2
+    pb_dot_k = (w * p_dot_l.reshape(-1, 1)).sum(axis=0)
+    pbl_dot = (w * pk_dot.reshape(-1, 1)).sum(axis=0)
+    pbk = (pb_dot_k + pbl_dot) / 2
+    tw = np.sum(w)
+    if method in ("bp", "pa2"):
+        pe = tw / q**2 if method == "bp" else 0
+        coeff = (pa - pe) / (1 - pe)
+    elif method == "cohen":
+        pe = np.sum(w * np.outer(pk_dot, p_dot_l))
+    elif method == "gwet":
+        pe = tw * np.sum(pi_k * (1 - pi_k)) / (q * (q - 1))
+    else:
+        pe = np.sum(w * np.outer(pi_k, pi_k))
+    coeff = (pa - pe) / (1 - pe)
+    sum1 = 0
+    for k in range(q):
+        for el in range(q):
+            if method in ("bp", "pa2"):
+                term = w[k, el]
+            elif method == "cohen":
+                term = w[k, el] - (1 - coeff) * (pb_dot_k[k] + pbl_dot[el])
+            elif method == "gwet":
+                term = w[k, el] - 2 * (1 - coeff) * tw * (
+                    1 - (pi_k[k] + pi_k[el]) / 2
+                ) / (q * (q - 1))
+            else:
+                term = w[k, el] - (1 - coeff) * (pbk[k] + pbk[el])
+            sum1 += pkl[k, el] * term**2
+    if method == "pa2":
+        return (sum1 - pa**2) / n
+    if method == "bp":
+        return (sum1 - pa**2) / (n * (1 - pe) ** 2)
+    return (sum1 - (pa - 2 * (1 - coeff) * pe) ** 2) / (n * (1 - pe) ** 2)
+
+
+class TestVariance(TestCase):
+    methods = ("bp", "cohen", "gwet", "krippendorff", "pa2", "scott")
+
+    def assert_equivalent(self, data, weights):
+        cac = CAC(data, weights=weights, digits=15)
+        for method in self.methods:
+            se = getattr(cac, method)()["est"]["se"]
+            expected = np.sqrt(loop_variance(cac, method))
+            self.assertTrue(np.isscalar(se), f"{method} se is not a scalar.")
+            self.assertAlmostEqual(expected, se, 12, f"Wrong {method} stderr.")
+
+    def test_cont3x3abstractors(self):
+        for weights in ("identity", "quadratic", "bipolar", "ratio"):
+            self.assert_equivalent(table_cont3x3abstractors(), weights)
+
+    def test_cont4x4diagnosis(self):
+        for weights in ("identity", "linear", "ordinal", "circular"):
+            self.assert_equivalent(table_cont4x4diagnosis(), weights)
+
+    def test_random_tables(self):
+        rng = np.random.default_rng(0)
+        for q in (2, 7, 20):
+            counts = rng.integers(0, 50, size=(q, q)) + np.diag(
+                rng.integers(50, 200, q)
+            )
+            asymmetric = rng.random((q, q))
+            np.fill_diagonal(asymmetric, 1)
+            for weights in ("identity", "quadratic", asymmetric):
+                self.assert_equivalent(pd.DataFrame(counts), weights)
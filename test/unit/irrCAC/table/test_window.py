@@ -0,0 +1,92 @@
+from unittest import TestCase
+
+import numpy as np
+
+from irrCAC.table import CAC, WindowAccumulator
+
+
+class TestWindowAccumulator(TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.categories = [1, 2, 3]
+        self.rater1 = rng.choice(self.categories, size=400)
+        self.rater2 = np.where(
+            rng.uniform(size=400) < 0.7,
+            self.rater1,
+            rng.choice(self.categories, size=400),
+        )
+
+    def test_window(self):
+        accumulator = WindowAccumulator(self.categories, window=50, digits=10)
+        for batch in np.array_split(np.arange(400), 13):
+            accumulator.update(self.rater1[batch], self.rater2[batch])
+            last = slice(max(batch[-1] + 1 - 50, 0), batch[-1] + 1)
+            cac = CAC.from_pairs(
+                self.rater1[last],
+                self.rater2[last],
+                categories=self.categories,
+                digits=10,
+            )
+            np.testing.assert_array_equal(cac.ratings.values, accumulator.counts)
+            self.assertAlmostEqual(
+                cac.cohen()["est"]["coefficient_value"],
+                accumulator.cohen()["est"]["coefficient_value"],
+            )
+
+    def test_large_batch(self):
+        accumulator = WindowAccumulator(self.categories, window=30)
+        accumulator.update(self.rater1[:10], self.rater2[:10])
+        accumulator.update(self.rater1[10:], self.rater2[10:])
+        cac = CAC.from_pairs(
+            self.rater1[-30:], self.rater2[-30:], categories=self.categories
+        )
+        np.testing.assert_array_equal(cac.ratings.values, accumulator.counts)
+        np.testing.assert_array_equal(cac.counts.sum(axis=1), accumulator.row_totals)
+
+    def test_missing(self):
+        accumulator = WindowAccumulator(self.categories, window=2)
+        accumulator.update([1, 2, None, 3], [1, 3, 2, np.nan])
+        np.testing.assert_array_equal(
+            [[1, 0, 0], [0, 0, 1], [0, 0, 0]], accumulator.counts
+        )
+
+    def test_decay(self):
+        accumulator = WindowAccumulator(self.categories, half_life=20)
+        for batch in np.array_split(np.arange(400), 9):
+            accumulator.update(self.rater1[batch], self.rater2[batch])
+        ages = np.arange(399, -1, -1)
+        weights = 0.5 ** (ages / 20)
+        expected = np.zeros((3, 3))
+        np.add.at(expected, (self.rater1 - 1, self.rater2 - 1), weights)
+        np.testing.assert_allclose(expected, accumulator.counts)
+        self.assertAlmostEqual(weights.sum(), accumulator.n)
+
+    def test_decay_renormalized(self):
+        # A half life of 0.25 pairs decays the stored totals every 128 pairs.
+        accumulator = WindowAccumulator(self.categories, half_life=0.25)
+        accumulator.update(self.rater1[:300], self.rater2[:300])
+        for batch in np.array_split(np.arange(300, 400), 20):
+            accumulator.update(self.rater1[batch], self.rater2[batch])
+        weights = 0.5 ** (np.arange(399, -1, -1) / 0.25)
+        expected = np.zeros((3, 3))
+        np.add.at(expected, (self.rater1 - 1, self.rater2 - 1), weights)
+        np.testing.assert_allclose(expected, accumulator.counts)
+        np.testing.assert_allclose(expected.sum(axis=0), accumulator.col_totals)
+        self.assertAlmostEqual(weights.sum(), accumulator.n)
+
+    def test_reset(self):
+        accumulator = WindowAccumulator(self.categories, window=10)
+        accumulator.update(self.rater1, self.rater2)
+        accumulator.reset()
+        accumulator.update(self.rater1[:3], self.rater2[:3])
+        self.assertEqual(3, accumulator.counts.sum())
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            _ = WindowAccumulator(self.categories)
+        with self.assertRaises(ValueError):
+            _ = WindowAccumulator(self.categories, window=10, half_life=5)
+        with self.assertRaises(ValueError):
+            _ = WindowAccumulator(self.categories, window=0)
+        with self.assertRaises(ValueError):
+            _ = WindowAccumulator(self.categories, half_life=-1)
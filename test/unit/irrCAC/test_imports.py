@@ -0,0 +1,51 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+
+def loaded_modules(code):
+    """The modules in ``sys.modules`` after running the code in a new process."""
+    script = f"import sys\n{code}\nprint(' '.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+class TestLazyImports(TestCase):
+    def test_package(self):
+        modules = loaded_modules("import irrCAC")
+        self.assertNotIn("irrCAC.raw", modules)
+        self.assertNotIn("numpy", modules)
+
+    def test_submodule_attribute(self):
+        modules = loaded_modules("import irrCAC\nirrCAC.table.CAC")
+        self.assertIn("irrCAC.table", modules)
+        self.assertNotIn("irrCAC.raw", modules)
+
+    def test_unknown_attribute(self):
+        import irrCAC
+
+        with self.assertRaises(AttributeError):
+            irrCAC.unknown
+
+    def test_raw_and_table_defer_scipy(self):
+        for module in ("irrCAC.raw", "irrCAC.table", "irrCAC.dist"):
+            with self.subTest(module=module):
+                modules = loaded_modules(f"import {module}")
+                self.assertNotIn("scipy.stats", modules)
+                self.assertNotIn("scipy.special", modules)
+                self.assertNotIn("scipy.sparse", modules)
+
+    def test_defer_pandas(self):
+        for module in ("irrCAC.weights", "irrCAC.profiling", "irrCAC.benchmark"):
+            with self.subTest(module=module):
+                self.assertNotIn("pandas", loaded_modules(f"import {module}"))
+
+    def test_scipy_on_first_use(self):
+        code = (
+            "from irrCAC.datasets import raw_4raters\n"
+            "from irrCAC.raw import CAC\n"
+            "CAC(raw_4raters()).gwet()"
+        )
+        self.assertIn("scipy.stats", loaded_modules(code))
@@ -4,7 +4,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from irrCAC.weights import Weights
+from irrCAC.weights import Taxonomy, Weights
 
 
 class Test(TestCase):
@@ -90,3 +90,176 @@ class Test(TestCase):
         w = Weights([0, 1, 2])
         with self.assertRaises(ValueError):
             _ = w["ratio"]
+
+    def test_register(self):
+        Weights.register("absolute", lambda k, el: 1 - abs(k - el) / 2)
+        self.addCleanup(Weights.unregister, "absolute")
+        expected_weights = np.array([[1.0, 0.5, 0.0], [0.5, 1.0, 0.5], [0.0, 0.5, 1.0]])
+        np.testing.assert_array_equal(expected_weights, self.weights["absolute"])
+        self.assertIn("absolute", Weights.schemes())
+
+    def test_register_decorator(self):
+        @Weights.register("match")
+        def match(k, el):
+            return (k == el).astype(float)
+
+        self.addCleanup(Weights.unregister, "match")
+        np.testing.assert_array_equal(np.eye(3), self.weights["match"])
+
+    def test_register_labels(self):
+        Weights.register("same_label", lambda k, el: k == el)
+        self.addCleanup(Weights.unregister, "same_label")
+        w = Weights(["a", "b", "a"])
+        self.assertEqual(1.0, w["same_label"][0, 2])
+
+    def test_register_cached(self):
+        calls = []
+
+        def constant(k, el):
+            calls.append(1)
+            return np.ones((k.size, el.size))
+
+        Weights.register("constant", constant)
+        self.addCleanup(Weights.unregister, "constant")
+        first = Weights([1, 2, 3])["constant"]
+        second = Weights([1, 2, 3])["constant"]
+        self.assertIs(first, second)
+        self.assertEqual(1, len(calls))
+        self.assertFalse(first.flags.writeable)
+
+    def test_cache_bytes(self):
+        Weights.register("constant", lambda k, el: np.ones((k.size, el.size)))
+        self.addCleanup(Weights.unregister, "constant")
+        limit = Weights._cache_bytes
+        self.addCleanup(setattr, Weights, "_cache_bytes", limit)
+        Weights._cache_bytes = 3 * 8 * 100**2
+        small = Weights(list(range(100)))["constant"]
+        self.assertIs(small, Weights(list(range(100)))["constant"])
+        # A matrix above the limit is not cached.
+        large = Weights(list(range(200)))["constant"]
+        self.assertIsNot(large, Weights(list(range(200)))["constant"])
+        # The least recently used matrices are removed to stay in the limit.
+        for start in range(1, 4):
+            _ = Weights(list(range(start, start + 100)))["constant"]
+        self.assertIsNot(small, Weights(list(range(100)))["constant"])
+        self.assertLessEqual(Weights._cache_used, Weights._cache_bytes)
+        self.assertEqual(
+            Weights._cache_used, sum(w.nbytes for w in Weights._cache.values())
+        )
+
+    def test_register_exceptions(self):
+        with self.assertRaises(ValueError):
+            Weights.register("linear", lambda k, el: k - el)
+        with self.assertRaises(ValueError):
+            Weights.register("not_callable", 1.0)
+        Weights.register("scalar", lambda k, el: 1.0)
+        self.addCleanup(Weights.unregister, "scalar")
+        with self.assertRaises(ValueError):
+            _ = self.weights["scalar"]
+
+    def test_register_cac(self):
+        from irrCAC.datasets import raw_4raters
+        from irrCAC.raw import CAC
+
+        Weights.register("quadratic_copy", lambda k, el: 1 - ((k - el) / 4) ** 2)
+        self.addCleanup(Weights.unregister, "quadratic_copy")
+        expected = CAC(raw_4raters(), weights="quadratic").gwet()["est"]
+        result = CAC(raw_4raters(), weights="quadratic_copy").gwet()["est"]
+        self.assertEqual(expected["coefficient_value"], result["coefficient_value"])
+
+    def test_float32(self):
+        w = Weights(self.categories, dtype=np.float32)
+        for scheme in Weights.schemes():
+            weights = w[scheme]
+            self.assertEqual(np.float32, weights.dtype)
+            np.testing.assert_allclose(self.weights[scheme], weights, atol=1e-6)
+
+    def test_dtype_exception(self):
+        with self.assertRaises(ValueError):
+            _ = Weights(self.categories, dtype=np.int32)
+
+
+class TestTaxonomy(TestCase):
+    def setUp(self) -> None:
+        self.parents = {
+            "animal": None,
+            "cat": "animal",
+            "lion": "cat",
+            "tiger": "cat",
+            "dog": "animal",
+            "wolf": "dog",
+            "plant": None,
+        }
+        self.taxonomy = Taxonomy(self.parents)
+
+    def naive_distance(self, parents, a, b):
+        def path(node):
+            nodes = [node]
+            while parents.get(nodes[-1]) is not None:
+                nodes.append(parents[nodes[-1]])
+            return nodes
+
+        path_a, path_b = path(a), path(b)
+        common = [node for node in path_a if node in path_b]
+        if not common:
+            return len(path_a) + len(path_b)
+        return path_a.index(common[0]) + path_b.index(common[0])
+
+    def test_lca(self):
+        lca = self.taxonomy.lca(
+            ["lion", "lion", "wolf", "cat"], ["tiger", "wolf", "dog", "cat"]
+        )
+        self.assertListEqual(["cat", "animal", "dog", "cat"], lca.tolist())
+        self.assertIsNone(self.taxonomy.lca("lion", "plant"))
+
+    def test_distance(self):
+        distance = self.taxonomy.distance("lion", ["lion", "tiger", "wolf", "plant"])
+        np.testing.assert_array_equal([0, 2, 4, 4], distance)
+
+    def test_distance_random_tree(self):
+        rng = np.random.default_rng(0)
+        parents = {0: None}
+        for node in range(1, 300):
+            parents[node] = None if node % 100 == 0 else int(rng.integers(0, node))
+        taxonomy = Taxonomy(parents)
+        nodes = list(parents)
+        expected = [[self.naive_distance(parents, a, b) for b in nodes] for a in nodes]
+        nodes = np.array(nodes)
+        distance = taxonomy.distance(nodes[:, np.newaxis], nodes[np.newaxis, :])
+        np.testing.assert_array_equal(expected, distance)
+        np.testing.assert_array_equal(expected, taxonomy.pairwise(nodes))
+
+    def test_weights(self):
+        weights = Weights(["lion", "tiger", "wolf"]).taxonomy(self.taxonomy)
+        expected_weights = np.array([[1.0, 0.5, 0.0], [0.5, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        np.testing.assert_array_equal(expected_weights, weights)
+        self.assertIs(
+            weights, Weights(["lion", "tiger", "wolf"]).taxonomy(self.taxonomy)
+        )
+        np.testing.assert_array_equal(
+            expected_weights, Weights(["lion", "tiger", "wolf"]).taxonomy(self.parents)
+        )
+
+    def test_register(self):
+        from irrCAC.raw import CAC
+
+        Weights.register("animals", self.taxonomy)
+        self.addCleanup(Weights.unregister, "animals")
+        ratings = pd.DataFrame(
+            {
+                "r1": ["lion", "tiger", "wolf", "dog", "lion"],
+                "r2": ["lion", "lion", "wolf", "wolf", "tiger"],
+            }
+        )
+        cac = CAC(ratings, weights="animals")
+        weights = Weights(cac.categories).taxonomy(self.taxonomy)
+        np.testing.assert_array_equal(weights, cac.weights_mat)
+        expected = CAC(ratings, weights=weights).gwet()["est"]
+        result = cac.gwet()["est"]
+        self.assertEqual(expected["coefficient_value"], result["coefficient_value"])
+
+    def test_exceptions(self):
+        with self.assertRaises(ValueError):
+            _ = Taxonomy({"a": "b", "b": "a"})
+        with self.assertRaises(ValueError):
+            _ = self.taxonomy.distance("lion", "bird")